@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Public-endpoint latency while logins are hammered.
+
+Measures GET latency of a public endpoint on an idle server, then again while
+several threads send logins concurrently. With bcrypt on the hashing pool the
+p99 of the public endpoint should stay close to the idle figure.
+
+    python bench_login_load.py --url http://localhost:8000 --email admin@example.com --password ...
+"""
+import argparse
+import statistics
+import threading
+import time
+
+import requests
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def measure(session: requests.Session, url: str, count: int) -> list:
+    samples = []
+    for _ in range(count):
+        started = time.perf_counter()
+        session.get(url, timeout=30)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+def hammer_logins(url: str, email: str, password: str, stop: threading.Event, outcomes: dict, lock: threading.Lock):
+    session = requests.Session()
+    while not stop.is_set():
+        try:
+            status_code = session.post(url, json={"email": email, "password": password}, timeout=30).status_code
+        except requests.RequestException:
+            status_code = "error"
+        with lock:
+            outcomes[status_code] = outcomes.get(status_code, 0) + 1
+
+def report(label: str, samples: list):
+    print(f"{label:<14} p50={statistics.median(samples):8.2f} ms  "
+          f"p99={percentile(samples, 99):8.2f} ms  max={max(samples):8.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Public latency under login load")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--endpoint", default="/api/")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--login-threads", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    public_url = f"{args.url}{args.endpoint}"
+    login_url = f"{args.url}/api/auth/login"
+    session = requests.Session()
+
+    measure(session, public_url, 20)  # warm up connections and caches
+    report("idle", measure(session, public_url, args.requests))
+
+    stop = threading.Event()
+    outcomes: dict = {}
+    lock = threading.Lock()
+    threads = [
+        threading.Thread(target=hammer_logins, args=(login_url, args.email, args.password, stop, outcomes, lock), daemon=True)
+        for _ in range(args.login_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(1)
+    try:
+        report("under logins", measure(session, public_url, args.requests))
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    print("login responses: " + ", ".join(f"{code}: {count}" for code, count in sorted(outcomes.items(), key=str)))
+
+if __name__ == "__main__":
+    main()
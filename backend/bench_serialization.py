@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Serialization micro-benchmark for the public list endpoints.
+
+Compares the default FastAPI path (validate against response_model, dump to
+JSON-compatible Python, json.dumps in JSONResponse) with the fast path used by
+server.py (cached TypeAdapter, validate once, dump straight to bytes).
+
+    python bench_serialization.py [--repeat 5]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent))
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'bench')
+
+from server import ContactMessage, Match, News, Player, serialize, type_adapter  # noqa: E402
+
+SIZES = (10, 100, 1000)
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+def make_news(i: int) -> dict:
+    content = "Матч прошёл в напряжённой борьбе. " * 40
+    return {
+        "id": str(uuid.uuid4()),
+        "title": f"Новость {i}",
+        "content": content,
+        "category": ("club", "academy", "partners")[i % 3],
+        "image_url": f"https://example.com/news/{i}.jpg",
+        "tags": ["матч", "клуб"],
+        "excerpt": content[:200],
+        "created_at": BASE_TIME + timedelta(hours=i),
+        "updated_at": BASE_TIME + timedelta(hours=i),
+    }
+
+def make_player(i: int) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "name": f"Игрок {i}",
+        "number": i % 99 + 1,
+        "position": ("goalkeeper", "defender", "midfielder", "forward")[i % 4],
+        "photo_url": f"https://example.com/players/{i}.jpg",
+        "biography": "Воспитанник академии клуба. " * 10,
+        "goals": i % 15,
+        "assists": i % 9,
+        "created_at": BASE_TIME + timedelta(hours=i),
+    }
+
+def make_match(i: int) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "date": (BASE_TIME + timedelta(days=i)).date().isoformat(),
+        "time": "15:00",
+        "opponent": f"Соперник {i}",
+        "tournament": "Первая лига",
+        "home_score": i % 4,
+        "away_score": i % 3,
+        "is_home": i % 2 == 0,
+        "status": "finished",
+        "broadcast_link": None,
+        "report_link": None,
+        "home_team_logo": "https://example.com/logo-home.png",
+        "away_team_logo": "https://example.com/logo-away.png",
+        "created_at": BASE_TIME + timedelta(hours=i),
+    }
+
+def make_contact(i: int) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "name": f"Болельщик {i}",
+        "email": f"fan{i}@example.com",
+        "subject": "Билеты",
+        "message": "Подскажите, когда начнётся продажа билетов? " * 5,
+        "read": i % 2 == 0,
+        "created_at": BASE_TIME + timedelta(hours=i),
+    }
+
+MODELS = {
+    "News": (News, make_news),
+    "Player": (Player, make_player),
+    "Match": (Match, make_match),
+    "ContactMessage": (ContactMessage, make_contact),
+}
+
+def default_path(tp, docs: list) -> bytes:
+    """What FastAPI does for response_model followed by JSONResponse.render"""
+    adapter = type_adapter(tp)
+    content = adapter.dump_python(adapter.validate_python(docs), mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+def fast_path(tp, docs: list) -> bytes:
+    return serialize(tp, docs)
+
+def best_time(func, repeat: int) -> float:
+    number = 5
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+def main():
+    parser = argparse.ArgumentParser(description="Serialization micro-benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'model':<16}{'docs':>6}{'default ms':>12}{'fast ms':>10}{'speedup':>9}")
+    for name, (model, factory) in MODELS.items():
+        tp = List[model]
+        for size in SIZES:
+            docs = [factory(i) for i in range(size)]
+            assert json.loads(default_path(tp, docs)) == json.loads(fast_path(tp, docs))
+            default = best_time(lambda: default_path(tp, docs), args.repeat)
+            fast = best_time(lambda: fast_path(tp, docs), args.repeat)
+            print(f"{name:<16}{size:>6}{default * 1000:>12.3f}{fast * 1000:>10.3f}{default / fast:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Offline benchmark of the standings parsing engines.
+
+Runs every engine in server.STANDINGS_PARSER_ENGINES over the HTML snapshots in
+fixtures/standings, checks they produce identical StandingsTeam rows and
+prints the time per parse.
+
+    python bench_standings_parser.py [--repeat 50]
+    python bench_standings_parser.py --capture   # save the live page as a new fixture
+"""
+import argparse
+import os
+import sys
+import timeit
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'bench')
+
+from server import SCRAPER_USER_AGENT, STANDINGS_PARSER_ENGINES, STANDINGS_URL  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "standings"
+
+def capture():
+    import requests
+
+    response = requests.get(STANDINGS_URL, headers={'User-Agent': SCRAPER_USER_AGENT}, timeout=30)
+    response.raise_for_status()
+    path = FIXTURES_DIR / f"standings_page_{datetime.now():%Y%m%d}.html"
+    path.write_bytes(response.content)
+    print(f"Saved {len(response.content)} bytes to {path}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Standings parser benchmark")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--capture", action="store_true", help="download the live page into the fixtures directory")
+    args = parser.parse_args()
+
+    if args.capture:
+        capture()
+        return
+
+    for fixture in sorted(FIXTURES_DIR.glob("*.html")):
+        content = fixture.read_bytes()
+        results = {name: engine(content) for name, engine in STANDINGS_PARSER_ENGINES.items()}
+        reference = results["bs4"]
+        for name, teams in results.items():
+            if teams != reference:
+                raise SystemExit(f"{fixture.name}: engine {name!r} disagrees with bs4")
+
+        print(f"{fixture.name} ({len(content) / 1024:.0f} KiB, {len(reference)} teams)")
+        for name, engine in STANDINGS_PARSER_ENGINES.items():
+            seconds = min(timeit.repeat(lambda: engine(content), number=1, repeat=args.repeat))
+            print(f"  {name:<8}{seconds * 1000:8.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Image decoding and resizing, run in server.py's process pool.
+
+Kept out of server.py so pool workers only import this module and Pillow,
+not the app, its Mongo client and its scrapers.
+"""
+import io
+import os
+
+SUPPORTED_FORMATS = {"JPEG", "PNG", "WEBP", "GIF"}
+
+def probe(content: bytes, max_pixels: int) -> dict:
+    """Decode an upload fully and return its format and size; ValueError if it is not a usable image"""
+    from PIL import Image, UnidentifiedImageError
+
+    Image.MAX_IMAGE_PIXELS = max_pixels
+    try:
+        with Image.open(io.BytesIO(content)) as image:
+            if image.format not in SUPPORTED_FORMATS:
+                raise ValueError(f"unsupported format {image.format}")
+            image.load()
+            width, height = exif_size(image)
+            return {"format": image.format.lower(), "width": width, "height": height}
+    except UnidentifiedImageError:
+        raise ValueError("unrecognized image data") from None
+    except (Image.DecompressionBombError, OSError) as e:
+        raise ValueError(str(e)) from None
+
+def exif_size(image) -> tuple:
+    """Displayed size, with width and height swapped for EXIF-rotated photos"""
+    if image.getexif().get(0x0112) in (5, 6, 7, 8):
+        return image.height, image.width
+    return image.size
+
+def render(source: str, target: str, max_size: int, image_format: str, quality: int, max_pixels: int) -> int:
+    """Fit the original into max_size x max_size (never upscaling) and write it atomically; returns bytes written"""
+    from PIL import Image, ImageOps
+
+    Image.MAX_IMAGE_PIXELS = max_pixels
+    with Image.open(source) as image:
+        image.draft("RGB", (max_size, max_size))  # JPEG: decode at a reduced scale when possible
+        image = ImageOps.exif_transpose(image)
+        has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+        if image_format == "JPEG" and has_alpha:
+            # No alpha in JPEG: flatten transparent logos onto white
+            rgba = image.convert("RGBA")
+            image = Image.new("RGB", rgba.size, (255, 255, 255))
+            image.paste(rgba, mask=rgba.getchannel("A"))
+        elif image.mode != ("RGBA" if has_alpha else "RGB"):
+            image = image.convert("RGBA" if has_alpha else "RGB")
+        image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+
+        options = {"quality": quality}
+        if image_format == "JPEG":
+            options.update(optimize=True, progressive=True)
+        else:
+            options.update(method=4)
+        tmp = f"{target}.{os.getpid()}.tmp"
+        image.save(tmp, image_format, **options)
+    os.replace(tmp, target)
+    return os.path.getsize(target)
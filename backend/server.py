@@ -1,27 +1,55 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+import time
+MODULE_IMPORT_STARTED = time.perf_counter()
+
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, File, Header, Query, Request, Response, UploadFile, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import FileResponse, StreamingResponse
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, IndexModel, InsertOne, ReplaceOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
 import os
+import re
+import math
+import socket
+import asyncio
 import logging
+import multiprocessing
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
-from typing import List, Optional
+from pydantic import BaseModel, Field, ConfigDict, EmailStr, TypeAdapter, ValidationError, create_model
+from typing import TYPE_CHECKING, Dict, Generic, List, Optional, TypeVar, Union
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import uuid
-from datetime import datetime, timezone, timedelta
+import base64
+import csv
+import io
+import hashlib
+import json
+from datetime import date, datetime, time as dt_time, timezone, timedelta
+from email.utils import format_datetime, parsedate_to_datetime
 import jwt
+import orjson
 from passlib.context import CryptContext
-import requests
-from bs4 import BeautifulSoup
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
+import random
+from html.parser import HTMLParser
+import imaging
+
+# Scraper, scheduler and analytics dependencies are imported where they are used
+# so a worker can start serving without loading them
+if TYPE_CHECKING:
+    import httpx
+    import pandas as pd
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, tz_aware=True)
 db = client[os.environ['DB_NAME']]
 
 # JWT Configuration
@@ -30,7 +58,13 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_HOURS = 24
 
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt releases the GIL, so a small thread pool keeps it off the event loop.
+# Hashes with fewer rounds than BCRYPT_ROUNDS are upgraded on the next login.
+BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', '12'))
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', '2'))
+PASSWORD_HASH_MAX_PENDING = int(os.environ.get('PASSWORD_HASH_MAX_PENDING', '16'))
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+password_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
 security = HTTPBearer()
 
 # Logging configuration
@@ -40,6 +74,81 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Standings scraper configuration
+STANDINGS_URL = "https://ffsr.ru/standings"
+SCRAPER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+SCRAPER_TIMEOUT_SECONDS = 10
+SCRAPER_MAX_ATTEMPTS = 3
+SCRAPER_BACKOFF_SECONDS = 1.0
+STANDINGS_PARSER_ENGINE = os.environ.get('STANDINGS_PARSER_ENGINE', 'stream')  # stream or bs4
+STANDINGS_KEYFRAME_INTERVAL = int(os.environ.get('STANDINGS_KEYFRAME_INTERVAL', '10'))  # full snapshot every N runs
+STANDINGS_TREND_DEFAULT_DAYS = 90
+STANDINGS_TREND_MAX_DAYS = 366
+STANDINGS_REFRESH_LEASE_SECONDS = 60  # longer than a full fetch with retries
+STANDINGS_REFRESH_WAIT_SECONDS = 3.0  # how long a request waits on another worker's refresh
+STANDINGS_REFRESH_COOLDOWN_SECONDS = 30  # no new on-demand scrape this soon after a failed one
+
+# Scheduler leader election: one worker holds the lease and runs the scheduled jobs
+SCHEDULER_LEASE_SECONDS = float(os.environ.get('SCHEDULER_LEASE_SECONDS', '30'))
+SCHEDULER_HEARTBEAT_SECONDS = float(os.environ.get('SCHEDULER_HEARTBEAT_SECONDS', '10'))
+JOB_LEASE_SECONDS = 120
+JOB_RUNS_RETENTION_DAYS = 90
+
+# Local league table computed from our own match results
+CLUB_NAME = os.environ.get('CLUB_NAME', 'Александрия')
+LOCAL_TABLE_STATUSES = ("finished", "live")  # live matches move the table as the score changes
+LOCAL_TABLE_FORM_LENGTH = 5
+
+# News search ranking (BM25) and field weights
+SEARCH_FIELD_WEIGHTS = {"title": 3, "tags": 2, "content": 1}
+SEARCH_BM25_K1 = 1.2
+SEARCH_BM25_B = 0.75
+RELATED_NEWS_LIMIT = 3
+
+# Autocomplete
+AUTOCOMPLETE_LIMIT = 10
+MIRROR_REFRESH_SECONDS = float(os.environ.get('MIRROR_REFRESH_SECONDS', '30'))  # pick up other workers' writes
+
+# NDJSON export / import
+EXPORT_BATCH_SIZE = 500
+IMPORT_BATCH_SIZE = 500
+IMPORT_MAX_ERRORS = 100  # per-line errors reported, the rest are only counted
+MATCH_BULK_MAX_ROWS = 1000
+
+# Uploaded images: originals on local disk, resized derivatives rendered on first request
+MEDIA_DIR = Path(os.environ.get('MEDIA_DIR', ROOT_DIR / 'media'))
+IMAGE_VARIANTS = {"thumb": 160, "card": 640, "full": 1600}  # longest side in pixels
+IMAGE_FORMATS = {"webp": ("WEBP", "image/webp", 80), "jpg": ("JPEG", "image/jpeg", 82)}  # Pillow format, type, quality
+IMAGE_MAX_UPLOAD_BYTES = int(os.environ.get('IMAGE_MAX_UPLOAD_BYTES', str(15 * 1024 * 1024)))
+IMAGE_MAX_PIXELS = 50_000_000  # refuse decompression bombs
+IMAGE_WORKERS = int(os.environ.get('IMAGE_WORKERS', '2'))
+IMAGE_CACHE_MAX_BYTES = int(os.environ.get('IMAGE_CACHE_MAX_BYTES', str(512 * 1024 * 1024)))  # derivatives only
+IMAGE_CACHE_EVICT_TO = 0.8  # evict down to this share of the cap
+IMAGE_TOUCH_SECONDS = 3600  # refresh a derivative's mtime (its LRU clock) at most this often
+IMAGE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Auth cache configuration
+AUTH_CACHE_MAX_ENTRIES = int(os.environ.get('AUTH_CACHE_MAX_ENTRIES', '1024'))
+AUTH_CACHE_TTL_SECONDS = float(os.environ.get('AUTH_CACHE_TTL_SECONDS', '300'))
+REVOCATION_REFRESH_SECONDS = float(os.environ.get('REVOCATION_REFRESH_SECONDS', '30'))
+
+# Response cache configuration
+RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', '512'))
+RESPONSE_CACHE_TTL_SECONDS = float(os.environ.get('RESPONSE_CACHE_TTL_SECONDS', '300'))
+# How long a worker trusts its copy of a collection version; bounds how stale ETags and
+# cached bodies can be after another worker writes
+VERSION_CACHE_TTL_SECONDS = float(os.environ.get('VERSION_CACHE_TTL_SECONDS', '1'))
+
+# Pagination
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# News excerpt length (characters) stored at write time for list cards
+NEWS_EXCERPT_LENGTH = 200
+
+# Home page aggregate
+HOME_NEWS_LIMIT = 3
+
 # Create the main app
 app = FastAPI()
 api_router = APIRouter(prefix="/api")
@@ -73,6 +182,8 @@ class News(BaseModel):
     category: str  # club, academy, partners
     image_url: Optional[str] = None
     tags: List[str] = []
+    excerpt: Optional[str] = None  # computed from content on write
+    version: int = 1
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
@@ -83,6 +194,9 @@ class NewsCreate(BaseModel):
     image_url: Optional[str] = None
     tags: List[str] = []
 
+class NewsUpdate(NewsCreate):
+    version: Optional[int] = None  # expected version for optimistic concurrency
+
 class Player(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -93,6 +207,7 @@ class Player(BaseModel):
     biography: Optional[str] = None
     goals: int = 0
     assists: int = 0
+    version: int = 1
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class PlayerCreate(BaseModel):
@@ -104,6 +219,9 @@ class PlayerCreate(BaseModel):
     goals: int = 0
     assists: int = 0
 
+class PlayerUpdate(PlayerCreate):
+    version: Optional[int] = None
+
 class Match(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -119,6 +237,7 @@ class Match(BaseModel):
     report_link: Optional[str] = None
     home_team_logo: Optional[str] = None
     away_team_logo: Optional[str] = None
+    version: int = 1
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class MatchCreate(BaseModel):
@@ -135,6 +254,9 @@ class MatchCreate(BaseModel):
     home_team_logo: Optional[str] = None
     away_team_logo: Optional[str] = None
 
+class MatchUpdate(MatchCreate):
+    version: Optional[int] = None
+
 class Settings(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str = "settings"
@@ -144,6 +266,7 @@ class Settings(BaseModel):
     contact_email: Optional[str] = None
     contact_phone: Optional[str] = None
     contact_address: Optional[str] = None
+    version: int = 1
 
 class SettingsUpdate(BaseModel):
     logo_url: Optional[str] = None
@@ -152,6 +275,7 @@ class SettingsUpdate(BaseModel):
     contact_email: Optional[str] = None
     contact_phone: Optional[str] = None
     contact_address: Optional[str] = None
+    version: Optional[int] = None
 
 # Contact Message Models
 class ContactMessage(BaseModel):
@@ -186,162 +310,1915 @@ class StandingsTeam(BaseModel):
 class StandingsData(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str = "standings_first_league"
+    league: str = "first_league"
     league_name: str
+    order: int = 0  # Position of the table on the source page
     teams: List[StandingsTeam]
     last_updated: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+class LeagueSummary(BaseModel):
+    league: str
+    league_name: str
+    teams_count: int
+    last_updated: datetime
+
+class StandingsSnapshot(BaseModel):
+    """One parse run of a league: every row on keyframes, only changed rows otherwise"""
+    league: str
+    league_name: str
+    taken_at: datetime
+    sequence: int
+    keyframe: bool
+    teams: List[StandingsTeam]
+    removed: List[str] = []
+
+class StandingsAsOf(BaseModel):
+    league: str
+    league_name: str
+    as_of: datetime
+    teams: List[StandingsTeam]
+
+class TrendPoint(BaseModel):
+    date: date
+    position: Optional[int] = None
+    points: Optional[int] = None
+    position_change: Optional[int] = None
+    points_change: Optional[int] = None
+
+class TeamTrend(BaseModel):
+    league: str
+    team: str
+    start: date
+    end: date
+    points: List[TrendPoint]
+    best_position: Optional[int] = None
+    worst_position: Optional[int] = None
+    points_gained: Optional[int] = None
+
+class LocalStandingsTeam(StandingsTeam):
+    form: List[str] = []  # W/D/L, oldest first
+
+class LocalStandingsData(BaseModel):
+    tournament: str
+    club: str
+    matches_counted: int
+    teams: List[LocalStandingsTeam]
+
+class StandingsCheck(BaseModel):
+    tournament: str
+    league: str
+    club: str
+    scraped_team: Optional[str] = None
+    local: Optional[StandingsTeam] = None
+    scraped: Optional[StandingsTeam] = None
+    differences: Dict[str, Dict[str, int]] = {}
+    unknown_opponents: List[str] = []
+    consistent: bool
+
+class ImportLineError(BaseModel):
+    line: int
+    error: str
+
+class ImportReport(BaseModel):
+    collection: str
+    mode: str
+    lines: int = 0
+    inserted: int = 0
+    upserted: int = 0
+    modified: int = 0
+    failed: int = 0
+    errors: List[ImportLineError] = []
+
+class BulkMatchRow(BaseModel):
+    row: int
+    action: str  # create, update, unchanged or error
+    id: Optional[str] = None
+    changes: Dict[str, Dict[str, Optional[Union[bool, int, str]]]] = {}  # field -> old/new on update
+    error: Optional[str] = None
+
+class BulkMatchReport(BaseModel):
+    dry_run: bool
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    rows: List[BulkMatchRow] = []
+
+# Uploaded Image Models
+class StoredImage(BaseModel):
+    id: str  # sha256 of the original bytes, so URLs change whenever the content does
+    format: str
+    width: int
+    height: int
+    size: int
+    filename: Optional[str] = None
+    uploaded_by: Optional[str] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class ImageUpload(StoredImage):
+    original_url: str
+    urls: Dict[str, Dict[str, str]]  # variant -> format -> URL
+
+# Scheduled Job Models
+class JobRun(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    job: str
+    trigger: str  # schedule or manual
+    worker: str
+    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: Optional[datetime] = None
+    duration_ms: Optional[int] = None
+    outcome: str = "running"  # running, success, unchanged or failed
+    rows_parsed: Optional[int] = None
+
+class SchedulerStatus(BaseModel):
+    worker: str
+    leader: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+    is_leader: bool
+    jobs: List[str]
+
+# Pagination Models
+T = TypeVar("T")
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+class SearchPage(Page[T], Generic[T]):
+    total: int
+    facets: Dict[str, int]  # tag -> number of matching articles
+
+# Home Page Models
+class NewsCard(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str
+    title: str
+    category: str
+    image_url: Optional[str] = None
+    excerpt: Optional[str] = None
+    created_at: datetime
+
+class HomeData(BaseModel):
+    settings: Settings
+    news: List[NewsCard]
+    next_match: Optional[Match] = None
+    last_match: Optional[Match] = None
+
+# Admin Dashboard Models
+class AdminStats(BaseModel):
+    news_total: int = 0
+    news_by_category: Dict[str, int] = {}
+    players_total: int = 0
+    players_by_position: Dict[str, int] = {}
+    matches_total: int = 0
+    matches_by_status: Dict[str, int] = {}
+    contact_messages_total: int = 0
+    contact_messages_unread: int = 0
+
+# Index definitions, reconciled by ensure_indexes() at startup.
+# Compound indexes end with id so keyset pagination is served by the index too.
+def id_index() -> IndexModel:
+    return IndexModel([("id", ASCENDING)], name="id_unique", unique=True)
+
+INDEXES = {
+    "users": [
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+    ],
+    "news": [
+        id_index(),
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)], name="created_at_id"),
+        IndexModel([("category", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)], name="category_created_at_id"),
+    ],
+    "players": [
+        id_index(),
+        IndexModel([("number", ASCENDING), ("id", ASCENDING)], name="number_id"),
+        IndexModel([("position", ASCENDING), ("number", ASCENDING), ("id", ASCENDING)], name="position_number_id"),
+    ],
+    "matches": [
+        id_index(),
+        IndexModel([("date", DESCENDING), ("id", DESCENDING)], name="date_id"),
+        IndexModel([("status", ASCENDING), ("date", DESCENDING), ("id", DESCENDING)], name="status_date_id"),
+    ],
+    "contact_messages": [
+        id_index(),
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)], name="created_at_id"),
+    ],
+    "settings": [id_index()],
+    "standings": [id_index(), IndexModel([("league", ASCENDING)], name="league", unique=True, sparse=True)],
+    "standings_history": [
+        IndexModel([("league", ASCENDING), ("taken_at", DESCENDING)], name="league_taken_at"),
+        IndexModel(
+            [("league", ASCENDING), ("taken_at", DESCENDING)],
+            name="league_keyframe_taken_at",
+            partialFilterExpression={"keyframe": True},
+        ),
+    ],
+    "scraper_state": [id_index()],
+    "collection_versions": [id_index()],
+    "leases": [id_index()],
+    "job_runs": [
+        id_index(),
+        IndexModel([("job", ASCENDING), ("started_at", DESCENDING)], name="job_started_at"),
+        IndexModel(
+            [("started_at", ASCENDING)],
+            name="started_at_ttl",
+            expireAfterSeconds=JOB_RUNS_RETENTION_DAYS * 24 * 3600,
+        ),
+    ],
+    "images": [id_index()],
+    "revoked_tokens": [
+        id_index(),
+        IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+    ],
+}
+
+# Partial Models (sparse fieldsets)
+def partial_model(model: type) -> type:
+    """Copy of a model with every field optional, used for ?fields= responses"""
+    fields = {name: (Optional[field.annotation], None) for name, field in model.model_fields.items()}
+    return create_model(f"{model.__name__}Partial", __config__=ConfigDict(extra="ignore"), **fields)
+
+NewsPartial = partial_model(News)
+PlayerPartial = partial_model(Player)
+MatchPartial = partial_model(Match)
+ContactMessagePartial = partial_model(ContactMessage)
+
 # Helper functions
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+_password_jobs_pending = 0
+
+async def run_password_job(func, *args):
+    """Run a bcrypt call on the hashing pool, failing fast with 503 when the queue is full"""
+    global _password_jobs_pending
+    if _password_jobs_pending >= PASSWORD_HASH_MAX_PENDING:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication is busy, please retry",
+            headers={"Retry-After": "1"}
+        )
+    _password_jobs_pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(password_executor, func, *args)
+    finally:
+        _password_jobs_pending -= 1
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+async def hash_password(password: str) -> str:
+    return await run_password_job(pwd_context.hash, password)
+
+async def verify_password(plain_password: str, hashed_password: str) -> tuple:
+    """Returns (valid, new_hash); new_hash is set when the stored hash should be upgraded"""
+    return await run_password_job(pwd_context.verify_and_update, plain_password, hashed_password)
 
 def create_access_token(data: dict) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS)
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    try:
-        token = credentials.credentials
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
+def token_id(token: str, claims: dict) -> str:
+    """Revocation key: the jti claim, or a digest for tokens issued before jti existed"""
+    return claims.get("jti") or hashlib.sha256(token.encode()).hexdigest()
+
+async def get_token_claims(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+    """Verified claims of the bearer token, cached until the token expires"""
+    token = credentials.credentials
+    claims = auth_cache.get("token", token=token)
+    if claims is None:
+        try:
+            claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except jwt.ExpiredSignatureError:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired")
+        except jwt.InvalidTokenError:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+        if claims.get("sub") is None:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-        return email
-    except jwt.ExpiredSignatureError:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired")
-    except jwt.InvalidTokenError:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+        remaining = claims["exp"] - time.time() if "exp" in claims else AUTH_CACHE_TTL_SECONDS
+        auth_cache.set("token", claims, ttl=min(AUTH_CACHE_TTL_SECONDS, remaining), token=token)
+    if token_id(token, claims) in revoked_tokens:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked")
+    return claims
 
+async def get_current_user(claims: dict = Depends(get_token_claims)):
+    return claims["sub"]
 
-# Standings parser
-async def parse_standings():
-    """Parse standings from ffsr.ru and save to database"""
-    try:
-        logger.info("Starting to parse standings from ffsr.ru")
-        url = "https://ffsr.ru/standings"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Response cache
+class ResponseCache:
+    """In-process LRU cache for public GET responses, keyed by route and query params.
+
+    Entries expire after ``ttl`` seconds. Public routes include the collection
+    version in their params, so a body is only reused under the version it was
+    read at and other workers catch up as soon as they see the new version.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(route: str, params: dict) -> tuple:
+        return (route, tuple(sorted((k, v) for k, v in params.items() if v is not None)))
+
+    def get(self, route: str, **params):
+        key = self._key(route, params)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, route: str, value, ttl: Optional[float] = None, **params):
+        key = self._key(route, params)
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, route: str, **params):
+        """Drop the route's entries whose params include the given ones (all of them when none are given)"""
+        wanted = set(self._key(route, params)[1])
+        keys = [key for key in self._entries if key[0] == route and wanted.issubset(key[1])]
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
         }
-        
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Find the table for "ПЕРВАЯ лига"
-        teams_data = []
-        
-        # Try to find table by text containing "ПЕРВАЯ лига"
-        tables = soup.find_all('table')
-        target_table = None
-        
+
+response_cache = ResponseCache(RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_TTL_SECONDS)
+
+# Verified token claims and user profiles, same LRU/TTL semantics as the response cache
+auth_cache = ResponseCache(AUTH_CACHE_MAX_ENTRIES, AUTH_CACHE_TTL_SECONDS)
+
+# Token deny-list, mirrored from db.revoked_tokens and checked in memory
+revoked_tokens: set = set()
+
+async def refresh_revoked_tokens():
+    """Reload the deny-list so revocations made on other workers take effect"""
+    global revoked_tokens
+    now = datetime.now(timezone.utc)
+    docs = await db.revoked_tokens.find({"expires_at": {"$gt": now}}, {"_id": 0, "id": 1}).to_list(None)
+    revoked_tokens = {doc["id"] for doc in docs}
+
+# Background tasks started at startup, kept referenced until shutdown
+background_tasks: set = set()
+
+def start_background_task(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+async def revocation_refresh_loop():
+    while True:
+        await asyncio.sleep(REVOCATION_REFRESH_SECONDS)
+        try:
+            await refresh_revoked_tokens()
+        except Exception as e:
+            logger.error(f"Error refreshing revoked tokens: {str(e)}")
+
+
+# Short-lived Mongo leases so only one worker runs a given job at a time
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+async def acquire_lease(name: str, seconds: float, **fields) -> bool:
+    """Take or renew the lease; False if another worker holds an unexpired one"""
+    now = datetime.now(timezone.utc)
+    try:
+        await db.leases.find_one_and_update(
+            {"id": name, "$or": [{"owner": WORKER_ID}, {"expires_at": {"$lte": now}}]},
+            {"$set": {"owner": WORKER_ID, "expires_at": now + timedelta(seconds=seconds), **fields}},
+            upsert=True,
+        )
+        return True
+    except DuplicateKeyError:
+        # The upsert collided with a lease held by someone else
+        return False
+
+async def release_lease(name: str):
+    await db.leases.delete_one({"id": name, "owner": WORKER_ID})
+
+
+# Collection versions for conditional GET (ETag / Last-Modified)
+# Cached routes built from several collections, dropped whenever any of them changes
+DERIVED_ROUTES = {
+    "news": ("home", "admin_stats", "news_search", "news_related"),
+    "players": ("admin_stats",),
+    "matches": ("home", "admin_stats"),
+    "settings": ("home",),
+    "standings": ("standings_leagues", "standings_as_of", "standings_trend"),
+    "contact_messages": ("admin_stats",),
+}
+
+# Versions read in the last VERSION_CACHE_TTL_SECONDS, by collection name: (expires_at, version).
+# Kept apart from response_cache so lookups neither skew its hit ratio nor take its LRU slots.
+collection_versions: Dict[str, tuple] = {}
+
+def remember_collection_version(name: str, version: dict):
+    collection_versions[name] = (time.monotonic() + VERSION_CACHE_TTL_SECONDS, version)
+
+async def get_collection_version(name: str, cached: bool = True) -> dict:
+    """Current version counter and last-modified stamp of a collection"""
+    if cached:
+        entry = collection_versions.get(name)
+        if entry is not None and entry[0] >= time.monotonic():
+            return entry[1]
+    version = await db.collection_versions.find_one({"id": name}, {"_id": 0})
+    if not version:
+        version = await db.collection_versions.find_one_and_update(
+            {"id": name},
+            {"$setOnInsert": {"version": 0, "last_modified": datetime.now(timezone.utc)}},
+            projection={"_id": 0},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+    remember_collection_version(name, version)
+    return version
+
+async def bump_collection_version(name: str) -> dict:
+    """Called by write handlers so cached client copies are revalidated"""
+    version = await db.collection_versions.find_one_and_update(
+        {"id": name},
+        {"$inc": {"version": 1}, "$set": {"last_modified": datetime.now(timezone.utc)}},
+        projection={"_id": 0},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    remember_collection_version(name, version)
+    for route in DERIVED_ROUTES.get(name, ()):
+        response_cache.invalidate(route)
+    return version
+
+async def get_validators(*names: str) -> dict:
+    """Validators for a response built from one or more collections"""
+    versions = await asyncio.gather(*(get_collection_version(name) for name in names))
+    tag = "-".join(f"{name}{version['version']}" for name, version in zip(names, versions))
+    last_modified = max(version['last_modified'] for version in versions)
+    return {
+        "ETag": f'W/"{tag}"',
+        "Last-Modified": format_datetime(last_modified.astimezone(timezone.utc), usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+
+def is_not_modified(request: Request, validators: dict) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against the collection validators"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        if if_none_match.strip() == "*":
+            return True
+        etag = validators["ETag"].removeprefix("W/")
+        return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return parsedate_to_datetime(validators["Last-Modified"]) <= since
+    return False
+
+async def conditional_response(request: Request, response: Response, *names: str) -> Optional[Response]:
+    """Attach validators to the response; return a 304 if the client's copy is current"""
+    validators = await get_validators(*names)
+    response.headers.update(validators)
+    if is_not_modified(request, validators):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validators)
+    return None
+
+def response_version(response: Response) -> str:
+    """The ETag conditional_response attached, used as the version part of a cache key"""
+    return response.headers["etag"]
+
+def document_etag(doc: dict) -> str:
+    """Strong ETag of one document: its version, which If-Match on writes accepts back"""
+    return f'"{doc.get("version") or 1}"'
+
+def document_response(request: Request, response: Response, etag: str, body: bytes, validators: dict) -> Response:
+    """Detail routes cache on the collection validators but validate on the document's own ETag"""
+    headers = {**validators, "ETag": etag}
+    response.headers.update(headers)
+    if is_not_modified(request, headers):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return json_response(body, response)
+
+
+def make_excerpt(content: str, length: int = NEWS_EXCERPT_LENGTH) -> str:
+    text = " ".join(content.split())
+    if len(text) <= length:
+        return text
+    return text[:length].rsplit(" ", 1)[0].rstrip(",.;:-—") + "…"
+
+
+# Index management
+INDEX_OPTIONS = ("unique", "sparse", "expireAfterSeconds", "partialFilterExpression")
+
+def _index_signature(spec: dict) -> dict:
+    """Key and the options that change an index's behaviour, comparable between the
+    declared IndexModel document and index_information() output"""
+    key = spec["key"].items() if isinstance(spec["key"], dict) else spec["key"]
+    signature = {"key": [(field, int(direction)) for field, direction in key]}
+    for option in INDEX_OPTIONS:
+        value = spec.get(option)
+        if option in ("unique", "sparse"):
+            value = bool(value)
+        elif option == "partialFilterExpression" and value is not None:
+            value = dict(value)
+        signature[option] = value
+    return signature
+
+async def ensure_collection_indexes(collection_name: str, indexes: list):
+    collection = db[collection_name]
+    existing = await collection.index_information()
+    declared_names = set()
+    for index in indexes:
+        spec = index.document
+        name = spec["name"]
+        declared_names.add(name)
+        current = existing.get(name)
+        if current is None:
+            try:
+                await collection.create_indexes([index])
+                logger.info(f"Created index {collection_name}.{name}")
+            except OperationFailure as e:
+                logger.error(f"Could not build index {collection_name}.{name}: {str(e)}")
+            continue
+        wanted, found = _index_signature(spec), _index_signature(current)
+        drift = {option: (found[option], wanted[option]) for option in wanted if found[option] != wanted[option]}
+        if drift:
+            details = "; ".join(f"{option} is {old!r}, declared {new!r}" for option, (old, new) in drift.items())
+            logger.warning(f"Index drift on {collection_name}.{name}: {details}. Rebuild it in a migration")
+    unknown = set(existing) - declared_names - {"_id_"}
+    if unknown:
+        logger.warning(f"Undeclared indexes on {collection_name}: {', '.join(sorted(unknown))}")
+
+async def ensure_indexes():
+    """Create missing indexes and report drifted or unknown ones, all collections at once.
+
+    A drifted index is only logged: dropping it here would leave a unique constraint
+    missing while every worker rebuilds it at once, and lose it for good if the data
+    no longer satisfies it. Rebuild it in a migration.
+    """
+    await asyncio.gather(*(
+        ensure_collection_indexes(collection_name, indexes) for collection_name, indexes in INDEXES.items()
+    ))
+
+# Optimistic concurrency
+def expected_version(if_match: Optional[str], body_version: Optional[int]) -> Optional[int]:
+    """Version the client based its edit on: the document ETag echoed in If-Match, else the body"""
+    if if_match and if_match.strip() != "*":
+        tag = if_match.strip()
+        # If-Match compares strongly, so a weak collection ETag from a list route never matches
+        if tag.startswith("W/") or not tag.strip('"').isdigit():
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="If-Match must be the document ETag from its detail route"
+            )
+        return int(tag.strip('"'))
+    return body_version
+
+def version_filter(doc_id: str, expected: Optional[int]) -> dict:
+    query = {"id": doc_id}
+    if expected is not None:
+        # Documents written before versioning count as version 1
+        query["version"] = {"$in": [1, None]} if expected == 1 else expected
+    return query
+
+def versioned_update(data: dict) -> list:
+    """Update pipeline that sets data verbatim and bumps version in the same write"""
+    fields = {key: {"$literal": value} for key, value in data.items()}
+    fields["version"] = {"$add": [{"$ifNull": ["$version", 1]}, 1]}
+    return [{"$set": fields}]
+
+async def write_failure(collection, doc_id: str, expected: Optional[int], not_found: str) -> HTTPException:
+    """404 if the document is gone, 409 if it exists but moved past the expected version"""
+    if expected is not None and await collection.count_documents({"id": doc_id}, limit=1):
+        return HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Document was modified by someone else")
+    return HTTPException(status_code=404, detail=not_found)
+
+
+# Sparse fieldsets
+def parse_fields(fields: Optional[str], model: type) -> Optional[List[str]]:
+    """Validate a comma-separated ?fields= value; id is always included"""
+    if not fields:
+        return None
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in model.model_fields]
+    if unknown:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown fields: {', '.join(unknown)}")
+    return ["id"] + [name for name in requested if name != "id"]
+
+def fields_projection(selected: Optional[List[str]], sort_field: str) -> dict:
+    """Mongo projection for the selected fields; the sort key is kept for cursors"""
+    if not selected:
+        return {"_id": 0}
+    projection = {"_id": 0, sort_field: 1}
+    for name in selected:
+        projection[name] = 1
+    return projection
+
+def serialize_partial(model: type, docs: List[dict], selected: List[str]) -> List[dict]:
+    include = set(selected)
+    return [model.model_validate(doc).model_dump(mode="json", include=include) for doc in docs]
+
+
+# Fast JSON response path
+class ORJSONBytesResponse(Response):
+    """JSON response that passes pre-serialized bytes through and renders anything else with orjson"""
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return orjson.dumps(content)
+
+_type_adapters: dict = {}
+
+def type_adapter(tp) -> TypeAdapter:
+    adapter = _type_adapters.get(tp)
+    if adapter is None:
+        adapter = _type_adapters[tp] = TypeAdapter(tp)
+    return adapter
+
+def serialize(tp, data) -> bytes:
+    """Validate once and dump straight to JSON bytes, matching what response_model would emit"""
+    adapter = type_adapter(tp)
+    return adapter.dump_json(adapter.validate_python(data))
+
+def json_response(body, response: Response) -> ORJSONBytesResponse:
+    """Returning a Response skips FastAPI's second validation pass; the route's
+    response_model still documents the schema"""
+    return ORJSONBytesResponse(content=body, headers=dict(response.headers))
+
+
+# Cursor pagination
+def encode_cursor(doc: dict, sort_field: str) -> str:
+    value = doc.get(sort_field)
+    payload = {"id": doc["id"], "v": value}
+    if isinstance(value, datetime):
+        payload["v"] = value.isoformat()
+        payload["dt"] = True
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value = payload["v"]
+        if payload.get("dt"):
+            value = datetime.fromisoformat(value)
+        return value, payload["id"]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+def keyset_filter(sort_field: str, direction: int, cursor: str) -> dict:
+    """Filter selecting documents strictly after the cursor in (sort_field, id) order"""
+    value, last_id = decode_cursor(cursor)
+    op = "$gt" if direction == 1 else "$lt"
+    # MongoDB sorts missing/null values first ascending and last descending
+    if value is None:
+        same_value = {sort_field: None, "id": {op: last_id}}
+        if direction == 1:
+            return {"$or": [same_value, {sort_field: {"$ne": None}}]}
+        return same_value
+    conditions = [{sort_field: {op: value}}, {sort_field: value, "id": {op: last_id}}]
+    if direction == -1:
+        conditions.append({sort_field: None})
+    return {"$or": conditions}
+
+async def fetch_page(collection, query: dict, sort_field: str, direction: int,
+                     limit: Optional[int], after: Optional[str], projection: Optional[dict] = None) -> tuple:
+    """Fetch one keyset page; returns the documents and the cursor of the next page"""
+    limit = limit or DEFAULT_PAGE_SIZE
+    if after:
+        keyset = keyset_filter(sort_field, direction, after)
+        query = {"$and": [query, keyset]} if query else keyset
+    docs = await collection.find(query, projection or {"_id": 0}).sort(
+        [(sort_field, direction), ("id", direction)]
+    ).limit(limit + 1).to_list(limit + 1)
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        next_cursor = encode_cursor(docs[-1], sort_field)
+    return docs, next_cursor
+
+
+# Standings scraper
+_http_client: Optional["httpx.AsyncClient"] = None
+
+def get_http_client() -> "httpx.AsyncClient":
+    """Shared client so scraper runs reuse pooled connections"""
+    global _http_client
+    if _http_client is None:
+        import httpx
+        _http_client = httpx.AsyncClient(
+            headers={'User-Agent': SCRAPER_USER_AGENT},
+            timeout=httpx.Timeout(SCRAPER_TIMEOUT_SECONDS),
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=2),
+            follow_redirects=True
+        )
+    return _http_client
+
+async def fetch_with_retry(url: str, headers: dict) -> "httpx.Response":
+    """GET with exponential backoff and full jitter on transport errors and 5xx responses"""
+    import httpx
+    client = get_http_client()
+    for attempt in range(1, SCRAPER_MAX_ATTEMPTS + 1):
+        try:
+            response = await client.get(url, headers=headers)
+            if response.status_code < 500:
+                return response
+            error = f"HTTP {response.status_code}"
+        except httpx.TransportError as e:
+            error = f"{type(e).__name__}: {str(e)}"
+        if attempt == SCRAPER_MAX_ATTEMPTS:
+            raise RuntimeError(f"Fetching {url} failed after {attempt} attempts: {error}")
+        delay = random.uniform(0, SCRAPER_BACKOFF_SECONDS * 2 ** (attempt - 1))
+        logger.warning(f"Fetching {url} failed ({error}), retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+async def fetch_standings_page(force: bool = False) -> Optional[tuple]:
+    """Download the standings page; returns (content, scraper state) or None if unchanged"""
+    state = await db.scraper_state.find_one({"id": "standings"}, {"_id": 0}) or {}
+    headers = {}
+    if not force:
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+
+    response = await fetch_with_retry(STANDINGS_URL, headers)
+    if response.status_code == status.HTTP_304_NOT_MODIFIED:
+        logger.info("Standings page not modified since last fetch")
+        return None
+    response.raise_for_status()
+
+    content = response.content
+    content_hash = hashlib.sha256(content).hexdigest()
+    new_state = {
+        "id": "standings",
+        "etag": response.headers.get("etag"),
+        "last_modified": response.headers.get("last-modified"),
+        "content_hash": content_hash,
+        "fetched_at": datetime.now(timezone.utc),
+    }
+    if not force and content_hash == state.get("content_hash"):
+        logger.info("Standings page content unchanged, skipping parse")
+        await db.scraper_state.update_one({"id": "standings"}, {"$set": new_state}, upsert=True)
+        return None
+    return content, new_state
+
+def is_first_league(label: str) -> bool:
+    return 'ПЕРВАЯ' in label and 'лига' in label
+
+def row_to_team(idx: int, cells: List[str]) -> Optional[StandingsTeam]:
+    """Build a StandingsTeam from the stripped cell texts of one table row"""
+    if len(cells) < 9:
+        return None
+    try:
+        # Parsing columns: Position, Team, Games, Wins, Draws, Losses, GF, GA, Points
+        # Column structure: ['#', 'Команда', 'Мматчей', 'Ввыиграно', 'Нничей', 'Ппроиграно', 'Забзабито', 'Проппропущено', 'Очки']
+        team = cells[1]
+        if not team or team.startswith('#'):  # Only add if team name exists and is not header
+            return None
+        goals_for = int(cells[6])
+        goals_against = int(cells[7])
+        return StandingsTeam(
+            position=int(cells[0]) if cells[0].isdigit() else idx + 1,
+            team=team,
+            games=int(cells[2]),
+            wins=int(cells[3]),
+            draws=int(cells[4]),
+            losses=int(cells[5]),
+            goals_for=goals_for,
+            goals_against=goals_against,
+            goal_difference=goals_for - goals_against,
+            points=int(cells[8])
+        )
+    except ValueError as e:
+        logger.warning(f"Error parsing row {idx}: {e}")
+        return None
+
+def rows_to_teams(rows: List[List[str]]) -> List[StandingsTeam]:
+    teams = (row_to_team(idx, cells) for idx, cells in enumerate(rows))
+    return [team for team in teams if team is not None]
+
+def parse_standings_html_bs4(content: bytes) -> List[StandingsTeam]:
+    """Reference engine: BeautifulSoup tree, header looked up among the 5 preceding tags"""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(content, 'html.parser')
+    tables = soup.find_all('table')
+    target_table = None
+    
+    for table in tables:
+        # Look for header containing "ПЕРВАЯ лига"
+        current = table
+        # Enclosing <section>/<main> precede the table too, but their text is the whole page
+        enclosing = {id(parent) for parent in table.parents}
+        for _ in range(5):  # Check 5 elements before table
+            current = current.find_previous()
+            if current and id(current) in enclosing:
+                continue
+            if current and hasattr(current, 'get_text') and is_first_league(current.get_text(strip=True)):
+                target_table = table
+                break
+        if target_table:
+            break
+    
+    if not target_table:
+        # Fallback: try finding table with standings data structure
+        logger.warning("Could not find table by header, trying alternative methods")
         for table in tables:
-            # Look for header containing "ПЕРВАЯ лига"
-            prev_elements = []
-            current = table
-            for _ in range(5):  # Check 5 elements before table
-                current = current.find_previous()
-                if current and hasattr(current, 'get_text'):
-                    text = current.get_text(strip=True)
-                    if 'ПЕРВАЯ' in text and 'лига' in text:
-                        target_table = table
-                        break
-            if target_table:
+            if len(table.find_all('th')) >= 8:  # Typical standings table has many columns
+                target_table = table
                 break
+    
+    if not target_table:
+        return []
+    rows = target_table.find_all('tr')[1:]  # Skip header row
+    return rows_to_teams([[col.get_text(strip=True) for col in row.find_all(['td', 'th'])] for row in rows])
+
+
+class _StopTokenizing(Exception):
+    pass
+
+# Tags that end a run of text outside tables; anything else (<span>, <b>, <a>) is inline
+LABEL_BLOCK_TAGS = {
+    'p', 'div', 'section', 'article', 'header', 'footer', 'main', 'nav', 'aside', 'br', 'hr',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'li', 'dl', 'dt', 'dd', 'blockquote',
+}
+
+class StandingsTokenizer(HTMLParser):
+    """Single pass over the page collecting each top-level table with the text label
+    that precedes it (or its <caption>), without building a document tree"""
+
+    def __init__(self, stop_when=None):
+        super().__init__(convert_charrefs=True)
+        self.stop_when = stop_when
+        self.tables: List[dict] = []
+        # Text of the last few blocks before a table, like the 5 elements bs4 looks back at
+        self._blocks = deque(maxlen=5)
+        self._text: List[str] = []
+        self._depth = 0
+        self._table = None
+        self._row = None
+        self._cell = None
+        self._in_caption = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'table':
+            self._depth += 1
+            if self._depth == 1:
+                self._table = {"label": self._take_label(), "rows": [], "th_count": 0}
+            return
+        if self._depth == 0:
+            if tag in LABEL_BLOCK_TAGS:
+                self._close_block()
+            return
+        if self._depth != 1:
+            return
+        if tag == 'caption':
+            self._in_caption = True
+            self._table["label"] = ""
+        elif tag == 'tr':
+            self._close_row()
+            self._row = []
+        elif tag in ('td', 'th'):
+            self._close_cell()
+            if tag == 'th':
+                self._table["th_count"] += 1
+            if self._row is None:
+                self._row = []
+            self._cell = []
+
+    def handle_endtag(self, tag):
+        if tag == 'table':
+            self._depth -= 1
+            if self._depth == 0 and self._table is not None:
+                self._close_row()
+                table, self._table = self._table, None
+                self.tables.append(table)
+                if self.stop_when and self.stop_when(table):
+                    raise _StopTokenizing()
+            self._depth = max(self._depth, 0)
+            return
+        if self._depth == 0:
+            if tag in LABEL_BLOCK_TAGS:
+                self._close_block()
+            return
+        if self._depth != 1:
+            return
+        if tag == 'caption':
+            self._in_caption = False
+        elif tag == 'tr':
+            self._close_row()
+        elif tag in ('td', 'th'):
+            self._close_cell()
+
+    def handle_data(self, data):
+        if self._depth == 0:
+            # Inline tags (<span>, <b>) inside a heading keep adding to the same block
+            self._text.append(data)
+            return
+        text = data.strip()
+        if not text:
+            return
+        if self._depth == 1:
+            if self._cell is not None:
+                self._cell.append(text)
+            elif self._in_caption:
+                self._table["label"] += text
+
+    def _close_block(self):
+        text = " ".join("".join(self._text).split())
+        self._text = []
+        if text:
+            self._blocks.append(text)
+
+    def _take_label(self) -> str:
+        """The nearest block that names a league, else the nearest block; the blocks
+        before one table are not looked at again for the next"""
+        self._close_block()
+        blocks = list(self._blocks)
+        self._blocks.clear()
+        return next((text for text in reversed(blocks) if is_league_label(text)), blocks[-1] if blocks else "")
+
+    def _close_cell(self):
+        if self._cell is not None:
+            self._row.append("".join(self._cell))
+            self._cell = None
+
+    def _close_row(self):
+        self._close_cell()
+        if self._row is not None:
+            self._table["rows"].append(self._row)
+            self._row = None
+
+def decode_html(content: bytes) -> str:
+    try:
+        return content.decode('utf-8')
+    except UnicodeDecodeError:
+        return content.decode('cp1251', errors='replace')
+
+def tokenize_tables(content: bytes, stop_when=None) -> List[dict]:
+    tokenizer = StandingsTokenizer(stop_when=stop_when)
+    try:
+        tokenizer.feed(decode_html(content))
+        tokenizer.close()
+    except _StopTokenizing:
+        pass
+    return tokenizer.tables
+
+def parse_standings_html_stream(content: bytes) -> List[StandingsTeam]:
+    """Streaming engine: stops at the end of the first-league table"""
+    tables = tokenize_tables(content, stop_when=lambda table: is_first_league(table["label"]))
+    target_table = next((table for table in tables if is_first_league(table["label"])), None)
+    if not target_table:
+        logger.warning("Could not find table by header, trying alternative methods")
+        target_table = next((table for table in tables if table["th_count"] >= 8), None)
+    if not target_table:
+        return []
+    return rows_to_teams(target_table["rows"][1:])  # Skip header row
+
+STANDINGS_PARSER_ENGINES = {
+    "bs4": parse_standings_html_bs4,
+    "stream": parse_standings_html_stream,
+}
+
+def parse_standings_html(content: bytes, engine: Optional[str] = None) -> List[StandingsTeam]:
+    """Extract the "ПЕРВАЯ лига" table from the standings page"""
+    return STANDINGS_PARSER_ENGINES[engine or STANDINGS_PARSER_ENGINE](content)
+
+FIRST_LEAGUE_SLUG = "first_league"
+
+LEAGUE_ORDINALS = {
+    'ВЫСШАЯ': 'top',
+    'ПЕРВАЯ': 'first',
+    'ВТОРАЯ': 'second',
+    'ТРЕТЬЯ': 'third',
+}
+
+TRANSLIT = str.maketrans({
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'e', 'ж': 'zh', 'з': 'z',
+    'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm', 'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r',
+    'с': 's', 'т': 't', 'у': 'u', 'ф': 'f', 'х': 'h', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'sch',
+    'ъ': '', 'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya',
+})
+
+def is_league_label(label: str) -> bool:
+    return 'лига' in label.lower()
+
+def league_slug(label: str, taken=()) -> str:
+    """URL slug for a league header, e.g. "ПЕРВАЯ лига" -> "first_league".
+
+    When the slug is already taken (e.g. several "ПЕРВАЯ лига" group tables) the
+    transliterated full label is used, then a numeric suffix.
+    """
+    full = re.sub(r'[^a-z0-9]+', '_', label.lower().translate(TRANSLIT)).strip('_')
+    words = label.split()
+    slug = f"{LEAGUE_ORDINALS[words[0].upper()]}_league" if words and words[0].upper() in LEAGUE_ORDINALS else full
+    if slug in taken:
+        slug = full
+    base, suffix = slug, 2
+    while slug in taken:
+        slug = f"{base}_{suffix}"
+        suffix += 1
+    return slug
+
+def standings_doc_id(league: str) -> str:
+    return f"standings_{league}"
+
+def parse_league_tables(content: bytes, engine: Optional[str] = None) -> Dict[str, StandingsData]:
+    """Every league table on the standings page, keyed by league slug"""
+    leagues: Dict[str, StandingsData] = {}
+    for table in tokenize_tables(content):
+        label = " ".join(table["label"].split())
+        if not is_league_label(label):
+            continue
+        teams = rows_to_teams(table["rows"][1:])  # Skip header row
+        slug = league_slug(label, leagues)
+        if not slug or not teams:
+            continue
+        if slug != league_slug(label):
+            logger.warning(f"League slug {league_slug(label)!r} is already taken, serving {label!r} as {slug!r}")
+        leagues[slug] = StandingsData(
+            id=standings_doc_id(slug), league=slug, league_name=label, order=len(leagues), teams=teams
+        )
+    if not leagues:
+        # Keep the header-less fallback of the single-table parser for the first league;
+        # once any league is labelled its table must not be served a second time
+        teams = parse_standings_html(content, engine)
+        if teams:
+            leagues[FIRST_LEAGUE_SLUG] = StandingsData(league_name="ПЕРВАЯ лига", order=len(leagues), teams=teams)
+    return leagues
+
+async def parse_standings(force: bool = False) -> Optional[int]:
+    """Parse standings for every league from ffsr.ru and save to database.
+
+    Returns the number of team rows saved (0 if the page was unchanged), None on failure.
+    """
+    try:
+        logger.info("Starting to parse standings from ffsr.ru")
+        fetched = await fetch_standings_page(force=force)
+        if fetched is None:
+            return 0
+        content, scraper_state = fetched
         
-        if not target_table:
-            # Fallback: try to find by class or other attributes
-            logger.warning("Could not find table by header, trying alternative methods")
-            # Try finding table with standings data structure
-            for table in tables:
-                headers = table.find_all('th')
-                if len(headers) >= 8:  # Typical standings table has many columns
-                    target_table = table
-                    break
-        
-        if target_table:
-            rows = target_table.find_all('tr')[1:]  # Skip header row
-            
-            for idx, row in enumerate(rows):
-                cols = row.find_all(['td', 'th'])
-                if len(cols) >= 9:  # Changed from 10 to 9
-                    try:
-                        # Parsing columns: Position, Team, Games, Wins, Draws, Losses, GF, GA, Points
-                        # Column structure: ['#', 'Команда', 'Мматчей', 'Ввыиграно', 'Нничей', 'Ппроиграно', 'Забзабито', 'Проппропущено', 'Очки']
-                        position = int(cols[0].get_text(strip=True)) if cols[0].get_text(strip=True).isdigit() else idx + 1
-                        team = cols[1].get_text(strip=True) if len(cols) > 1 else ""
-                        games = int(cols[2].get_text(strip=True)) if len(cols) > 2 else 0
-                        wins = int(cols[3].get_text(strip=True)) if len(cols) > 3 else 0
-                        draws = int(cols[4].get_text(strip=True)) if len(cols) > 4 else 0
-                        losses = int(cols[5].get_text(strip=True)) if len(cols) > 5 else 0
-                        goals_for = int(cols[6].get_text(strip=True)) if len(cols) > 6 else 0
-                        goals_against = int(cols[7].get_text(strip=True)) if len(cols) > 7 else 0
-                        goal_difference = goals_for - goals_against  # Calculate goal difference
-                        points = int(cols[8].get_text(strip=True)) if len(cols) > 8 else 0
-                        
-                        if team and not team.startswith('#'):  # Only add if team name exists and is not header
-                            teams_data.append(StandingsTeam(
-                                position=position,
-                                team=team,
-                                games=games,
-                                wins=wins,
-                                draws=draws,
-                                losses=losses,
-                                goals_for=goals_for,
-                                goals_against=goals_against,
-                                goal_difference=goal_difference,
-                                points=points
-                            ))
-                    except (ValueError, IndexError) as e:
-                        logger.warning(f"Error parsing row {idx}: {e}")
-                        continue
+        # Parsing is CPU-bound, keep it off the event loop
+        leagues = await asyncio.to_thread(parse_league_tables, content)
         
-        if teams_data:
-            # Save to database
-            standings = StandingsData(
-                league_name="ПЕРВАЯ лига",
-                teams=teams_data,
-                last_updated=datetime.now(timezone.utc)
-            )
+        if leagues:
+            # One round trip for all leagues
+            last_updated = datetime.now(timezone.utc)
+            snapshots = await build_standings_snapshots(leagues, last_updated)
+            await db.standings.bulk_write([
+                UpdateOne(
+                    {"id": standings.id},
+                    {"$set": {**standings.model_dump(), "last_updated": last_updated}},
+                    upsert=True
+                )
+                for standings in leagues.values()
+            ], ordered=False)
+            if snapshots:
+                await db.standings_history.insert_many([snapshot.model_dump() for snapshot in snapshots], ordered=False)
+            await db.scraper_state.update_one({"id": "standings"}, {"$set": scraper_state}, upsert=True)
             
-            doc = standings.model_dump()
-            doc['last_updated'] = doc['last_updated'].isoformat()
+            response_cache.invalidate("standings")
+            await bump_collection_version("standings")
+            logger.info("Successfully parsed and saved standings: " + ", ".join(
+                f"{slug} ({len(standings.teams)} teams)" for slug, standings in leagues.items()
+            ))
+            return sum(len(standings.teams) for standings in leagues.values())
+        logger.warning("No league tables found on the standings page")
+        return None
             
-            # Upsert standings data
-            await db.standings.update_one(
-                {"id": "standings_first_league"},
-                {"$set": doc},
-                upsert=True
+    except Exception as e:
+        logger.error(f"Error parsing standings: {str(e)}")
+        return None
+
+# Single-flight on-demand refresh: one task per process, one lease across workers
+standings_refresh_task: Optional[asyncio.Task] = None
+standings_refresh_failed_at: Optional[float] = None
+
+async def refresh_standings(wait: Optional[float] = STANDINGS_REFRESH_WAIT_SECONDS) -> bool:
+    """Scrape now unless a refresh is already running; concurrent callers share its result.
+
+    Gives up after `wait` seconds (None waits for the end); the refresh keeps running
+    in the background and later requests pick up its result.
+    """
+    global standings_refresh_task
+    if standings_refresh_failed_at and time.monotonic() - standings_refresh_failed_at < STANDINGS_REFRESH_COOLDOWN_SECONDS:
+        return False
+    if standings_refresh_task is None or standings_refresh_task.done():
+        standings_refresh_task = asyncio.create_task(run_standings_refresh())
+    try:
+        # Shielded so a timed out or cancelled request does not cancel the refresh other callers wait on
+        return await asyncio.wait_for(asyncio.shield(standings_refresh_task), wait)
+    except asyncio.TimeoutError:
+        return False
+
+async def run_standings_refresh() -> bool:
+    global standings_refresh_failed_at
+    try:
+        if not await acquire_lease("standings_refresh", STANDINGS_REFRESH_LEASE_SECONDS, failed=False):
+            return await wait_for_standings_refresh()
+        ok = await parse_standings(force=True) is not None
+        if ok:
+            standings_refresh_failed_at = None
+            await release_lease("standings_refresh")
+            return True
+    except Exception as e:
+        logger.error(f"Standings refresh failed: {str(e)}")
+    standings_refresh_failed_at = time.monotonic()
+    try:
+        # Keep the lease as a failure marker so other workers back off too
+        await acquire_lease("standings_refresh", STANDINGS_REFRESH_COOLDOWN_SECONDS, failed=True)
+    except Exception as e:
+        logger.error(f"Could not mark the standings refresh as failed: {str(e)}")
+    return False
+
+async def wait_for_standings_refresh() -> bool:
+    """Another worker holds the lease: poll briefly for its result instead of scraping again"""
+    deadline = time.monotonic() + STANDINGS_REFRESH_WAIT_SECONDS
+    while True:
+        if await db.standings.count_documents({}, limit=1):
+            return True
+        lease = await db.leases.find_one({"id": "standings_refresh"}, {"_id": 0, "failed": 1})
+        if lease is None or lease.get("failed") or time.monotonic() >= deadline:
+            return False
+        await asyncio.sleep(0.25)
+
+# Standings history
+async def build_standings_snapshots(leagues: Dict[str, StandingsData], taken_at: datetime) -> List[StandingsSnapshot]:
+    """Diff each freshly parsed league against the stored table.
+
+    Unchanged leagues produce no snapshot; every STANDINGS_KEYFRAME_INTERVAL-th
+    snapshot of a league (and the first one) stores the full table.
+    """
+    ids = [standings.id for standings in leagues.values()]
+    previous_docs, latest = await asyncio.gather(
+        db.standings.find({"id": {"$in": ids}}, {"_id": 0, "id": 1, "teams": 1}).to_list(len(ids)),
+        asyncio.gather(*(
+            db.standings_history.find_one({"league": slug}, {"_id": 0, "sequence": 1}, sort=[("taken_at", DESCENDING)])
+            for slug in leagues
+        )),
+    )
+    previous_tables = {doc["id"]: doc.get("teams", []) for doc in previous_docs}
+    snapshots = []
+    for (slug, standings), last in zip(leagues.items(), latest):
+        sequence = last["sequence"] + 1 if last else 0
+        current = [team.model_dump() for team in standings.teams]
+        previous = previous_tables.get(standings.id)
+        keyframe = last is None or previous is None or sequence % STANDINGS_KEYFRAME_INTERVAL == 0
+        if keyframe:
+            changed, removed = current, []
+        else:
+            previous_by_team = {row["team"]: row for row in previous}
+            changed = [row for row in current if previous_by_team.get(row["team"]) != row]
+            current_names = {row["team"] for row in current}
+            removed = [name for name in previous_by_team if name not in current_names]
+            if not changed and not removed:
+                continue
+        snapshots.append(StandingsSnapshot(
+            league=slug,
+            league_name=standings.league_name,
+            taken_at=taken_at,
+            sequence=sequence,
+            keyframe=keyframe,
+            teams=changed,
+            removed=removed,
+        ))
+    return snapshots
+
+def end_of_day(day: date) -> datetime:
+    return datetime.combine(day, dt_time.max, tzinfo=timezone.utc)
+
+async def latest_keyframe_time(league: str, at: datetime) -> Optional[datetime]:
+    keyframe = await db.standings_history.find_one(
+        {"league": league, "keyframe": True, "taken_at": {"$lte": at}},
+        {"_id": 0, "taken_at": 1},
+        sort=[("taken_at", DESCENDING)],
+    )
+    return keyframe["taken_at"] if keyframe else None
+
+async def standings_as_of(league: str, at: datetime) -> Optional[StandingsAsOf]:
+    """Rebuild a league table from the last keyframe before `at` plus the deltas after it"""
+    since = await latest_keyframe_time(league, at)
+    if since is None:
+        return None
+    snapshots = await db.standings_history.find(
+        {"league": league, "taken_at": {"$gte": since, "$lte": at}},
+        {"_id": 0},
+    ).sort("taken_at", ASCENDING).to_list(None)
+    table: Dict[str, dict] = {}
+    for snapshot in snapshots:
+        for name in snapshot.get("removed", []):
+            table.pop(name, None)
+        table.update((row["team"], row) for row in snapshot["teams"])
+    return StandingsAsOf(
+        league=league,
+        league_name=snapshots[-1]["league_name"],
+        as_of=snapshots[-1]["taken_at"],
+        teams=sorted(table.values(), key=lambda row: row["position"]),
+    )
+
+async def team_trend(league: str, team: str, start: date, end: date) -> Optional[TeamTrend]:
+    """Daily position/points series for one team, forward-filled between snapshots;
+    None if the league has no history at all"""
+    import numpy as np
+    import pandas as pd
+
+    range_end = end_of_day(end)
+    since = await latest_keyframe_time(league, datetime.combine(start, dt_time.min, tzinfo=timezone.utc))
+    if since is None:
+        if await db.standings_history.find_one({"league": league}, {"_id": 0, "taken_at": 1}) is None:
+            return None
+        since = datetime.combine(start, dt_time.min, tzinfo=timezone.utc)
+    # Only the snapshots that touch this team, and only its row from each. Keyframes
+    # are always read: one without the team means it left the table (removed is empty there)
+    snapshots = await db.standings_history.find(
+        {
+            "league": league,
+            "taken_at": {"$gte": since, "$lte": range_end},
+            "$or": [{"teams.team": team}, {"removed": team}, {"keyframe": True}],
+        },
+        {"_id": 0, "taken_at": 1, "teams": {"$elemMatch": {"team": team}}},
+    ).sort("taken_at", ASCENDING).to_list(None)
+
+    days = pd.date_range(start, end, freq="D")
+    frame = pd.DataFrame(
+        [
+            (snapshot["taken_at"], row["position"], row["points"]) if (row := (snapshot.get("teams") or [None])[0])
+            else (snapshot["taken_at"], np.nan, np.nan)
+            for snapshot in snapshots
+        ],
+        columns=["taken_at", "position", "points"],
+    ).astype({"position": "float64", "points": "float64"})
+    frame["present"] = frame["position"].notna().astype(float)
+    # Last value of each day, carried forward over days without a change;
+    # days after the team left the table (or before it appeared) stay empty
+    frame["day"] = pd.to_datetime(frame["taken_at"], utc=True).dt.tz_localize(None).dt.normalize()
+    daily = frame.groupby("day")[["position", "points", "present"]].last()
+    daily = daily.reindex(daily.index.union(days)).ffill().reindex(days)
+    daily.loc[daily["present"] != 1, ["position", "points"]] = np.nan
+    changes = daily[["position", "points"]].diff()
+    position = daily["position"].to_numpy()
+    points = daily["points"].to_numpy()
+    known = ~np.isnan(points)
+
+    def as_int(value) -> Optional[int]:
+        return None if pd.isna(value) else int(value)
+
+    return TeamTrend(
+        league=league,
+        team=team,
+        start=start,
+        end=end,
+        points=[
+            TrendPoint(
+                date=day.date(),
+                position=as_int(row.position),
+                points=as_int(row.points),
+                position_change=as_int(change.position),
+                points_change=as_int(change.points),
             )
-            
-            logger.info(f"Successfully parsed and saved {len(teams_data)} teams to standings")
+            for day, row, change in zip(days, daily.itertuples(), changes.itertuples())
+        ],
+        best_position=as_int(np.nanmin(position)) if known.any() else None,
+        worst_position=as_int(np.nanmax(position)) if known.any() else None,
+        points_gained=as_int(points[known][-1] - points[known][0]) if known.any() else None,
+    )
+
+# In-process structures derived from a collection
+class CollectionMirror(ABC):
+    """Derived data kept in memory and patched by this worker's write handlers.
+
+    Each write handler bumps the collection version and passes the new version
+    to record_write. If another worker has written in the meantime, the version
+    no longer follows on from ours, and the next read rebuilds everything.
+    """
+    collection: str = ""
+
+    def __init__(self):
+        self.version: Optional[int] = None
+        self._lock = asyncio.Lock()
+
+    @abstractmethod
+    async def rebuild(self):
+        """Recompute everything from the collection"""
+
+    @abstractmethod
+    def apply(self, doc_id: str, doc: Optional[dict]):
+        """Replace what one document contributes (doc is None when it was deleted)"""
+
+    async def ensure_current(self, cached: bool = True):
+        version = (await get_collection_version(self.collection, cached=cached))["version"]
+        if version == self.version:
+            return
+        async with self._lock:
+            if version != self.version:
+                await self.rebuild()
+                self.version = version
+
+    async def record_write(self, doc_id: str, doc: Optional[dict], version: dict):
+        await self.record_writes([(doc_id, doc)], version)
+
+    async def record_writes(self, changes: List[tuple], version: dict):
+        """(doc id, doc or None) pairs written under a single version bump"""
+        async with self._lock:
+            if self.version is None or self.version == version["version"]:
+                return  # Not loaded yet, or a rebuild already picked the write up
+            if self.version == version["version"] - 1:
+                for doc_id, doc in changes:
+                    self.apply(doc_id, doc)
+                self.version = version["version"]
+            else:
+                self.version = None
+
+# Local standings from match results
+STAT_COLUMNS = ["games", "wins", "draws", "losses", "goals_for", "goals_against", "points"]
+
+def normalize_team_name(name: str) -> str:
+    return " ".join(name.casefold().replace('ё', 'е').split())
+
+def match_result(match: dict) -> Optional[dict]:
+    """Our goals and theirs for a match that counts towards the table, else None"""
+    if match.get("status") not in LOCAL_TABLE_STATUSES or not match.get("tournament"):
+        return None
+    if match.get("home_score") is None or match.get("away_score") is None:
+        return None
+    home, away = match["home_score"], match["away_score"]
+    return {
+        "tournament": match["tournament"],
+        "opponent": match["opponent"],
+        "date": f"{match.get('date', '')} {match.get('time', '')}",
+        "goals_for": home if match.get("is_home", True) else away,
+        "goals_against": away if match.get("is_home", True) else home,
+    }
+
+def result_rows(result: dict):
+    """STAT_COLUMNS rows for (club, opponent) contributed by one result"""
+    import numpy as np
+
+    ours, theirs = result["goals_for"], result["goals_against"]
+    outcome = (ours > theirs) - (ours < theirs)
+    club = [1, outcome == 1, outcome == 0, outcome == -1, ours, theirs, 3 if outcome == 1 else int(outcome == 0)]
+    opponent = [1, outcome == -1, outcome == 0, outcome == 1, theirs, ours, 3 if outcome == -1 else int(outcome == 0)]
+    return np.array([club, opponent], dtype=np.int64)
+
+class LocalStandings(CollectionMirror):
+    """Per-tournament tables built from our finished matches.
+
+    Loaded from the matches collection in one vectorized pass, then patched
+    per match by the match write handlers.
+    """
+    collection = "matches"
+
+    def __init__(self):
+        super().__init__()
+        self.results: Dict[str, dict] = {}  # match id -> result
+        self.tables: Dict[str, "pd.DataFrame"] = {}  # tournament -> STAT_COLUMNS indexed by team
+
+    async def rebuild(self):
+        matches = await db.matches.find(
+            {"status": {"$in": list(LOCAL_TABLE_STATUSES)}},
+            {"_id": 0, "id": 1, "date": 1, "time": 1, "opponent": 1, "tournament": 1,
+             "home_score": 1, "away_score": 1, "is_home": 1, "status": 1},
+        ).to_list(None)
+        results = {}
+        for match in matches:
+            result = match_result(match)
+            if result:
+                results[match["id"]] = result
+        self.results = results
+        self.tables = self.build_tables(list(results.values()))
+        logger.info(f"Local standings rebuilt from {len(results)} results in {len(self.tables)} tournaments")
+
+    @staticmethod
+    def build_tables(results: List[dict]) -> Dict[str, "pd.DataFrame"]:
+        import numpy as np
+        import pandas as pd
+
+        if not results:
+            return {}
+        frame = pd.DataFrame(results)
+        ours = frame["goals_for"].to_numpy()
+        theirs = frame["goals_against"].to_numpy()
+        outcome = np.sign(ours - theirs)
+        ones = np.ones(len(frame), dtype=np.int64)
+
+        def side(team, sign, goals_for, goals_against):
+            won, drawn, lost = outcome == sign, outcome == 0, outcome == -sign
+            return pd.DataFrame({
+                "tournament": frame["tournament"], "team": team, "games": ones,
+                "wins": won, "draws": drawn, "losses": lost,
+                "goals_for": goals_for, "goals_against": goals_against,
+                "points": 3 * won + drawn,
+            })
+
+        rows = pd.concat([side(CLUB_NAME, 1, ours, theirs), side(frame["opponent"], -1, theirs, ours)])
+        totals = rows.groupby(["tournament", "team"])[STAT_COLUMNS].sum().astype(np.int64)
+        return {tournament: table.droplevel("tournament") for tournament, table in totals.groupby(level="tournament")}
+
+    def _add(self, result: dict, sign: int):
+        import pandas as pd
+
+        tournament = result["tournament"]
+        teams = [CLUB_NAME, result["opponent"]]
+        table = self.tables.get(tournament)
+        if table is None:
+            table = pd.DataFrame(0, index=pd.Index([], name="team"), columns=STAT_COLUMNS, dtype="int64")
+        missing = [team for team in teams if team not in table.index]
+        if missing:
+            table = pd.concat([table, pd.DataFrame(0, index=pd.Index(missing, name="team"), columns=STAT_COLUMNS)])
+        table.loc[teams, STAT_COLUMNS] += sign * result_rows(result)
+        table = table[table["games"] > 0]
+        if table.empty:
+            self.tables.pop(tournament, None)
         else:
-            logger.warning("No teams data found in the parsed table")
-            
+            self.tables[tournament] = table
+
+    def apply(self, match_id: str, match: Optional[dict]):
+        previous = self.results.pop(match_id, None)
+        if previous:
+            self._add(previous, -1)
+        result = match_result(match) if match else None
+        if result:
+            self.results[match_id] = result
+            self._add(result, 1)
+
+    def form(self, tournament: str) -> Dict[str, List[str]]:
+        import pandas as pd
+
+        results = [result for result in self.results.values() if result["tournament"] == tournament]
+        if not results:
+            return {}
+        frame = pd.DataFrame(results).sort_values("date", kind="stable")
+        diff = frame["goals_for"] - frame["goals_against"]
+        letters = pd.Series("D", index=frame.index).mask(diff > 0, "W").mask(diff < 0, "L")
+        mirrored = letters.map({"W": "L", "D": "D", "L": "W"})
+        outcomes = pd.concat([
+            pd.DataFrame({"team": CLUB_NAME, "result": letters, "order": range(len(frame))}),
+            pd.DataFrame({"team": frame["opponent"], "result": mirrored, "order": range(len(frame))}),
+        ]).sort_values("order", kind="stable")
+        recent = outcomes.groupby("team").tail(LOCAL_TABLE_FORM_LENGTH)
+        return recent.groupby("team")["result"].agg(list).to_dict()
+
+    def table(self, tournament: str) -> Optional[LocalStandingsData]:
+        import numpy as np
+
+        table = self.tables.get(tournament)
+        if table is None:
+            return None
+        stats = table[STAT_COLUMNS].to_numpy()
+        names = table.index.to_numpy()
+        goal_difference = stats[:, 4] - stats[:, 5]
+        # Tie-breakers: points, wins, goal difference, goals scored, then name (lexsort: last key first)
+        order = np.lexsort((names, -stats[:, 4], -goal_difference, -stats[:, 1], -stats[:, 6]))
+        form = self.form(tournament)
+        return LocalStandingsData(
+            tournament=tournament,
+            club=CLUB_NAME,
+            matches_counted=int(table.loc[CLUB_NAME, "games"]) if CLUB_NAME in table.index else 0,
+            teams=[
+                LocalStandingsTeam(
+                    position=position,
+                    team=names[i],
+                    **dict(zip(STAT_COLUMNS, (int(value) for value in stats[i]))),
+                    goal_difference=int(goal_difference[i]),
+                    form=form.get(names[i], []),
+                )
+                for position, i in enumerate(order, start=1)
+            ],
+        )
+
+local_standings = LocalStandings()
+
+def cross_check_standings(local: LocalStandingsData, scraped: dict, league: str) -> StandingsCheck:
+    """Compare our club's locally computed row with the scraped table.
+
+    Opponent rows only contain games against us, so they are only checked for
+    being present in the scraped table (a mismatch usually means a typo).
+    """
+    scraped_by_name = {normalize_team_name(team["team"]): team for team in scraped.get("teams", [])}
+    club_key = normalize_team_name(CLUB_NAME)
+    scraped_club = scraped_by_name.get(club_key) or next(
+        (team for name, team in scraped_by_name.items() if club_key in name), None
+    )
+    local_club = next((team for team in local.teams if team.team == CLUB_NAME), None)
+    differences = {}
+    if local_club and scraped_club:
+        for column in STAT_COLUMNS + ["goal_difference"]:
+            local_value, scraped_value = getattr(local_club, column), scraped_club[column]
+            if local_value != scraped_value:
+                differences[column] = {"local": local_value, "scraped": scraped_value}
+    unknown = [
+        team.team for team in local.teams
+        if team.team != CLUB_NAME and normalize_team_name(team.team) not in scraped_by_name
+    ]
+    return StandingsCheck(
+        tournament=local.tournament,
+        league=league,
+        club=CLUB_NAME,
+        scraped_team=scraped_club["team"] if scraped_club else None,
+        local=StandingsTeam(**local_club.model_dump(exclude={"form"})) if local_club else None,
+        scraped=StandingsTeam(**scraped_club) if scraped_club else None,
+        differences=differences,
+        unknown_opponents=unknown,
+        consistent=bool(local_club and scraped_club and not differences and not unknown),
+    )
+
+# News search
+SEARCH_STOPWORDS = frozenset(
+    "и в во на с со по к о об от до за из у а но не что как это для при же ли то бы все его её их "
+    "the a an of and in on to for is are".split()
+)
+
+# Inflectional endings, longest first; stripped while at least 3 letters of stem remain
+RUSSIAN_ENDINGS = sorted((
+    "иями ями ами ого его ому ему ыми ими ией иям иях ость ости ах ях ов ев ей ий ый ой ая яя ое ее ые ие "
+    "ую юю ом ем ам им ым ых их ия ья ье ью ии ть ла ло ли ет ют ут ит ят ешь ишь а я о е ы и у ю ь й"
+).split(), key=len, reverse=True)
+
+def stem(word: str) -> str:
+    """Light suffix-stripping stemmer, enough to match Russian word forms"""
+    for ending in RUSSIAN_ENDINGS:
+        if word.endswith(ending) and len(word) - len(ending) >= 3:
+            return word[:-len(ending)]
+    if word.isascii() and len(word) > 4 and word.endswith("s"):
+        return word[:-1]
+    return word
+
+def search_terms(text: str) -> List[str]:
+    words = re.findall(r"[0-9a-zа-я]+", text.casefold().replace('ё', 'е'))
+    return [stem(word) for word in words if word not in SEARCH_STOPWORDS]
+
+class NewsSearchIndex(CollectionMirror):
+    """Inverted index over news title, content and tags, ranked with BM25"""
+    collection = "news"
+
+    def __init__(self):
+        super().__init__()
+        self.postings: Dict[str, Dict[str, int]] = {}  # term -> news id -> weighted frequency
+        self.lengths: Dict[str, int] = {}  # news id -> weighted term count
+        self.docs: Dict[str, dict] = {}  # news id -> terms, tags, category, created_at
+        self.tags: Dict[str, set] = {}  # tag -> news ids
+        self.total_length = 0
+
+    async def rebuild(self):
+        news = await db.news.find(
+            {}, {"_id": 0, "id": 1, "title": 1, "content": 1, "tags": 1, "category": 1, "created_at": 1}
+        ).to_list(None)
+        self.postings, self.lengths, self.docs, self.tags, self.total_length = {}, {}, {}, {}, 0
+        for doc in news:
+            self.add(doc)
+        logger.info(f"News search index rebuilt: {len(self.docs)} articles, {len(self.postings)} terms")
+
+    def add(self, doc: dict):
+        news_id = doc["id"]
+        frequencies: Dict[str, int] = {}
+        for field, weight in SEARCH_FIELD_WEIGHTS.items():
+            value = doc.get(field) or ""
+            text = " ".join(value) if isinstance(value, list) else value
+            for term in search_terms(text):
+                frequencies[term] = frequencies.get(term, 0) + weight
+        for term, frequency in frequencies.items():
+            self.postings.setdefault(term, {})[news_id] = frequency
+        length = sum(frequencies.values())
+        self.lengths[news_id] = length
+        self.total_length += length
+        tags = list(dict.fromkeys(doc.get("tags") or []))
+        self.docs[news_id] = {
+            "terms": list(frequencies), "tags": tags, "category": doc.get("category"), "created_at": doc.get("created_at"),
+        }
+        for tag in tags:
+            self.tags.setdefault(tag, set()).add(news_id)
+
+    def remove(self, news_id: str):
+        doc = self.docs.pop(news_id, None)
+        if doc is None:
+            return
+        # Only this article's own terms, not the whole vocabulary
+        for term in doc["terms"]:
+            del self.postings[term][news_id]
+            if not self.postings[term]:
+                del self.postings[term]
+        self.total_length -= self.lengths.pop(news_id)
+        for tag in doc["tags"]:
+            self.tags[tag].discard(news_id)
+            if not self.tags[tag]:
+                del self.tags[tag]
+
+    def apply(self, news_id: str, doc: Optional[dict]):
+        self.remove(news_id)
+        if doc:
+            self.add(doc)
+
+    def search(self, query: str, category: Optional[str] = None, tag: Optional[str] = None) -> List[tuple]:
+        """(score, news id) for every matching article, best first"""
+        terms = list(dict.fromkeys(search_terms(query)))
+        count = len(self.docs)
+        if not terms or not count:
+            return []
+        average_length = self.total_length / count or 1
+        scores: Dict[str, float] = {}
+        for term in terms:
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for news_id, frequency in postings.items():
+                norm = SEARCH_BM25_K1 * (1 - SEARCH_BM25_B + SEARCH_BM25_B * self.lengths[news_id] / average_length)
+                scores[news_id] = scores.get(news_id, 0.0) + idf * frequency * (SEARCH_BM25_K1 + 1) / (frequency + norm)
+        hits = [
+            (round(score, 6), news_id) for news_id, score in scores.items()
+            if (not category or self.docs[news_id]["category"] == category)
+            and (not tag or tag in self.docs[news_id]["tags"])
+        ]
+        hits.sort(key=lambda hit: (-hit[0], hit[1]))
+        return hits
+
+    def facets(self, news_ids: List[str]) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for news_id in news_ids:
+            for tag in self.docs[news_id]["tags"]:
+                counts[tag] = counts.get(tag, 0) + 1
+        return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+    def related(self, news_id: str, limit: int) -> List[str]:
+        """Articles sharing the most tags, then the same category, newest first"""
+        source = self.docs.get(news_id)
+        if source is None:
+            return []
+        shared: Dict[str, int] = {}
+        for tag in source["tags"]:
+            for other in self.tags.get(tag, ()):
+                if other != news_id:
+                    shared[other] = shared.get(other, 0) + 1
+        candidates = set(shared) | {
+            other for other, doc in self.docs.items()
+            if other != news_id and doc["category"] == source["category"]
+        }
+        oldest = datetime.min.replace(tzinfo=timezone.utc)
+        ranked = sorted(candidates, key=lambda other: (
+            shared.get(other, 0),
+            self.docs[other]["category"] == source["category"],
+            self.docs[other]["created_at"] or oldest,
+        ), reverse=True)
+        return ranked[:limit]
+
+news_index = NewsSearchIndex()
+
+def search_page(hits: List[tuple], limit: int, after: Optional[str]) -> tuple:
+    """One page of ranked (score, id) hits after a (score, id) cursor, and the next cursor"""
+    start = 0
+    if after:
+        score, last_id = decode_cursor(after)
+        start = next((i for i, hit in enumerate(hits) if (-hit[0], hit[1]) > (-score, last_id)), len(hits))
+    page = hits[start:start + limit]
+    next_cursor = None
+    if start + limit < len(hits):
+        last_score, last_id = page[-1]
+        next_cursor = encode_cursor({"id": last_id, "score": last_score}, "score")
+    return page, next_cursor
+
+# Autocomplete
+def normalize_prefix(text: str) -> str:
+    return " ".join(text.casefold().replace('ё', 'е').split())
+
+class TrieNode:
+    __slots__ = ("children", "values")
+
+    def __init__(self):
+        self.children: Dict[str, "TrieNode"] = {}
+        self.values: Dict[str, int] = {}  # display value -> number of documents using it
+
+class PrefixTrie:
+    """Values reachable by a prefix of the whole value or of any of its words"""
+
+    def __init__(self):
+        self.root = TrieNode()
+
+    @staticmethod
+    def keys(value: str) -> List[str]:
+        normalized = normalize_prefix(value)
+        words = normalized.split(" ")
+        return list(dict.fromkeys(" ".join(words[i:]) for i in range(len(words))))
+
+    def add(self, value: str):
+        for key in self.keys(value):
+            node = self.root
+            for char in key:
+                node = node.children.setdefault(char, TrieNode())
+            node.values[value] = node.values.get(value, 0) + 1
+
+    def remove(self, value: str):
+        for key in self.keys(value):
+            path = [self.root]
+            for char in key:
+                node = path[-1].children.get(char)
+                if node is None:
+                    break
+                path.append(node)
+            else:
+                node = path[-1]
+                node.values[value] -= 1
+                if not node.values[value]:
+                    del node.values[value]
+                # Prune branches left empty
+                for char, parent in zip(reversed(key), reversed(path[:-1])):
+                    child = parent.children[char]
+                    if child.values or child.children:
+                        break
+                    del parent.children[char]
+
+    def complete(self, prefix: str, limit: int) -> List[str]:
+        """Most used values first, then alphabetical"""
+        node = self.root
+        for char in normalize_prefix(prefix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        counts: Dict[str, int] = {}
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for value, count in node.values.items():
+                counts[value] = max(counts.get(value, 0), count)
+            stack.extend(node.children.values())
+        # Case variants of one value are one suggestion, shown in their most used spelling
+        merged: Dict[str, tuple] = {}  # normalized value -> (total uses, uses of display, display)
+        for value, count in counts.items():
+            key = normalize_prefix(value)
+            total, best, display = merged.get(key, (0, 0, value))
+            if count > best or (count == best and value < display):
+                best, display = count, value
+            merged[key] = (total + count, best, display)
+        ranked = sorted(merged.values(), key=lambda item: (-item[0], item[2]))
+        return [display for _, _, display in ranked[:limit]]
+
+class AutocompleteIndex(CollectionMirror):
+    """One trie per autocomplete type, fed from fields of one collection"""
+
+    def __init__(self, collection: str, fields: Dict[str, str]):
+        super().__init__()
+        self.collection = collection
+        self.fields = fields  # autocomplete type -> document field
+        self.tries = {kind: PrefixTrie() for kind in fields}
+        self.entries: Dict[str, Dict[str, str]] = {}  # document id -> type -> value
+
+    async def rebuild(self):
+        projection = {"_id": 0, "id": 1, **{field: 1 for field in self.fields.values()}}
+        docs = await db[self.collection].find({}, projection).to_list(None)
+        self.tries = {kind: PrefixTrie() for kind in self.fields}
+        self.entries = {}
+        for doc in docs:
+            self.apply(doc["id"], doc)
+
+    def apply(self, doc_id: str, doc: Optional[dict]):
+        for kind, value in self.entries.pop(doc_id, {}).items():
+            self.tries[kind].remove(value)
+        if doc:
+            entry = {kind: doc[field].strip() for kind, field in self.fields.items() if (doc.get(field) or "").strip()}
+            for kind, value in entry.items():
+                self.tries[kind].add(value)
+            self.entries[doc_id] = entry
+
+player_autocomplete = AutocompleteIndex("players", {"player": "name"})
+match_autocomplete = AutocompleteIndex("matches", {"opponent": "opponent", "tournament": "tournament"})
+
+AUTOCOMPLETE_INDEXES = {
+    "player": player_autocomplete,
+    "opponent": match_autocomplete,
+    "tournament": match_autocomplete,
+}
+
+async def mirror_refresh_loop():
+    """Rebuild the autocomplete indexes when another worker changed their collections"""
+    while True:
+        for index in (player_autocomplete, match_autocomplete):
+            try:
+                # Read the version straight from the DB so the interval alone bounds how stale the tries are
+                await index.ensure_current(cached=False)
+            except Exception as e:
+                logger.error(f"Error refreshing {index.collection} autocomplete: {str(e)}")
+        await asyncio.sleep(MIRROR_REFRESH_SECONDS)
+
+# Scheduler for daily standings update, created on first use
+scheduler = None
+
+# Jobs the scheduler (or an admin) can run, by id
+JOBS = {
+    "standings_update": parse_standings,
+}
+
+scheduler_leader = False
+running_jobs: set = set()
+
+async def run_job(name: str, trigger: str, **kwargs) -> Optional[JobRun]:
+    """Run a job under its own lease and record the run; None if it is already running"""
+    # Leases are re-entrant for their owner, so guard against a second run in this process too
+    if name in running_jobs:
+        return None
+    running_jobs.add(name)
+    try:
+        if not await acquire_lease(f"job:{name}", JOB_LEASE_SECONDS):
+            logger.info(f"Job {name} is already running on another worker, skipping")
+            return None
+        return await record_job_run(name, trigger, **kwargs)
+    finally:
+        running_jobs.discard(name)
+
+async def record_job_run(name: str, trigger: str, **kwargs) -> JobRun:
+    run = JobRun(job=name, trigger=trigger, worker=WORKER_ID)
+    await db.job_runs.insert_one(run.model_dump())
+    started = time.perf_counter()
+    try:
+        rows = await JOBS[name](**kwargs)
     except Exception as e:
-        logger.error(f"Error parsing standings: {str(e)}")
+        logger.error(f"Job {name} failed: {str(e)}")
+        rows = None
+    finally:
+        await release_lease(f"job:{name}")
+    run.finished_at = datetime.now(timezone.utc)
+    run.duration_ms = int((time.perf_counter() - started) * 1000)
+    run.rows_parsed = rows
+    run.outcome = "failed" if rows is None else "success" if rows else "unchanged"
+    await db.job_runs.update_one({"id": run.id}, {"$set": run.model_dump(exclude={"id"})})
+    logger.info(f"Job {name} ({trigger}) finished: {run.outcome} in {run.duration_ms} ms")
+    return run
 
-# Scheduler for daily standings update
-scheduler = AsyncIOScheduler()
+async def run_scheduled_job(name: str):
+    # The scheduler is paused on followers; this guards the moment leadership is lost
+    if scheduler_leader:
+        await run_job(name, "schedule")
 
 def schedule_standings_update():
-    """Schedule standings update once per day at 3 AM"""
+    """Schedule standings update once per day at 3 AM; starts paused until this worker is leader"""
+    global scheduler
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+    scheduler = AsyncIOScheduler()
     scheduler.add_job(
-        parse_standings,
+        run_scheduled_job,
         'cron',
+        args=["standings_update"],
         hour=3,
         minute=0,
         id='standings_update',
         replace_existing=True
     )
-    scheduler.start()
+    scheduler.start(paused=True)
     logger.info("Scheduled daily standings update at 3:00 AM")
 
+async def scheduler_leader_loop():
+    """Heartbeat the scheduler lease; take over when the leader's lease expires"""
+    global scheduler_leader
+    while True:
+        try:
+            leader = await acquire_lease("scheduler", SCHEDULER_LEASE_SECONDS, heartbeat_at=datetime.now(timezone.utc))
+        except Exception as e:
+            # Without a confirmed lease we must assume someone else may lead
+            logger.error(f"Error renewing scheduler lease: {str(e)}")
+            leader = False
+        if leader and not scheduler_leader:
+            scheduler.resume()
+            logger.info(f"Worker {WORKER_ID} is now the scheduler leader")
+        elif not leader and scheduler_leader:
+            scheduler.pause()
+            logger.info(f"Worker {WORKER_ID} lost the scheduler lease")
+        scheduler_leader = leader
+        await asyncio.sleep(SCHEDULER_HEARTBEAT_SECONDS)
+
 # Basic endpoint
 @api_router.get("/")
 async def root():
@@ -351,8 +2228,14 @@ async def root():
 @api_router.post("/auth/login", response_model=Token)
 async def login(user_login: UserLogin):
     user = await db.users.find_one({"email": user_login.email}, {"_id": 0})
-    if not user or not verify_password(user_login.password, user["password_hash"]):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect email or password")
+    valid, new_hash = await verify_password(user_login.password, user["password_hash"])
+    if not valid:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect email or password")
+    if new_hash:
+        await db.users.update_one({"email": user["email"]}, {"$set": {"password_hash": new_hash}})
+        logger.info(f"Upgraded password hash for {user['email']}")
     
     access_token = create_access_token(data={"sub": user["email"]})
     return {"access_token": access_token, "token_type": "bearer"}
@@ -365,186 +2248,533 @@ async def register(user_create: UserCreate, current_user: str = Depends(get_curr
     
     user = User(
         email=user_create.email,
-        password_hash=hash_password(user_create.password)
+        password_hash=await hash_password(user_create.password)
     )
     doc = user.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
     await db.users.insert_one(doc)
+    auth_cache.invalidate("user", email=user.email)
     return user
 
 @api_router.get("/auth/me")
 async def get_me(current_user: str = Depends(get_current_user)):
-    user = await db.users.find_one({"email": current_user}, {"_id": 0, "password_hash": 0})
+    user = auth_cache.get("user", email=current_user)
+    if user is None:
+        user = await db.users.find_one({"email": current_user}, {"_id": 0, "password_hash": 0})
+        if user:
+            auth_cache.set("user", user, email=current_user)
     return user
 
+@api_router.post("/auth/logout")
+async def logout(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(get_token_claims),
+):
+    """Revoke the bearer token until it would have expired"""
+    jti = token_id(credentials.credentials, claims)
+    expires_at = datetime.fromtimestamp(
+        claims.get("exp", time.time() + ACCESS_TOKEN_EXPIRE_HOURS * 3600), tz=timezone.utc
+    )
+    await db.revoked_tokens.update_one(
+        {"id": jti},
+        {"$set": {"id": jti, "sub": claims["sub"], "expires_at": expires_at}},
+        upsert=True
+    )
+    revoked_tokens.add(jti)
+    auth_cache.invalidate("token", token=credentials.credentials)
+    return {"message": "Logged out"}
+
 # News endpoints
-@api_router.get("/news", response_model=List[News])
-async def get_news(category: Optional[str] = None):
+@api_router.get("/news", response_model=Union[List[News], Page[News], List[NewsPartial], Page[NewsPartial]])
+async def get_news(
+    request: Request,
+    response: Response,
+    category: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    fields: Optional[str] = None,
+):
+    """List news, newest first; passing limit/after switches to cursor pagination"""
+    not_modified = await conditional_response(request, response, "news")
+    if not_modified:
+        return not_modified
+    selected = parse_fields(fields, News)
+    cache_params = dict(version=response_version(response), category=category, limit=limit, after=after, fields=",".join(selected) if selected else None)
+    cached = response_cache.get("news", **cache_params)
+    if cached is not None:
+        return json_response(cached, response)
+    projection = fields_projection(selected, "created_at")
     query = {"category": category} if category else {}
-    news_list = await db.news.find(query, {"_id": 0}).sort("created_at", -1).to_list(1000)
-    for news in news_list:
-        if isinstance(news.get('created_at'), str):
-            news['created_at'] = datetime.fromisoformat(news['created_at'])
-        if isinstance(news.get('updated_at'), str):
-            news['updated_at'] = datetime.fromisoformat(news['updated_at'])
-    return news_list
+    paginated = limit is not None or after is not None
+    if paginated:
+        news_list, next_cursor = await fetch_page(db.news, query, "created_at", -1, limit, after, projection)
+    else:
+        news_list = await db.news.find(query, projection).sort("created_at", -1).to_list(1000)
+    if selected:
+        news_list = serialize_partial(NewsPartial, news_list, selected)
+        result = {"items": news_list, "next_cursor": next_cursor} if paginated else news_list
+        body = orjson.dumps(result)
+    elif paginated:
+        body = serialize(Page[News], {"items": news_list, "next_cursor": next_cursor})
+    else:
+        body = serialize(List[News], news_list)
+    response_cache.set("news", body, **cache_params)
+    return json_response(body, response)
 
-@api_router.get("/news/{news_id}", response_model=News)
-async def get_news_by_id(news_id: str):
-    news = await db.news.find_one({"id": news_id}, {"_id": 0})
-    if not news:
+@api_router.get("/news/search", response_model=Union[SearchPage[News], SearchPage[NewsPartial]])
+async def search_news(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    category: Optional[str] = None,
+    tag: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    fields: Optional[str] = None,
+):
+    """Ranked search over title, content and tags with tag facet counts"""
+    not_modified = await conditional_response(request, response, "news")
+    if not_modified:
+        return not_modified
+    selected = parse_fields(fields, News)
+    cache_params = dict(version=response_version(response), q=q, category=category, tag=tag, limit=limit, after=after,
+                        fields=",".join(selected) if selected else None)
+    cached = response_cache.get("news_search", **cache_params)
+    if cached is not None:
+        return json_response(cached, response)
+    await news_index.ensure_current()
+    hits = news_index.search(q, category=category, tag=tag)
+    page, next_cursor = search_page(hits, limit, after)
+    docs = await db.news.find({"id": {"$in": [news_id for _, news_id in page]}}, fields_projection(selected, "created_at")).to_list(limit)
+    by_id = {doc["id"]: doc for doc in docs}
+    items = [by_id[news_id] for _, news_id in page if news_id in by_id]
+    result = {
+        "items": items,
+        "total": len(hits),
+        "facets": news_index.facets([news_id for _, news_id in hits]),
+        "next_cursor": next_cursor,
+    }
+    if selected:
+        result["items"] = serialize_partial(NewsPartial, items, selected)
+        body = orjson.dumps(result)
+    else:
+        body = serialize(SearchPage[News], result)
+    response_cache.set("news_search", body, **cache_params)
+    return json_response(body, response)
+
+@api_router.get("/news/{news_id}/related", response_model=List[NewsCard])
+async def get_related_news(
+    news_id: str,
+    request: Request,
+    response: Response,
+    limit: int = Query(RELATED_NEWS_LIMIT, ge=1, le=12),
+):
+    """Articles sharing the most tags with this one, then the same category"""
+    not_modified = await conditional_response(request, response, "news")
+    if not_modified:
+        return not_modified
+    cached = response_cache.get("news_related", id=news_id, limit=limit, version=response_version(response))
+    if cached is not None:
+        return json_response(cached, response)
+    await news_index.ensure_current()
+    if news_id not in news_index.docs:
         raise HTTPException(status_code=404, detail="News not found")
-    if isinstance(news.get('created_at'), str):
-        news['created_at'] = datetime.fromisoformat(news['created_at'])
-    if isinstance(news.get('updated_at'), str):
-        news['updated_at'] = datetime.fromisoformat(news['updated_at'])
-    return news
+    related_ids = news_index.related(news_id, limit)
+    projection = fields_projection(list(NewsCard.model_fields), "created_at")
+    docs = await db.news.find({"id": {"$in": related_ids}}, projection).to_list(limit)
+    by_id = {doc["id"]: doc for doc in docs}
+    body = serialize(List[NewsCard], [by_id[other] for other in related_ids if other in by_id])
+    response_cache.set("news_related", body, id=news_id, limit=limit, version=response_version(response))
+    return json_response(body, response)
+
+@api_router.get("/news/{news_id}", response_model=News)
+async def get_news_by_id(news_id: str, request: Request, response: Response):
+    validators = await get_validators("news")
+    cached = response_cache.get("news_item", id=news_id, version=validators["ETag"])
+    if cached is None:
+        news = await db.news.find_one({"id": news_id}, {"_id": 0})
+        if not news:
+            raise HTTPException(status_code=404, detail="News not found")
+        cached = (document_etag(news), serialize(News, news))
+        response_cache.set("news_item", cached, id=news_id, version=validators["ETag"])
+    return document_response(request, response, *cached, validators)
 
 @api_router.post("/news", response_model=News)
 async def create_news(news_create: NewsCreate, current_user: str = Depends(get_current_user)):
-    news = News(**news_create.model_dump())
+    news = News(**news_create.model_dump(), excerpt=make_excerpt(news_create.content))
     doc = news.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
-    doc['updated_at'] = doc['updated_at'].isoformat()
     await db.news.insert_one(doc)
+    response_cache.invalidate("news")
+    version = await bump_collection_version("news")
+    await news_index.record_write(news.id, doc, version)
     return news
 
 @api_router.put("/news/{news_id}", response_model=News)
-async def update_news(news_id: str, news_update: NewsCreate, current_user: str = Depends(get_current_user)):
-    existing_news = await db.news.find_one({"id": news_id})
-    if not existing_news:
-        raise HTTPException(status_code=404, detail="News not found")
-    
-    update_data = news_update.model_dump()
-    update_data['updated_at'] = datetime.now(timezone.utc).isoformat()
-    await db.news.update_one({"id": news_id}, {"$set": update_data})
-    
-    updated_news = await db.news.find_one({"id": news_id}, {"_id": 0})
-    if isinstance(updated_news.get('created_at'), str):
-        updated_news['created_at'] = datetime.fromisoformat(updated_news['created_at'])
-    if isinstance(updated_news.get('updated_at'), str):
-        updated_news['updated_at'] = datetime.fromisoformat(updated_news['updated_at'])
+async def update_news(
+    news_id: str,
+    news_update: NewsUpdate,
+    if_match: Optional[str] = Header(None),
+    current_user: str = Depends(get_current_user),
+):
+    expected = expected_version(if_match, news_update.version)
+    update_data = news_update.model_dump(exclude={"version"})
+    update_data['excerpt'] = make_excerpt(news_update.content)
+    update_data['updated_at'] = datetime.now(timezone.utc)
+    updated_news = await db.news.find_one_and_update(
+        version_filter(news_id, expected),
+        versioned_update(update_data),
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if not updated_news:
+        raise await write_failure(db.news, news_id, expected, "News not found")
+    response_cache.invalidate("news")
+    response_cache.invalidate("news_item", id=news_id)
+    version = await bump_collection_version("news")
+    await news_index.record_write(news_id, updated_news, version)
     return updated_news
 
 @api_router.delete("/news/{news_id}")
-async def delete_news(news_id: str, current_user: str = Depends(get_current_user)):
-    result = await db.news.delete_one({"id": news_id})
-    if result.deleted_count == 0:
-        raise HTTPException(status_code=404, detail="News not found")
-    return {"message": "News deleted successfully"}
+async def delete_news(news_id: str, if_match: Optional[str] = Header(None), current_user: str = Depends(get_current_user)):
+    expected = expected_version(if_match, None)
+    deleted = await db.news.find_one_and_delete(version_filter(news_id, expected), projection={"_id": 0})
+    if not deleted:
+        raise await write_failure(db.news, news_id, expected, "News not found")
+    response_cache.invalidate("news")
+    response_cache.invalidate("news_item", id=news_id)
+    version = await bump_collection_version("news")
+    await news_index.record_write(news_id, None, version)
+    return {"message": "News deleted successfully", "deleted": deleted}
 
 # Players endpoints
-@api_router.get("/players", response_model=List[Player])
-async def get_players(position: Optional[str] = None):
+@api_router.get("/players", response_model=Union[List[Player], Page[Player], List[PlayerPartial], Page[PlayerPartial]])
+async def get_players(
+    request: Request,
+    response: Response,
+    position: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    fields: Optional[str] = None,
+):
+    """List players by shirt number; passing limit/after switches to cursor pagination"""
+    not_modified = await conditional_response(request, response, "players")
+    if not_modified:
+        return not_modified
+    selected = parse_fields(fields, Player)
+    cache_params = dict(version=response_version(response), position=position, limit=limit, after=after, fields=",".join(selected) if selected else None)
+    cached = response_cache.get("players", **cache_params)
+    if cached is not None:
+        return json_response(cached, response)
+    projection = fields_projection(selected, "number")
     query = {"position": position} if position else {}
-    players = await db.players.find(query, {"_id": 0}).sort("number", 1).to_list(1000)
-    for player in players:
-        if isinstance(player.get('created_at'), str):
-            player['created_at'] = datetime.fromisoformat(player['created_at'])
-    return players
+    paginated = limit is not None or after is not None
+    if paginated:
+        players, next_cursor = await fetch_page(db.players, query, "number", 1, limit, after, projection)
+    else:
+        players = await db.players.find(query, projection).sort("number", 1).to_list(1000)
+    if selected:
+        players = serialize_partial(PlayerPartial, players, selected)
+        result = {"items": players, "next_cursor": next_cursor} if paginated else players
+        body = orjson.dumps(result)
+    elif paginated:
+        body = serialize(Page[Player], {"items": players, "next_cursor": next_cursor})
+    else:
+        body = serialize(List[Player], players)
+    response_cache.set("players", body, **cache_params)
+    return json_response(body, response)
 
 @api_router.get("/players/{player_id}", response_model=Player)
-async def get_player_by_id(player_id: str):
-    player = await db.players.find_one({"id": player_id}, {"_id": 0})
-    if not player:
-        raise HTTPException(status_code=404, detail="Player not found")
-    if isinstance(player.get('created_at'), str):
-        player['created_at'] = datetime.fromisoformat(player['created_at'])
-    return player
+async def get_player_by_id(player_id: str, request: Request, response: Response):
+    validators = await get_validators("players")
+    cached = response_cache.get("player", id=player_id, version=validators["ETag"])
+    if cached is None:
+        player = await db.players.find_one({"id": player_id}, {"_id": 0})
+        if not player:
+            raise HTTPException(status_code=404, detail="Player not found")
+        cached = (document_etag(player), serialize(Player, player))
+        response_cache.set("player", cached, id=player_id, version=validators["ETag"])
+    return document_response(request, response, *cached, validators)
 
 @api_router.post("/players", response_model=Player)
 async def create_player(player_create: PlayerCreate, current_user: str = Depends(get_current_user)):
     player = Player(**player_create.model_dump())
     doc = player.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
     await db.players.insert_one(doc)
+    response_cache.invalidate("players")
+    version = await bump_collection_version("players")
+    await player_autocomplete.record_write(player.id, doc, version)
     return player
 
 @api_router.put("/players/{player_id}", response_model=Player)
-async def update_player(player_id: str, player_update: PlayerCreate, current_user: str = Depends(get_current_user)):
-    existing_player = await db.players.find_one({"id": player_id})
-    if not existing_player:
-        raise HTTPException(status_code=404, detail="Player not found")
-    
-    await db.players.update_one({"id": player_id}, {"$set": player_update.model_dump()})
-    updated_player = await db.players.find_one({"id": player_id}, {"_id": 0})
-    if isinstance(updated_player.get('created_at'), str):
-        updated_player['created_at'] = datetime.fromisoformat(updated_player['created_at'])
+async def update_player(
+    player_id: str,
+    player_update: PlayerUpdate,
+    if_match: Optional[str] = Header(None),
+    current_user: str = Depends(get_current_user),
+):
+    expected = expected_version(if_match, player_update.version)
+    updated_player = await db.players.find_one_and_update(
+        version_filter(player_id, expected),
+        versioned_update(player_update.model_dump(exclude={"version"})),
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if not updated_player:
+        raise await write_failure(db.players, player_id, expected, "Player not found")
+    response_cache.invalidate("players")
+    response_cache.invalidate("player", id=player_id)
+    version = await bump_collection_version("players")
+    await player_autocomplete.record_write(player_id, updated_player, version)
     return updated_player
 
 @api_router.delete("/players/{player_id}")
-async def delete_player(player_id: str, current_user: str = Depends(get_current_user)):
-    result = await db.players.delete_one({"id": player_id})
-    if result.deleted_count == 0:
-        raise HTTPException(status_code=404, detail="Player not found")
-    return {"message": "Player deleted successfully"}
+async def delete_player(player_id: str, if_match: Optional[str] = Header(None), current_user: str = Depends(get_current_user)):
+    expected = expected_version(if_match, None)
+    deleted = await db.players.find_one_and_delete(version_filter(player_id, expected), projection={"_id": 0})
+    if not deleted:
+        raise await write_failure(db.players, player_id, expected, "Player not found")
+    response_cache.invalidate("players")
+    response_cache.invalidate("player", id=player_id)
+    version = await bump_collection_version("players")
+    await player_autocomplete.record_write(player_id, None, version)
+    return {"message": "Player deleted successfully", "deleted": deleted}
 
 # Matches endpoints
-@api_router.get("/matches", response_model=List[Match])
-async def get_matches(status_filter: Optional[str] = None):
+@api_router.get("/matches", response_model=Union[List[Match], Page[Match], List[MatchPartial], Page[MatchPartial]])
+async def get_matches(
+    request: Request,
+    response: Response,
+    status_filter: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    fields: Optional[str] = None,
+):
+    """List matches, latest date first; passing limit/after switches to cursor pagination"""
+    not_modified = await conditional_response(request, response, "matches")
+    if not_modified:
+        return not_modified
+    selected = parse_fields(fields, Match)
+    cache_params = dict(version=response_version(response), status=status_filter, limit=limit, after=after, fields=",".join(selected) if selected else None)
+    cached = response_cache.get("matches", **cache_params)
+    if cached is not None:
+        return json_response(cached, response)
+    projection = fields_projection(selected, "date")
     query = {"status": status_filter} if status_filter else {}
-    matches = await db.matches.find(query, {"_id": 0}).sort("date", -1).to_list(1000)
-    for match in matches:
-        if isinstance(match.get('created_at'), str):
-            match['created_at'] = datetime.fromisoformat(match['created_at'])
-    return matches
+    paginated = limit is not None or after is not None
+    if paginated:
+        matches, next_cursor = await fetch_page(db.matches, query, "date", -1, limit, after, projection)
+    else:
+        matches = await db.matches.find(query, projection).sort("date", -1).to_list(1000)
+    if selected:
+        matches = serialize_partial(MatchPartial, matches, selected)
+        result = {"items": matches, "next_cursor": next_cursor} if paginated else matches
+        body = orjson.dumps(result)
+    elif paginated:
+        body = serialize(Page[Match], {"items": matches, "next_cursor": next_cursor})
+    else:
+        body = serialize(List[Match], matches)
+    response_cache.set("matches", body, **cache_params)
+    return json_response(body, response)
 
 @api_router.get("/matches/{match_id}", response_model=Match)
-async def get_match_by_id(match_id: str):
-    match = await db.matches.find_one({"id": match_id}, {"_id": 0})
-    if not match:
-        raise HTTPException(status_code=404, detail="Match not found")
-    if isinstance(match.get('created_at'), str):
-        match['created_at'] = datetime.fromisoformat(match['created_at'])
-    return match
+async def get_match_by_id(match_id: str, request: Request, response: Response):
+    validators = await get_validators("matches")
+    cached = response_cache.get("match", id=match_id, version=validators["ETag"])
+    if cached is None:
+        match = await db.matches.find_one({"id": match_id}, {"_id": 0})
+        if not match:
+            raise HTTPException(status_code=404, detail="Match not found")
+        cached = (document_etag(match), serialize(Match, match))
+        response_cache.set("match", cached, id=match_id, version=validators["ETag"])
+    return document_response(request, response, *cached, validators)
 
 @api_router.post("/matches", response_model=Match)
 async def create_match(match_create: MatchCreate, current_user: str = Depends(get_current_user)):
     match = Match(**match_create.model_dump())
     doc = match.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
     await db.matches.insert_one(doc)
+    response_cache.invalidate("matches")
+    version = await bump_collection_version("matches")
+    await local_standings.record_write(match.id, doc, version)
+    await match_autocomplete.record_write(match.id, doc, version)
     return match
 
+def parse_match_rows(body: bytes, csv_format: bool) -> List[dict]:
+    """Rows of a CSV (header line required) or a JSON array upload"""
+    if csv_format:
+        reader = csv.DictReader(io.StringIO(decode_html(body).lstrip('\ufeff')))
+        # Empty cells mean "not set", so optional fields fall back to their defaults
+        return [{key.strip(): value.strip() for key, value in row.items() if key and value and value.strip()} for row in reader]
+    try:
+        rows = orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON: {str(e)}")
+    if not isinstance(rows, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON array of matches")
+    return rows
+
+def fixture_key(match: dict) -> tuple:
+    return (match["date"], normalize_team_name(match["opponent"]), normalize_team_name(match["tournament"]))
+
+@api_router.post("/matches/bulk", response_model=BulkMatchReport)
+async def bulk_upsert_matches(
+    request: Request,
+    dry_run: bool = False,
+    upload_format: Optional[str] = Query(None, alias="format", pattern="^(csv|json)$"),
+    current_user: str = Depends(get_current_user),
+):
+    """Create or update many fixtures at once, matched on (date, opponent, tournament).
+
+    The upload is a JSON array or CSV of MatchCreate rows. With dry_run nothing
+    is written and the report shows what would change.
+    """
+    csv_format = upload_format == "csv" or (upload_format is None and "csv" in request.headers.get("content-type", ""))
+    rows = parse_match_rows(await request.body(), csv_format)
+    if len(rows) > MATCH_BULK_MAX_ROWS:
+        raise HTTPException(status_code=413, detail=f"At most {MATCH_BULK_MAX_ROWS} rows per upload")
+
+    report = BulkMatchReport(dry_run=dry_run)
+    valid: List[tuple] = []  # (result row, validated MatchCreate)
+    seen: Dict[tuple, int] = {}
+    for number, row in enumerate(rows, start=1):
+        try:
+            match = MatchCreate.model_validate(row)
+        except ValidationError as e:
+            report.rows.append(BulkMatchRow(row=number, action="error", error="; ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+            )))
+            continue
+        key = fixture_key(match.model_dump())
+        if key in seen:
+            report.rows.append(BulkMatchRow(row=number, action="error", error=f"Duplicate of row {seen[key]}"))
+            continue
+        seen[key] = number
+        result = BulkMatchRow(row=number, action="create")
+        report.rows.append(result)
+        valid.append((result, match))
+
+    existing_docs = await db.matches.find(
+        {"date": {"$in": list({match.date for _, match in valid})}}, {"_id": 0}
+    ).to_list(None)
+    existing = {fixture_key(doc): doc for doc in existing_docs}
+
+    operations = []
+    written: List[tuple] = []  # (match id, document after the write) for the in-memory indexes
+    for result, match in valid:
+        current = existing.get(fixture_key(match.model_dump()))
+        if current is None:
+            doc = Match(**match.model_dump()).model_dump()
+            result.id = doc["id"]
+            operations.append(UpdateOne(
+                {"date": doc["date"], "opponent": doc["opponent"], "tournament": doc["tournament"]},
+                {"$setOnInsert": doc},
+                upsert=True
+            ))
+            written.append((doc["id"], doc))
+            continue
+        result.id = current["id"]
+        given = match.model_dump(exclude_unset=True)
+        result.changes = {
+            field: {"old": current.get(field), "new": value}
+            for field, value in given.items() if current.get(field) != value
+        }
+        if not result.changes:
+            result.action = "unchanged"
+            continue
+        result.action = "update"
+        operations.append(UpdateOne({"id": current["id"]}, {"$set": given, "$inc": {"version": 1}}))
+        written.append((current["id"], {**current, **given, "version": current.get("version", 1) + 1}))
+
+    for result in report.rows:
+        report.created += result.action == "create"
+        report.updated += result.action == "update"
+        report.unchanged += result.action == "unchanged"
+        report.failed += result.action == "error"
+
+    if dry_run or not operations:
+        return report
+    # One round trip for the whole upload
+    await db.matches.bulk_write(operations, ordered=False)
+    response_cache.invalidate("matches")
+    response_cache.invalidate("match")
+    version = await bump_collection_version("matches")
+    await local_standings.record_writes(written, version)
+    await match_autocomplete.record_writes(written, version)
+    logger.info(f"Bulk match upload: {report.created} created, {report.updated} updated, "
+                f"{report.unchanged} unchanged, {report.failed} failed")
+    return report
+
 @api_router.put("/matches/{match_id}", response_model=Match)
-async def update_match(match_id: str, match_update: MatchCreate, current_user: str = Depends(get_current_user)):
-    existing_match = await db.matches.find_one({"id": match_id})
-    if not existing_match:
-        raise HTTPException(status_code=404, detail="Match not found")
-    
-    await db.matches.update_one({"id": match_id}, {"$set": match_update.model_dump()})
-    updated_match = await db.matches.find_one({"id": match_id}, {"_id": 0})
-    if isinstance(updated_match.get('created_at'), str):
-        updated_match['created_at'] = datetime.fromisoformat(updated_match['created_at'])
+async def update_match(
+    match_id: str,
+    match_update: MatchUpdate,
+    if_match: Optional[str] = Header(None),
+    current_user: str = Depends(get_current_user),
+):
+    expected = expected_version(if_match, match_update.version)
+    updated_match = await db.matches.find_one_and_update(
+        version_filter(match_id, expected),
+        versioned_update(match_update.model_dump(exclude={"version"})),
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if not updated_match:
+        raise await write_failure(db.matches, match_id, expected, "Match not found")
+    response_cache.invalidate("matches")
+    response_cache.invalidate("match", id=match_id)
+    version = await bump_collection_version("matches")
+    await local_standings.record_write(match_id, updated_match, version)
+    await match_autocomplete.record_write(match_id, updated_match, version)
     return updated_match
 
 @api_router.delete("/matches/{match_id}")
-async def delete_match(match_id: str, current_user: str = Depends(get_current_user)):
-    result = await db.matches.delete_one({"id": match_id})
-    if result.deleted_count == 0:
-        raise HTTPException(status_code=404, detail="Match not found")
-    return {"message": "Match deleted successfully"}
+async def delete_match(match_id: str, if_match: Optional[str] = Header(None), current_user: str = Depends(get_current_user)):
+    expected = expected_version(if_match, None)
+    deleted = await db.matches.find_one_and_delete(version_filter(match_id, expected), projection={"_id": 0})
+    if not deleted:
+        raise await write_failure(db.matches, match_id, expected, "Match not found")
+    response_cache.invalidate("matches")
+    response_cache.invalidate("match", id=match_id)
+    version = await bump_collection_version("matches")
+    await local_standings.record_write(match_id, None, version)
+    await match_autocomplete.record_write(match_id, None, version)
+    return {"message": "Match deleted successfully", "deleted": deleted}
 
 # Settings endpoints
 @api_router.get("/settings", response_model=Settings)
-async def get_settings():
-    settings = await db.settings.find_one({"id": "settings"}, {"_id": 0})
-    if not settings:
-        default_settings = Settings()
-        await db.settings.insert_one(default_settings.model_dump())
-        return default_settings
-    return settings
+async def get_settings(request: Request, response: Response):
+    validators = await get_validators("settings")
+    cached = response_cache.get("settings", version=validators["ETag"])
+    if cached is None:
+        settings = await db.settings.find_one({"id": "settings"}, {"_id": 0})
+        if not settings:
+            default_settings = Settings()
+            await db.settings.insert_one(default_settings.model_dump())
+            settings = default_settings.model_dump()
+        cached = (document_etag(settings), serialize(Settings, settings))
+        response_cache.set("settings", cached, version=validators["ETag"])
+    return document_response(request, response, *cached, validators)
 
 @api_router.put("/settings", response_model=Settings)
-async def update_settings(settings_update: SettingsUpdate, current_user: str = Depends(get_current_user)):
-    update_data = {k: v for k, v in settings_update.model_dump().items() if v is not None}
-    if update_data:
-        await db.settings.update_one(
-            {"id": "settings"},
-            {"$set": update_data},
-            upsert=True
-        )
-    settings = await db.settings.find_one({"id": "settings"}, {"_id": 0})
+async def update_settings(
+    settings_update: SettingsUpdate,
+    if_match: Optional[str] = Header(None),
+    current_user: str = Depends(get_current_user),
+):
+    expected = expected_version(if_match, settings_update.version)
+    update_data = {k: v for k, v in settings_update.model_dump(exclude={"version"}).items() if v is not None}
+    if not update_data:
+        return await db.settings.find_one({"id": "settings"}, {"_id": 0})
+    settings = await db.settings.find_one_and_update(
+        version_filter("settings", expected),
+        versioned_update(update_data),
+        projection={"_id": 0},
+        upsert=expected is None,
+        return_document=ReturnDocument.AFTER
+    )
+    if not settings:
+        raise await write_failure(db.settings, "settings", expected, "Settings not found")
+    response_cache.invalidate("settings")
+    await bump_collection_version("settings")
     return settings
 
 # Contact Messages endpoints
@@ -553,81 +2783,741 @@ async def create_contact_message(contact_create: ContactMessageCreate):
     """Create a new contact message (public endpoint)"""
     contact = ContactMessage(**contact_create.model_dump())
     doc = contact.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
     await db.contact_messages.insert_one(doc)
+    await bump_collection_version("contact_messages")
     logger.info(f"New contact message from {contact.email}")
     return contact
 
-@api_router.get("/contacts", response_model=List[ContactMessage])
-async def get_contact_messages(current_user: str = Depends(get_current_user)):
-    """Get all contact messages (admin only)"""
-    messages = await db.contact_messages.find({}, {"_id": 0}).sort("created_at", -1).to_list(1000)
-    for msg in messages:
-        if isinstance(msg.get('created_at'), str):
-            msg['created_at'] = datetime.fromisoformat(msg['created_at'])
-    return messages
+@api_router.get("/contacts", response_model=Union[List[ContactMessage], Page[ContactMessage], List[ContactMessagePartial], Page[ContactMessagePartial]])
+async def get_contact_messages(
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: str = Depends(get_current_user),
+):
+    """Get contact messages, newest first (admin only); limit/after switch to cursor pagination"""
+    not_modified = await conditional_response(request, response, "contact_messages")
+    if not_modified:
+        return not_modified
+    selected = parse_fields(fields, ContactMessage)
+    projection = fields_projection(selected, "created_at")
+    paginated = limit is not None or after is not None
+    if paginated:
+        messages, next_cursor = await fetch_page(db.contact_messages, {}, "created_at", -1, limit, after, projection)
+    else:
+        messages = await db.contact_messages.find({}, projection).sort("created_at", -1).to_list(1000)
+    if selected:
+        messages = serialize_partial(ContactMessagePartial, messages, selected)
+    result = {"items": messages, "next_cursor": next_cursor} if paginated else messages
+    return json_response(orjson.dumps(result), response) if selected else result
 
 @api_router.delete("/contacts/{message_id}")
 async def delete_contact_message(message_id: str, current_user: str = Depends(get_current_user)):
     """Delete a contact message (admin only)"""
-    result = await db.contact_messages.delete_one({"id": message_id})
-    if result.deleted_count == 0:
+    deleted = await db.contact_messages.find_one_and_delete({"id": message_id}, projection={"_id": 0})
+    if not deleted:
         raise HTTPException(status_code=404, detail="Message not found")
-    return {"message": "Contact message deleted successfully"}
+    await bump_collection_version("contact_messages")
+    return {"message": "Contact message deleted successfully", "deleted": deleted}
 
 @api_router.patch("/contacts/{message_id}/read")
 async def mark_message_as_read(message_id: str, current_user: str = Depends(get_current_user)):
     """Mark a contact message as read (admin only)"""
-    result = await db.contact_messages.update_one(
+    previous = await db.contact_messages.find_one_and_update(
         {"id": message_id},
-        {"$set": {"read": True}}
+        {"$set": {"read": True}},
+        projection={"_id": 0},
+        return_document=ReturnDocument.BEFORE
     )
-    if result.matched_count == 0:
+    if not previous:
         raise HTTPException(status_code=404, detail="Message not found")
-    return {"message": "Message marked as read"}
+    if not previous.get("read"):
+        await bump_collection_version("contact_messages")
+    return {"message": "Message marked as read", "contact": {**previous, "read": True}}
+
+# Standings endpoints
+# Last table served per league, returned while the DB copy is missing and cannot be refreshed
+last_good_standings: Dict[str, bytes] = {}
 
-# Standings endpoint
-@api_router.get("/standings")
-async def get_standings():
-    """Get the current standings table"""
-    standings = await db.standings.find_one({"id": "standings_first_league"}, {"_id": 0})
+async def standings_response(league: str, request: Request, response: Response):
+    not_modified = await conditional_response(request, response, "standings")
+    if not_modified:
+        return not_modified
+    cached = response_cache.get("standings", league=league, version=response_version(response))
+    if cached is not None:
+        return json_response(cached, response)
+    standings = await db.standings.find_one({"id": standings_doc_id(league)}, {"_id": 0})
     if not standings:
+        if await db.standings.count_documents({}, limit=1):
+            raise HTTPException(status_code=404, detail="League not found")
         # If no standings in DB, try to parse them now
-        await parse_standings()
-        standings = await db.standings.find_one({"id": "standings_first_league"}, {"_id": 0})
+        if await refresh_standings():
+            standings = await db.standings.find_one({"id": standings_doc_id(league)}, {"_id": 0})
         if not standings:
-            raise HTTPException(status_code=404, detail="Standings not available")
-    
-    # Convert datetime strings back to datetime objects if needed
-    if isinstance(standings.get('last_updated'), str):
-        standings['last_updated'] = datetime.fromisoformat(standings['last_updated'])
+            stale = last_good_standings.get(league)
+            if stale is not None:
+                response.headers["Warning"] = '110 - "Response is Stale"'
+                return json_response(stale, response)
+            raise HTTPException(
+                status_code=503,
+                detail="Standings temporarily unavailable",
+                headers={"Retry-After": str(STANDINGS_REFRESH_COOLDOWN_SECONDS)}
+            )
     
-    return standings
+    standings.setdefault("league", league)
+    body = orjson.dumps(standings)
+    response_cache.set("standings", body, league=league, version=response_version(response))
+    last_good_standings[league] = body
+    return json_response(body, response)
 
-# Initialize admin user on startup
-@app.on_event("startup")
-async def startup_event():
-    # Create default admin user
+@api_router.get("/standings", response_model=StandingsData)
+async def get_standings(request: Request, response: Response):
+    """Get the current first league standings table"""
+    return await standings_response(FIRST_LEAGUE_SLUG, request, response)
+
+@api_router.get("/standings/leagues", response_model=List[LeagueSummary])
+async def get_standings_leagues(request: Request, response: Response):
+    """Index of the leagues we have standings for"""
+    not_modified = await conditional_response(request, response, "standings")
+    if not_modified:
+        return not_modified
+    cached = response_cache.get("standings_leagues", version=response_version(response))
+    if cached is not None:
+        return json_response(cached, response)
+    leagues = await db.standings.aggregate([
+        {"$project": {
+            "_id": 0,
+            "league": {"$ifNull": ["$league", FIRST_LEAGUE_SLUG]},
+            "league_name": 1,
+            "teams_count": {"$size": "$teams"},
+            "last_updated": 1,
+            "order": 1,
+        }},
+        {"$sort": {"order": 1, "league": 1}},
+    ]).to_list(100)
+    body = serialize(List[LeagueSummary], leagues)
+    response_cache.set("standings_leagues", body, version=response_version(response))
+    return json_response(body, response)
+
+@api_router.get("/standings/{league}", response_model=StandingsData)
+async def get_league_standings(league: str, request: Request, response: Response):
+    """Get the standings table of one league by slug"""
+    return await standings_response(league, request, response)
+
+@api_router.get("/standings/{league}/history", response_model=StandingsAsOf)
+async def get_standings_as_of(
+    league: str,
+    request: Request,
+    response: Response,
+    as_of: date = Query(..., description="Reconstruct the table as it was at the end of this day"),
+):
+    """League table as of a past date, rebuilt from the snapshot history"""
+    not_modified = await conditional_response(request, response, "standings")
+    if not_modified:
+        return not_modified
+    cached = response_cache.get("standings_as_of", league=league, as_of=as_of, version=response_version(response))
+    if cached is not None:
+        return json_response(cached, response)
+    standings = await standings_as_of(league, end_of_day(as_of))
+    if standings is None:
+        raise HTTPException(status_code=404, detail="No standings history for this date")
+    body = serialize(StandingsAsOf, standings)
+    response_cache.set("standings_as_of", body, league=league, as_of=as_of, version=response_version(response))
+    return json_response(body, response)
+
+@api_router.get("/standings/{league}/trend", response_model=TeamTrend)
+async def get_team_trend(
+    league: str,
+    request: Request,
+    response: Response,
+    team: str = Query(..., min_length=1),
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+):
+    """Daily position and points of a team over a date range"""
+    end = end or datetime.now(timezone.utc).date()
+    start = start or end - timedelta(days=STANDINGS_TREND_DEFAULT_DAYS)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+    if (end - start).days >= STANDINGS_TREND_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"Range must not exceed {STANDINGS_TREND_MAX_DAYS} days")
+    not_modified = await conditional_response(request, response, "standings")
+    if not_modified:
+        return not_modified
+    cached = response_cache.get("standings_trend", league=league, team=team, start=start, end=end, version=response_version(response))
+    if cached is not None:
+        return json_response(cached, response)
+    trend = await team_trend(league, team, start, end)
+    if trend is None:
+        raise HTTPException(status_code=404, detail="League not found")
+    body = serialize(TeamTrend, trend)
+    response_cache.set("standings_trend", body, league=league, team=team, start=start, end=end, version=response_version(response))
+    return json_response(body, response)
+
+# Local standings endpoints
+@api_router.get("/local-standings/tournaments", response_model=List[str])
+async def get_local_tournaments():
+    """Tournaments we have counted results for"""
+    await local_standings.ensure_current()
+    return sorted(local_standings.tables)
+
+@api_router.get("/local-standings", response_model=LocalStandingsData)
+async def get_local_standings(request: Request, response: Response, tournament: str = Query(..., min_length=1)):
+    """League table computed from our match results, updated as results are entered"""
+    not_modified = await conditional_response(request, response, "matches")
+    if not_modified:
+        return not_modified
+    await local_standings.ensure_current()
+    table = local_standings.table(tournament)
+    if table is None:
+        raise HTTPException(status_code=404, detail="No results for this tournament")
+    return json_response(serialize(LocalStandingsData, table), response)
+
+@api_router.get("/local-standings/check", response_model=StandingsCheck)
+async def check_local_standings(
+    tournament: str = Query(..., min_length=1),
+    league: str = FIRST_LEAGUE_SLUG,
+    current_user: str = Depends(get_current_user),
+):
+    """Compare the locally computed table with the scraped one (admin only)"""
+    await local_standings.ensure_current()
+    table = local_standings.table(tournament)
+    if table is None:
+        raise HTTPException(status_code=404, detail="No results for this tournament")
+    scraped = await db.standings.find_one({"id": standings_doc_id(league)}, {"_id": 0})
+    if not scraped:
+        raise HTTPException(status_code=404, detail="League not found")
+    return cross_check_standings(table, scraped, league)
+
+# Autocomplete endpoint
+@api_router.get("/autocomplete", response_model=List[str])
+async def autocomplete(
+    kind: str = Query(..., alias="type"),
+    prefix: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(AUTOCOMPLETE_LIMIT, ge=1, le=50),
+):
+    """Prefix suggestions answered from memory, cheap enough for every keystroke"""
+    index = AUTOCOMPLETE_INDEXES.get(kind)
+    if index is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown type: {kind}")
+    return ORJSONBytesResponse(content=orjson.dumps(index.tries[kind].complete(prefix, limit)))
+
+# Home page endpoint
+@api_router.get("/home", response_model=HomeData)
+async def get_home(
+    request: Request,
+    response: Response,
+    news_limit: int = Query(HOME_NEWS_LIMIT, ge=1, le=12),
+):
+    """Everything the home page needs in one round trip"""
+    not_modified = await conditional_response(request, response, "news", "matches", "settings")
+    if not_modified:
+        return not_modified
+    cached = response_cache.get("home", news_limit=news_limit, version=response_version(response))
+    if cached is not None:
+        return json_response(cached, response)
+
+    today = datetime.now(timezone.utc).date().isoformat()
+    news_projection = fields_projection(list(NewsCard.model_fields), "created_at")
+    settings, news_list, next_match, last_match = await asyncio.gather(
+        db.settings.find_one({"id": "settings"}, {"_id": 0}),
+        db.news.find({}, news_projection).sort([("created_at", -1), ("id", -1)]).limit(news_limit).to_list(news_limit),
+        db.matches.find_one({"status": "scheduled", "date": {"$gte": today}}, {"_id": 0}, sort=[("date", 1), ("time", 1)]),
+        db.matches.find_one({"status": "finished"}, {"_id": 0}, sort=[("date", -1), ("id", -1)]),
+    )
+
+    home = {
+        "settings": settings or Settings().model_dump(),
+        "news": news_list,
+        "next_match": next_match,
+        "last_match": last_match,
+    }
+    body = serialize(HomeData, home)
+    response_cache.set("home", body, news_limit=news_limit, version=response_version(response))
+    return json_response(body, response)
+
+# Admin dashboard endpoint
+async def count_facets(collection, group_field: str) -> tuple:
+    """Total document count and per-value counts of one field in a single aggregation"""
+    pipeline = [{"$facet": {
+        "total": [{"$count": "count"}],
+        "groups": [{"$group": {"_id": f"${group_field}", "count": {"$sum": 1}}}],
+    }}]
+    result = (await collection.aggregate(pipeline).to_list(1))[0]
+    total = result["total"][0]["count"] if result["total"] else 0
+    groups = {str(group["_id"]): group["count"] for group in result["groups"]}
+    return total, groups
+
+async def count_contact_messages() -> tuple:
+    pipeline = [{"$facet": {
+        "total": [{"$count": "count"}],
+        "unread": [{"$match": {"read": {"$ne": True}}}, {"$count": "count"}],
+    }}]
+    result = (await db.contact_messages.aggregate(pipeline).to_list(1))[0]
+    total = result["total"][0]["count"] if result["total"] else 0
+    unread = result["unread"][0]["count"] if result["unread"] else 0
+    return total, unread
+
+@api_router.get("/admin/stats", response_model=AdminStats)
+async def get_admin_stats(current_user: str = Depends(get_current_user)):
+    """Collection counts for the admin dashboard (admin only)"""
+    version = (await get_validators("news", "players", "matches", "contact_messages"))["ETag"]
+    cached = response_cache.get("admin_stats", version=version)
+    if cached is not None:
+        return cached
+    news, players, matches, contacts = await asyncio.gather(
+        count_facets(db.news, "category"),
+        count_facets(db.players, "position"),
+        count_facets(db.matches, "status"),
+        count_contact_messages(),
+    )
+    stats = AdminStats(
+        news_total=news[0],
+        news_by_category=news[1],
+        players_total=players[0],
+        players_by_position=players[1],
+        matches_total=matches[0],
+        matches_by_status=matches[1],
+        contact_messages_total=contacts[0],
+        contact_messages_unread=contacts[1],
+    )
+    response_cache.set("admin_stats", stats, version=version)
+    return stats
+
+# Scheduled jobs (admin only)
+@api_router.get("/admin/jobs", response_model=SchedulerStatus)
+async def get_scheduler_status(current_user: str = Depends(get_current_user)):
+    """Which worker leads the scheduler and which jobs can be triggered"""
+    lease = await db.leases.find_one({"id": "scheduler"}, {"_id": 0}) or {}
+    return SchedulerStatus(
+        worker=WORKER_ID,
+        leader=lease.get("owner"),
+        lease_expires_at=lease.get("expires_at"),
+        is_leader=scheduler_leader,
+        jobs=list(JOBS),
+    )
+
+@api_router.get("/admin/jobs/runs", response_model=List[JobRun])
+async def get_job_runs(
+    job: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: str = Depends(get_current_user)
+):
+    """Most recent job runs, newest first"""
+    query = {"job": job} if job else {}
+    return await db.job_runs.find(query, {"_id": 0}).sort("started_at", DESCENDING).to_list(limit)
+
+@api_router.post("/admin/jobs/{job}/run", response_model=JobRun)
+async def trigger_job(job: str, current_user: str = Depends(get_current_user)):
+    """Run a job now on this worker and return the recorded run"""
+    if job not in JOBS:
+        raise HTTPException(status_code=404, detail="Job not found")
+    run = await run_job(job, "manual", force=True)
+    if run is None:
+        raise HTTPException(status_code=409, detail="Job is already running")
+    return run
+
+# Export / import (admin only)
+# Collections that can be moved between environments, with the model each line is validated against
+TRANSFER_MODELS = {
+    "news": News,
+    "players": Player,
+    "matches": Match,
+    "contact_messages": ContactMessage,
+    "settings": Settings,
+    "standings": StandingsData,
+}
+
+def transfer_model(collection: str) -> type:
+    model = TRANSFER_MODELS.get(collection)
+    if model is None:
+        raise HTTPException(status_code=404, detail="Collection not available for export/import")
+    return model
+
+@api_router.get("/admin/export/{collection}")
+async def export_collection(collection: str, current_user: str = Depends(get_current_user)):
+    """Stream a collection as NDJSON, one document per line, straight from the cursor"""
+    transfer_model(collection)
+
+    async def lines():
+        cursor = db[collection].find({}, {"_id": 0}).sort("id", ASCENDING).batch_size(EXPORT_BATCH_SIZE)
+        async for doc in cursor:
+            yield orjson.dumps(doc, option=orjson.OPT_APPEND_NEWLINE)
+
+    filename = f"{collection}-{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.ndjson"
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+async def ndjson_lines(request: Request):
+    """(line number, bytes) for each non-empty line of a streamed request body"""
+    pending = b""
+    number = 0
+    async for chunk in request.stream():
+        pending += chunk
+        *complete, pending = pending.split(b"\n")
+        for line in complete:
+            number += 1
+            if line.strip():
+                yield number, line
+    if pending.strip():
+        yield number + 1, pending
+
+async def write_import_batch(collection: str, batch: List[tuple], report: ImportReport):
+    """Unordered bulk write; per-operation failures are mapped back to their line"""
+    try:
+        result = await db[collection].bulk_write([op for _, op in batch], ordered=False)
+        details = result.bulk_api_result
+    except BulkWriteError as e:
+        details = e.details
+        for error in details.get("writeErrors", []):
+            record_import_error(report, batch[error["index"]][0], error.get("errmsg", "write failed"))
+    report.inserted += details.get("nInserted", 0)
+    report.upserted += details.get("nUpserted", 0)
+    report.modified += details.get("nModified", 0)
+
+def record_import_error(report: ImportReport, line: int, error: str):
+    report.failed += 1
+    if len(report.errors) < IMPORT_MAX_ERRORS:
+        report.errors.append(ImportLineError(line=line, error=error))
+
+@api_router.post("/admin/import/{collection}", response_model=ImportReport)
+async def import_collection(
+    collection: str,
+    request: Request,
+    mode: str = Query("upsert", pattern="^(upsert|insert)$"),
+    current_user: str = Depends(get_current_user),
+):
+    """Load an NDJSON body: each line is validated, then written in unordered batches.
+
+    upsert replaces documents with the same id; insert only adds new ones and
+    reports existing ids as errors.
+    """
+    model = transfer_model(collection)
+    report = ImportReport(collection=collection, mode=mode)
+    batch: List[tuple] = []
+    async for number, line in ndjson_lines(request):
+        report.lines += 1
+        try:
+            doc = model.model_validate(orjson.loads(line)).model_dump()
+        except orjson.JSONDecodeError as e:
+            record_import_error(report, number, f"Invalid JSON: {str(e)}")
+            continue
+        except ValidationError as e:
+            record_import_error(report, number, "; ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+            ))
+            continue
+        if mode == "insert":
+            batch.append((number, InsertOne(doc)))
+        else:
+            batch.append((number, ReplaceOne({"id": doc["id"]}, doc, upsert=True)))
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            await write_import_batch(collection, batch, report)
+            batch = []
+    if batch:
+        await write_import_batch(collection, batch, report)
+
+    if report.inserted or report.upserted or report.modified:
+        # Imports touch arbitrary documents: drop every cached response and revalidate clients
+        response_cache.clear()
+        await bump_collection_version(collection)
+    logger.info(f"Imported {collection} ({mode}): {report.lines} lines, {report.inserted} inserted, "
+                f"{report.upserted} upserted, {report.modified} modified, {report.failed} failed")
+    return report
+
+# Image uploads
+# Originals live under MEDIA_DIR/originals named by content hash and are never evicted.
+# Derivatives are rendered on first request into MEDIA_DIR/derivatives, shared by all
+# workers, and evicted least recently used (by mtime) once they exceed IMAGE_CACHE_MAX_BYTES.
+IMAGE_ID_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+ORIGINALS_DIR = MEDIA_DIR / "originals"
+DERIVATIVES_DIR = MEDIA_DIR / "derivatives"
+image_executor: Optional[ProcessPoolExecutor] = None
+image_jobs: Dict[str, asyncio.Task] = {}
+derivative_bytes: Optional[int] = None  # this worker's running estimate, re-measured on eviction
+derivative_eviction_lock = asyncio.Lock()
+
+def get_image_executor() -> ProcessPoolExecutor:
+    """Decoding and resizing are CPU-bound and hold the GIL, so they run in worker processes.
+
+    Spawned rather than forked: forking copies Motor's threads and sockets mid-use.
+    """
+    global image_executor
+    if image_executor is None:
+        image_executor = ProcessPoolExecutor(max_workers=IMAGE_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return image_executor
+
+async def run_image_job(func, *args):
+    global image_executor
+    try:
+        return await asyncio.get_running_loop().run_in_executor(get_image_executor(), func, *args)
+    except ImportError:
+        raise HTTPException(status_code=503, detail="Image processing is not available (Pillow is not installed)")
+    except BrokenProcessPool:
+        # A worker died (e.g. killed for memory); start a fresh pool on the next request
+        image_executor = None
+        raise HTTPException(status_code=503, detail="Image processing failed, please retry", headers={"Retry-After": "1"})
+
+def original_path(image_id: str) -> Path:
+    return ORIGINALS_DIR / image_id
+
+def derivative_path(image_id: str, variant: str, image_format: str) -> Path:
+    return DERIVATIVES_DIR / image_id[:2] / f"{image_id}-{variant}.{image_format}"
+
+def image_urls(image_id: str) -> Dict[str, Dict[str, str]]:
+    return {
+        variant: {fmt: f"/api/images/{image_id}/{variant}.{fmt}" for fmt in IMAGE_FORMATS}
+        for variant in IMAGE_VARIANTS
+    }
+
+def image_upload(doc: dict) -> ImageUpload:
+    return ImageUpload(**doc, original_url=f"/api/images/{doc['id']}/original", urls=image_urls(doc["id"]))
+
+def write_original(path: Path, content: bytes):
+    """Write via a temporary file so other workers never serve a partial original"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(content)
+    os.replace(tmp, path)
+
+def evict_derivatives(target_bytes: int) -> int:
+    """Delete least recently used derivatives until at most target_bytes remain; returns the bytes left"""
+    files = []
+    total = 0
+    for shard in os.scandir(DERIVATIVES_DIR):
+        if not shard.is_dir():
+            continue
+        for entry in os.scandir(shard.path):
+            if entry.name.endswith(".tmp"):
+                continue
+            stat = entry.stat()
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+    files.sort()
+    removed = 0
+    for _, size, path in files:
+        if total <= target_bytes:
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass  # another worker evicted it first
+        total -= size
+        removed += 1
+    if removed:
+        logger.info(f"Evicted {removed} image derivatives, {total / 1024 / 1024:.1f} MiB left")
+    return total
+
+async def account_derivative(size: int):
+    global derivative_bytes
+    async with derivative_eviction_lock:
+        if derivative_bytes is None:
+            derivative_bytes = await asyncio.to_thread(evict_derivatives, IMAGE_CACHE_MAX_BYTES)
+        else:
+            derivative_bytes += size
+        if derivative_bytes > IMAGE_CACHE_MAX_BYTES:
+            derivative_bytes = await asyncio.to_thread(evict_derivatives, int(IMAGE_CACHE_MAX_BYTES * IMAGE_CACHE_EVICT_TO))
+
+async def render_derivative(image_id: str, variant: str, image_format: str) -> Path:
+    source = original_path(image_id)
+    if not source.exists():
+        raise HTTPException(status_code=404, detail="Image not found")
+    target = derivative_path(image_id, variant, image_format)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    pillow_format, _, quality = IMAGE_FORMATS[image_format]
+    started = time.perf_counter()
+    size = await run_image_job(
+        imaging.render, str(source), str(target), IMAGE_VARIANTS[variant], pillow_format, quality, IMAGE_MAX_PIXELS
+    )
+    logger.info(f"Rendered {target.name} ({size} bytes) in {(time.perf_counter() - started) * 1000:.0f} ms")
+    await account_derivative(size)
+    return target
+
+async def ensure_derivative(image_id: str, variant: str, image_format: str) -> Path:
+    """Path of a rendered derivative; the first request renders it, concurrent ones share that render"""
+    path = derivative_path(image_id, variant, image_format)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        key = path.name
+        task = image_jobs.get(key)
+        if task is None:
+            task = asyncio.create_task(render_derivative(image_id, variant, image_format))
+            image_jobs[key] = task
+            task.add_done_callback(lambda _: image_jobs.pop(key, None))
+        # Shielded so a client that disconnects does not cancel the render others wait on
+        return await asyncio.shield(task)
+    if time.time() - stat.st_mtime > IMAGE_TOUCH_SECONDS:
+        os.utime(path)  # mark as recently used for eviction
+    return path
+
+def image_not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Image URLs never change content, so any revalidation of the same URL is answered with 304"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        matched = any(tag.strip().removeprefix("W/") in (etag, "*") for tag in if_none_match.split(","))
+    else:
+        matched = "if-modified-since" in request.headers
+    if matched:
+        return Response(status_code=304, headers={"Cache-Control": IMAGE_CACHE_CONTROL, "ETag": etag})
+    return None
+
+def immutable_file_response(path: Path, media_type: str, etag: str) -> FileResponse:
+    return FileResponse(path, media_type=media_type, headers={"Cache-Control": IMAGE_CACHE_CONTROL, "ETag": etag})
+
+@api_router.post("/images", response_model=ImageUpload, status_code=201)
+async def upload_image(file: UploadFile = File(...), current_user: str = Depends(get_current_user)):
+    """Store an uploaded original (JPEG, PNG, WebP or GIF) and return the URLs of its derivatives.
+
+    Uploading the same bytes again returns the existing image.
+    """
+    content = await file.read(IMAGE_MAX_UPLOAD_BYTES + 1)
+    if not content:
+        raise HTTPException(status_code=400, detail="Empty file")
+    if len(content) > IMAGE_MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"Image is larger than {IMAGE_MAX_UPLOAD_BYTES // (1024 * 1024)} MiB")
+
+    image_id = hashlib.sha256(content).hexdigest()
+    path = original_path(image_id)
+    existing = await db.images.find_one({"id": image_id}, {"_id": 0})
+    if existing and path.exists():
+        return image_upload(existing)
+
+    try:
+        info = await run_image_job(imaging.probe, content, IMAGE_MAX_PIXELS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Not a supported image: {str(e)}")
+    await asyncio.to_thread(write_original, path, content)
+
+    image = StoredImage(id=image_id, size=len(content), filename=file.filename, uploaded_by=current_user, **info)
+    doc = image.model_dump()
+    try:
+        await db.images.update_one({"id": image_id}, {"$setOnInsert": doc}, upsert=True)
+    except DuplicateKeyError:
+        pass  # the same file uploaded concurrently
+    logger.info(f"Stored image {image_id} ({info['format']}, {info['width']}x{info['height']}, {len(content)} bytes)")
+    return image_upload(existing or doc)
+
+@api_router.get("/images/{image_id}/original")
+async def get_original_image(image_id: str, request: Request):
+    """The uploaded file as is"""
+    if not IMAGE_ID_PATTERN.match(image_id):
+        raise HTTPException(status_code=404, detail="Image not found")
+    etag = f'"{image_id}"'
+    not_modified = image_not_modified(request, etag)
+    if not_modified:
+        return not_modified
+    image = await db.images.find_one({"id": image_id}, {"_id": 0, "format": 1})
+    path = original_path(image_id)
+    if image is None or not path.exists():
+        raise HTTPException(status_code=404, detail="Image not found")
+    return immutable_file_response(path, f"image/{image['format']}", etag)
+
+@api_router.get("/images/{image_id}/{variant}.{image_format}")
+async def get_image_derivative(image_id: str, variant: str, image_format: str, request: Request):
+    """A resized copy, rendered on first request. The URL embeds the content hash, so it is cached forever."""
+    if not IMAGE_ID_PATTERN.match(image_id) or variant not in IMAGE_VARIANTS or image_format not in IMAGE_FORMATS:
+        raise HTTPException(status_code=404, detail="Image not found")
+    etag = f'"{image_id}-{variant}.{image_format}"'
+    not_modified = image_not_modified(request, etag)
+    if not_modified:
+        return not_modified
+    path = await ensure_derivative(image_id, variant, image_format)
+    return immutable_file_response(path, IMAGE_FORMATS[image_format][1], etag)
+
+# Cache diagnostics
+@api_router.get("/cache/stats")
+async def get_cache_stats(current_user: str = Depends(get_current_user)):
+    """Response cache hit/miss counters for this worker (admin only)"""
+    return response_cache.stats()
+
+# Startup: only what is needed to serve runs before traffic, the rest in the background
+# Background startup tasks readiness waits for: nobody can log in before the admin exists
+REQUIRED_STARTUP_TASKS = ("seed_admin",)
+startup_phases: Dict[str, float] = {}
+startup_tasks: Dict[str, str] = {}
+
+def record_phase(name: str, started: float):
+    startup_phases[name] = round((time.perf_counter() - started) * 1000, 1)
+    logger.info(f"Startup phase {name} took {startup_phases[name]:.1f} ms")
+
+def start_startup_task(name: str, coro):
+    async def run():
+        started = time.perf_counter()
+        startup_tasks[name] = "running"
+        try:
+            await coro
+            startup_tasks[name] = "done"
+        except Exception as e:
+            startup_tasks[name] = "failed"
+            logger.error(f"Startup task {name} failed: {str(e)}")
+        record_phase(name, started)
+    start_background_task(run())
+
+async def seed_default_admin():
+    """Create the default admin user"""
     admin_email = "fcoleksandria2133@fc.com"
     existing_admin = await db.users.find_one({"email": admin_email})
     if not existing_admin:
         admin_user = User(
             email=admin_email,
-            password_hash=hash_password("Jingle2018!!!")
+            password_hash=await hash_password("Jingle2018!!!")
         )
         doc = admin_user.model_dump()
-        doc['created_at'] = doc['created_at'].isoformat()
         await db.users.insert_one(doc)
         logger.info(f"Default admin user created: {admin_email}")
-    
-    # Initialize scheduler for daily standings updates
+
+async def start_scheduler():
+    # Initialize scheduler for daily standings updates; only the lease holder runs it
     schedule_standings_update()
-    
+    start_background_task(scheduler_leader_loop())
+
+async def initial_standings_refresh():
     # Parse standings if not in database
-    existing_standings = await db.standings.find_one({"id": "standings_first_league"})
+    existing_standings = await db.standings.find_one({"id": "standings_first_league"}, {"_id": 1})
     if not existing_standings:
         logger.info("No standings in database, parsing now...")
-        await parse_standings()
+        await refresh_standings(wait=None)
+
+@app.on_event("startup")
+async def startup_event():
+    started = time.perf_counter()
+    await ensure_indexes()
+    record_phase("indexes", started)
+
+    started = time.perf_counter()
+    await refresh_revoked_tokens()
+    start_background_task(revocation_refresh_loop())
+    record_phase("revoked_tokens", started)
+
+    start_startup_task("seed_admin", seed_default_admin())
+    start_startup_task("scheduler", start_scheduler())
+    start_startup_task("initial_standings", initial_standings_refresh())
+    start_background_task(mirror_refresh_loop())
+
+# Health checks
+@api_router.get("/health/live")
+async def liveness():
+    """The process is up and the event loop is responsive"""
+    return {"status": "alive"}
+
+@api_router.get("/health/ready")
+async def readiness():
+    """Ready to serve: the required startup tasks are done and MongoDB answers"""
+    pending = [name for name in REQUIRED_STARTUP_TASKS if startup_tasks.get(name) != "done"]
+    if pending:
+        states = ", ".join(f"{name} {startup_tasks.get(name, 'pending')}" for name in pending)
+        raise HTTPException(status_code=503, detail=f"Starting up: {states}")
+    try:
+        await asyncio.wait_for(db.command("ping"), timeout=2)
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"MongoDB unavailable: {type(e).__name__}")
+    return {"status": "ready", "worker": WORKER_ID, "startup_ms": startup_phases, "background": startup_tasks}
 
 app.include_router(api_router)
 
@@ -641,6 +3531,18 @@ app.add_middleware(
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    if scheduler.running:
+    if scheduler is not None and scheduler.running:
         scheduler.shutdown()
-    client.close()
\ No newline at end of file
+    for task in list(background_tasks):
+        task.cancel()
+    if scheduler_leader:
+        # Hand over leadership right away instead of waiting for the lease to expire
+        await release_lease("scheduler")
+    password_executor.shutdown(wait=False)
+    if image_executor is not None:
+        image_executor.shutdown(wait=False, cancel_futures=True)
+    if _http_client is not None:
+        await _http_client.aclose()
+    client.close()
+
+logger.info(f"Imported server module in {(time.perf_counter() - MODULE_IMPORT_STARTED) * 1000:.0f} ms")
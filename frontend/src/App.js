@@ -25,79 +25,82 @@ import AdminMessages from './pages/admin/AdminMessages';
 
 // Auth context
 import { AuthProvider } from './contexts/AuthContext';
+import { SettingsProvider } from './contexts/SettingsContext';
 import ProtectedRoute from './components/ProtectedRoute';
 
 function App() {
   return (
     <AuthProvider>
-      <BrowserRouter>
-        <div className="App">
-          <Routes>
-            {/* Public routes */}
-            <Route path="/" element={<HomePage />} />
-            <Route path="/news" element={<NewsPage />} />
-            <Route path="/news/:id" element={<NewsDetailPage />} />
-            <Route path="/team" element={<TeamPage />} />
-            <Route path="/player/:id" element={<PlayerDetailPage />} />
-            <Route path="/matches" element={<MatchesPage />} />
-            <Route path="/stadium" element={<StadiumPage />} />
-            <Route path="/contact" element={<ContactPage />} />
-            <Route path="/standings" element={<StandingsPage />} />
+      <SettingsProvider>
+        <BrowserRouter>
+          <div className="App">
+            <Routes>
+              {/* Public routes */}
+              <Route path="/" element={<HomePage />} />
+              <Route path="/news" element={<NewsPage />} />
+              <Route path="/news/:id" element={<NewsDetailPage />} />
+              <Route path="/team" element={<TeamPage />} />
+              <Route path="/player/:id" element={<PlayerDetailPage />} />
+              <Route path="/matches" element={<MatchesPage />} />
+              <Route path="/stadium" element={<StadiumPage />} />
+              <Route path="/contact" element={<ContactPage />} />
+              <Route path="/standings" element={<StandingsPage />} />
 
-            {/* Admin routes */}
-            <Route path="/admin/login" element={<AdminLogin />} />
-            <Route
-              path="/admin"
-              element={
-                <ProtectedRoute>
-                  <AdminDashboard />
-                </ProtectedRoute>
-              }
-            />
-            <Route
-              path="/admin/news"
-              element={
-                <ProtectedRoute>
-                  <AdminNews />
-                </ProtectedRoute>
-              }
-            />
-            <Route
-              path="/admin/players"
-              element={
-                <ProtectedRoute>
-                  <AdminPlayers />
-                </ProtectedRoute>
-              }
-            />
-            <Route
-              path="/admin/matches"
-              element={
-                <ProtectedRoute>
-                  <AdminMatches />
-                </ProtectedRoute>
-              }
-            />
-            <Route
-              path="/admin/settings"
-              element={
-                <ProtectedRoute>
-                  <AdminSettings />
-                </ProtectedRoute>
-              }
-            />
-            <Route
-              path="/admin/messages"
-              element={
-                <ProtectedRoute>
-                  <AdminMessages />
-                </ProtectedRoute>
-              }
-            />
-          </Routes>
-          <Toaster position="top-right" />
-        </div>
-      </BrowserRouter>
+              {/* Admin routes */}
+              <Route path="/admin/login" element={<AdminLogin />} />
+              <Route
+                path="/admin"
+                element={
+                  <ProtectedRoute>
+                    <AdminDashboard />
+                  </ProtectedRoute>
+                }
+              />
+              <Route
+                path="/admin/news"
+                element={
+                  <ProtectedRoute>
+                    <AdminNews />
+                  </ProtectedRoute>
+                }
+              />
+              <Route
+                path="/admin/players"
+                element={
+                  <ProtectedRoute>
+                    <AdminPlayers />
+                  </ProtectedRoute>
+                }
+              />
+              <Route
+                path="/admin/matches"
+                element={
+                  <ProtectedRoute>
+                    <AdminMatches />
+                  </ProtectedRoute>
+                }
+              />
+              <Route
+                path="/admin/settings"
+                element={
+                  <ProtectedRoute>
+                    <AdminSettings />
+                  </ProtectedRoute>
+                }
+              />
+              <Route
+                path="/admin/messages"
+                element={
+                  <ProtectedRoute>
+                    <AdminMessages />
+                  </ProtectedRoute>
+                }
+              />
+            </Routes>
+            <Toaster position="top-right" />
+          </div>
+        </BrowserRouter>
+      </SettingsProvider>
     </AuthProvider>
   );
 }
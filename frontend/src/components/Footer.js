@@ -1,25 +1,10 @@
-import React, { useState, useEffect } from 'react';
+import React from 'react';
 import { Link } from 'react-router-dom';
 import { Mail, Phone, MapPin } from 'lucide-react';
-import axios from 'axios';
-
-const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
-const API = `${BACKEND_URL}/api`;
+import { useSettings } from '../contexts/SettingsContext';
 
 const Footer = () => {
-  const [settings, setSettings] = useState({});
-
-  useEffect(() => {
-    const fetchSettings = async () => {
-      try {
-        const response = await axios.get(`${API}/settings`);
-        setSettings(response.data);
-      } catch (error) {
-        console.error('Failed to fetch settings:', error);
-      }
-    };
-    fetchSettings();
-  }, []);
+  const settings = useSettings();
 
   return (
     <footer className="bg-gradient-to-br from-[#005BBB] via-[#0066CC] to-[#005BBB] text-white relative overflow-hidden" data-testid="main-footer">
@@ -1,15 +1,13 @@
 import React, { useState, useEffect } from 'react';
 import { Link, useLocation } from 'react-router-dom';
 import { Menu, X } from 'lucide-react';
-import axios from 'axios';
-
-const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
-const API = `${BACKEND_URL}/api`;
+import { imageVariant } from '@/lib/images';
+import { useSettings } from '../contexts/SettingsContext';
 
 const Navbar = () => {
   const [isOpen, setIsOpen] = useState(false);
   const [scrolled, setScrolled] = useState(false);
-  const [settings, setSettings] = useState({});
+  const settings = useSettings();
   const location = useLocation();
 
   useEffect(() => {
@@ -20,18 +18,6 @@ const Navbar = () => {
     return () => window.removeEventListener('scroll', handleScroll);
   }, []);
 
-  useEffect(() => {
-    const fetchSettings = async () => {
-      try {
-        const response = await axios.get(`${API}/settings`);
-        setSettings(response.data);
-      } catch (error) {
-        console.error('Failed to fetch settings:', error);
-      }
-    };
-    fetchSettings();
-  }, []);
-
   const navLinks = [
     { path: '/', label: 'Главная' },
     { path: '/news', label: 'Новости' },
@@ -57,7 +43,7 @@ const Navbar = () => {
           <Link to="/" className="flex items-center space-x-3 hover-glow" data-testid="navbar-logo">
             {settings.logo_url ? (
               <img
-                src={settings.logo_url}
+                src={imageVariant(settings.logo_url, 'thumb')}
                 alt="ФК Александрия"
                 className="h-14 w-14 object-contain transition-transform duration-300 hover:scale-110"
               />
@@ -53,6 +53,11 @@ export const AuthProvider = ({ children }) => {
   };
 
   const logout = () => {
+    if (token) {
+      axios.post(`${API}/auth/logout`, {}, {
+        headers: { Authorization: `Bearer ${token}` }
+      }).catch((error) => console.error('Logout failed:', error));
+    }
     localStorage.removeItem('token');
     setToken(null);
     setUser(null);
@@ -0,0 +1,53 @@
+import React, { createContext, useContext, useState, useEffect, useRef, useCallback } from 'react';
+import axios from 'axios';
+
+const SettingsContext = createContext();
+
+const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
+const API = `${BACKEND_URL}/api`;
+
+export const SettingsProvider = ({ children }) => {
+  const [settings, setSettings] = useState(null);
+  const request = useRef(null);
+
+  // Navbar and Footer share one /settings request
+  const loadSettings = useCallback(() => {
+    if (request.current) return;
+    request.current = axios.get(`${API}/settings`)
+      .then((response) => setSettings(response.data))
+      .catch((error) => {
+        console.error('Failed to fetch settings:', error);
+        request.current = null;
+      });
+  }, []);
+
+  // Pages that already received the settings document (e.g. from /home) hand it over instead
+  const provideSettings = useCallback((data) => {
+    if (!data) return;
+    request.current = request.current || Promise.resolve();
+    setSettings(data);
+  }, []);
+
+  const value = { settings, loadSettings, provideSettings };
+
+  return <SettingsContext.Provider value={value}>{children}</SettingsContext.Provider>;
+};
+
+export const useSettingsContext = () => {
+  const context = useContext(SettingsContext);
+  if (!context) {
+    throw new Error('useSettings must be used within a SettingsProvider');
+  }
+  return context;
+};
+
+// Site settings, fetched on first use unless a page already provided them
+export const useSettings = () => {
+  const { settings, loadSettings } = useSettingsContext();
+
+  useEffect(() => {
+    if (!settings) loadSettings();
+  }, [settings, loadSettings]);
+
+  return settings || {};
+};
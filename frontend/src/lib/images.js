@@ -0,0 +1,22 @@
+import axios from 'axios';
+
+const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
+const API = `${BACKEND_URL}/api`;
+
+// Uploaded images are served as /api/images/<sha256>/<variant>.<format>
+const UPLOADED_IMAGE = /(\/api\/images\/[0-9a-f]{64}\/)(thumb|card|full)(\.(?:webp|jpg))$/;
+
+// Same image at the size a slot needs (thumb 160px, card 640px, full 1600px); external URLs are returned unchanged
+export function imageVariant(url, variant) {
+  return url ? url.replace(UPLOADED_IMAGE, `$1${variant}$3`) : url;
+}
+
+// Upload a file and return the URL of its full-size WebP derivative
+export async function uploadImage(file, token) {
+  const body = new FormData();
+  body.append('file', file);
+  const response = await axios.post(`${API}/images`, body, {
+    headers: { Authorization: `Bearer ${token}` }
+  });
+  return `${BACKEND_URL}${response.data.urls.full.webp}`;
+}
@@ -6,38 +6,28 @@ import Footer from '../components/Footer';
 import { Calendar, Trophy, ArrowRight, Clock } from 'lucide-react';
 import { format, parseISO, differenceInDays, differenceInHours, differenceInMinutes } from 'date-fns';
 import { ru } from 'date-fns/locale';
+import { imageVariant } from '@/lib/images';
+import { useSettingsContext } from '../contexts/SettingsContext';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
 
 const HomePage = () => {
   const [news, setNews] = useState([]);
-  const [matches, setMatches] = useState([]);
   const [loading, setLoading] = useState(true);
   const [nextMatch, setNextMatch] = useState(null);
   const [lastMatch, setLastMatch] = useState(null);
+  const { provideSettings } = useSettingsContext();
 
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [newsRes, matchesRes] = await Promise.all([
-          axios.get(`${API}/news`),
-          axios.get(`${API}/matches`)
-        ]);
-        setNews(newsRes.data.slice(0, 3));
-        setMatches(matchesRes.data);
-        
-        // Find next and last match
-        const now = new Date();
-        const scheduled = matchesRes.data.filter(m => m.status === 'scheduled');
-        const finished = matchesRes.data.filter(m => m.status === 'finished');
-        
-        if (scheduled.length > 0) {
-          setNextMatch(scheduled[0]);
-        }
-        if (finished.length > 0) {
-          setLastMatch(finished[0]);
-        }
+        const response = await axios.get(`${API}/home`);
+        setNews(response.data.news);
+        setNextMatch(response.data.next_match);
+        setLastMatch(response.data.last_match);
+        // Navbar and Footer mount after loading and reuse these instead of calling /settings
+        provideSettings(response.data.settings);
       } catch (error) {
         console.error('Failed to fetch data:', error);
       } finally {
@@ -45,7 +35,7 @@ const HomePage = () => {
       }
     };
     fetchData();
-  }, []);
+  }, [provideSettings]);
 
   const getTimeUntilMatch = (date, time) => {
     try {
@@ -156,10 +146,10 @@ const HomePage = () => {
               <div className="flex flex-col md:flex-row items-center justify-around gap-8 mb-8">
                 <div className="text-center flex-1">
                   {nextMatch.home_team_logo && nextMatch.is_home && (
-                    <img src={nextMatch.home_team_logo} alt="Home Team" className="w-24 h-24 object-contain mx-auto mb-3" />
+                    <img src={imageVariant(nextMatch.home_team_logo, 'thumb')} alt="Home Team" className="w-24 h-24 object-contain mx-auto mb-3" />
                   )}
                   {nextMatch.away_team_logo && !nextMatch.is_home && (
-                    <img src={nextMatch.away_team_logo} alt="Away Team" className="w-24 h-24 object-contain mx-auto mb-3" />
+                    <img src={imageVariant(nextMatch.away_team_logo, 'thumb')} alt="Away Team" className="w-24 h-24 object-contain mx-auto mb-3" />
                   )}
                   <h3 className="text-3xl font-bold text-gray-800 mb-2">
                     {nextMatch.is_home ? 'ФК Александрия' : nextMatch.opponent}
@@ -177,10 +167,10 @@ const HomePage = () => {
                 
                 <div className="text-center flex-1">
                   {nextMatch.away_team_logo && nextMatch.is_home && (
-                    <img src={nextMatch.away_team_logo} alt="Away Team" className="w-24 h-24 object-contain mx-auto mb-3" />
+                    <img src={imageVariant(nextMatch.away_team_logo, 'thumb')} alt="Away Team" className="w-24 h-24 object-contain mx-auto mb-3" />
                   )}
                   {nextMatch.home_team_logo && !nextMatch.is_home && (
-                    <img src={nextMatch.home_team_logo} alt="Home Team" className="w-24 h-24 object-contain mx-auto mb-3" />
+                    <img src={imageVariant(nextMatch.home_team_logo, 'thumb')} alt="Home Team" className="w-24 h-24 object-contain mx-auto mb-3" />
                   )}
                   <h3 className="text-3xl font-bold text-gray-800 mb-2">
                     {nextMatch.is_home ? nextMatch.opponent : 'ФК Александрия'}
@@ -234,7 +224,7 @@ const HomePage = () => {
               >
                 {item.image_url && (
                   <img
-                    src={item.image_url}
+                    src={imageVariant(item.image_url, 'card')}
                     alt={item.title}
                     className="w-full h-56 object-cover"
                   />
@@ -246,7 +236,7 @@ const HomePage = () => {
                   <h3 className="text-xl font-bold text-gray-800 mb-3 line-clamp-2">
                     {item.title}
                   </h3>
-                  <p className="text-gray-600 text-sm line-clamp-3 mb-4">{item.content}</p>
+                  <p className="text-gray-600 text-sm line-clamp-3 mb-4">{item.excerpt}</p>
                   <div className="flex items-center justify-between">
                     <span className="text-sm text-gray-500">
                       {format(new Date(item.created_at), 'd MMMM yyyy', { locale: ru })}
@@ -4,6 +4,7 @@ import Navbar from '../components/Navbar';
 import Footer from '../components/Footer';
 import { Button } from '@/components/ui/button';
 import { Calendar, MapPin, Tv } from 'lucide-react';
+import { imageVariant } from '@/lib/images';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
@@ -107,10 +108,10 @@ const MatchesPage = () => {
                     <div className="flex items-center justify-between mb-3">
                       <div className="flex flex-col items-center flex-1">
                         {match.home_team_logo && match.is_home && (
-                          <img src={match.home_team_logo} alt="Home Team" className="w-16 h-16 object-contain mb-2" />
+                          <img src={imageVariant(match.home_team_logo, 'thumb')} alt="Home Team" className="w-16 h-16 object-contain mb-2" />
                         )}
                         {match.away_team_logo && !match.is_home && (
-                          <img src={match.away_team_logo} alt="Away Team" className="w-16 h-16 object-contain mb-2" />
+                          <img src={imageVariant(match.away_team_logo, 'thumb')} alt="Away Team" className="w-16 h-16 object-contain mb-2" />
                         )}
                         <div className="text-xl font-bold text-gray-800">
                           {match.is_home ? 'Александрия' : match.opponent}
@@ -129,10 +130,10 @@ const MatchesPage = () => {
                       </div>
                       <div className="flex flex-col items-center flex-1">
                         {match.away_team_logo && match.is_home && (
-                          <img src={match.away_team_logo} alt="Away Team" className="w-16 h-16 object-contain mb-2" />
+                          <img src={imageVariant(match.away_team_logo, 'thumb')} alt="Away Team" className="w-16 h-16 object-contain mb-2" />
                         )}
                         {match.home_team_logo && !match.is_home && (
-                          <img src={match.home_team_logo} alt="Home Team" className="w-16 h-16 object-contain mb-2" />
+                          <img src={imageVariant(match.home_team_logo, 'thumb')} alt="Home Team" className="w-16 h-16 object-contain mb-2" />
                         )}
                         <div className="text-xl font-bold text-gray-800">
                           {match.is_home ? match.opponent : 'Александрия'}
@@ -6,6 +6,7 @@ import Footer from '../components/Footer';
 import { format } from 'date-fns';
 import { ru } from 'date-fns/locale';
 import { ArrowLeft } from 'lucide-react';
+import { imageVariant } from '@/lib/images';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
@@ -19,17 +20,13 @@ const NewsDetailPage = () => {
   useEffect(() => {
     const fetchNews = async () => {
       try {
-        const [newsRes, allNewsRes] = await Promise.all([
+        const [newsRes, relatedRes] = await Promise.all([
           axios.get(`${API}/news/${id}`),
-          axios.get(`${API}/news`)
+          axios.get(`${API}/news/${id}/related`, { params: { limit: 3 } })
         ]);
         setNews(newsRes.data);
-        
-        // Get related news (same category, different id)
-        const related = allNewsRes.data
-          .filter(n => n.category === newsRes.data.category && n.id !== id)
-          .slice(0, 3);
-        setRelatedNews(related);
+        // Related news ranked by the server (shared tags, then same category)
+        setRelatedNews(relatedRes.data);
       } catch (error) {
         console.error('Failed to fetch news:', error);
       } finally {
@@ -135,7 +132,7 @@ const NewsDetailPage = () => {
                   >
                     {item.image_url && (
                       <img
-                        src={item.image_url}
+                        src={imageVariant(item.image_url, 'card')}
                         alt={item.title}
                         className="w-full h-40 object-cover"
                       />
@@ -6,9 +6,11 @@ import Footer from '../components/Footer';
 import { format } from 'date-fns';
 import { ru } from 'date-fns/locale';
 import { Button } from '@/components/ui/button';
+import { imageVariant } from '@/lib/images';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
+const NEWS_CARD_FIELDS = 'title,category,image_url,created_at,excerpt';
 
 const NewsPage = () => {
   const [news, setNews] = useState([]);
@@ -18,8 +20,11 @@ const NewsPage = () => {
   useEffect(() => {
     const fetchNews = async () => {
       try {
-        const url = selectedCategory === 'all' ? `${API}/news` : `${API}/news?category=${selectedCategory}`;
-        const response = await axios.get(url);
+        const params = { fields: NEWS_CARD_FIELDS };
+        if (selectedCategory !== 'all') {
+          params.category = selectedCategory;
+        }
+        const response = await axios.get(`${API}/news`, { params });
         setNews(response.data);
       } catch (error) {
         console.error('Failed to fetch news:', error);
@@ -81,7 +86,7 @@ const NewsPage = () => {
               >
                 {item.image_url && (
                   <img
-                    src={item.image_url}
+                    src={imageVariant(item.image_url, 'card')}
                     alt={item.title}
                     className="w-full h-56 object-cover"
                   />
@@ -93,7 +98,7 @@ const NewsPage = () => {
                   <h3 className="text-xl font-bold text-gray-800 mb-3 line-clamp-2">
                     {item.title}
                   </h3>
-                  <p className="text-gray-600 text-sm line-clamp-3 mb-4">{item.content}</p>
+                  <p className="text-gray-600 text-sm line-clamp-3 mb-4">{item.excerpt}</p>
                   <div className="flex items-center justify-between">
                     <span className="text-sm text-gray-500">
                       {format(new Date(item.created_at), 'd MMMM yyyy', { locale: ru })}
@@ -5,6 +5,7 @@ import Navbar from '../components/Navbar';
 import Footer from '../components/Footer';
 import { Button } from '@/components/ui/button';
 import { User } from 'lucide-react';
+import { imageVariant } from '@/lib/images';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
@@ -90,7 +91,7 @@ const TeamPage = () => {
                 <div className="relative">
                   {player.photo_url ? (
                     <img
-                      src={player.photo_url}
+                      src={imageVariant(player.photo_url, 'card')}
                       alt={player.name}
                       className="w-full h-64 object-cover"
                     />
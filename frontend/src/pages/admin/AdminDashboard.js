@@ -18,15 +18,14 @@ const AdminDashboard = () => {
   useEffect(() => {
     const fetchStats = async () => {
       try {
-        const [newsRes, playersRes, matchesRes] = await Promise.all([
-          axios.get(`${API}/news`),
-          axios.get(`${API}/players`),
-          axios.get(`${API}/matches`)
-        ]);
+        const token = localStorage.getItem('token');
+        const response = await axios.get(`${API}/admin/stats`, {
+          headers: { Authorization: `Bearer ${token}` }
+        });
         setStats({
-          news: newsRes.data.length,
-          players: playersRes.data.length,
-          matches: matchesRes.data.length
+          news: response.data.news_total,
+          players: response.data.players_total,
+          matches: response.data.matches_total
         });
       } catch (error) {
         console.error('Failed to fetch stats:', error);
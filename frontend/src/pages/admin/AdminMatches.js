@@ -9,6 +9,7 @@ import { Checkbox } from '@/components/ui/checkbox';
 import { toast } from 'sonner';
 import { Plus, Edit, Trash2 } from 'lucide-react';
 import { useAuth } from '../../contexts/AuthContext';
+import { uploadImage } from '@/lib/images';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
@@ -18,6 +19,7 @@ const AdminMatches = () => {
   const [loading, setLoading] = useState(true);
   const [isOpen, setIsOpen] = useState(false);
   const [editingMatch, setEditingMatch] = useState(null);
+  const [suggestions, setSuggestions] = useState({ opponent: [], tournament: [] });
   const { token } = useAuth();
   const [formData, setFormData] = useState({
     date: '',
@@ -50,6 +52,24 @@ const AdminMatches = () => {
     }
   };
 
+  const fetchSuggestions = async (type, prefix) => {
+    if (!prefix.trim()) {
+      setSuggestions((prev) => ({ ...prev, [type]: [] }));
+      return;
+    }
+    try {
+      const response = await axios.get(`${API}/autocomplete`, { params: { type, prefix } });
+      setSuggestions((prev) => ({ ...prev, [type]: response.data }));
+    } catch (error) {
+      console.error('Failed to fetch suggestions:', error);
+    }
+  };
+
+  const handleSuggestedChange = (field) => (e) => {
+    setFormData({ ...formData, [field]: e.target.value });
+    fetchSuggestions(field, e.target.value);
+  };
+
   const handleSubmit = async (e) => {
     e.preventDefault();
     try {
@@ -61,7 +81,7 @@ const AdminMatches = () => {
 
       if (editingMatch) {
         await axios.put(`${API}/matches/${editingMatch.id}`, data, {
-          headers: { Authorization: `Bearer ${token}` }
+          headers: { Authorization: `Bearer ${token}`, 'If-Match': `"${editingMatch.version || 1}"` }
         });
         toast.success('Матч обновлен!');
       } else {
@@ -80,6 +100,19 @@ const AdminMatches = () => {
     }
   };
 
+  const handleImageUpload = (field) => async (e) => {
+    const file = e.target.files[0];
+    if (!file) return;
+    try {
+      const url = await uploadImage(file, token);
+      setFormData((current) => ({ ...current, [field]: url }));
+      toast.success('Изображение загружено');
+    } catch (error) {
+      console.error('Failed to upload image:', error);
+      toast.error('Ошибка загрузки изображения');
+    }
+  };
+
   const handleDelete = async (id) => {
     if (!window.confirm('Вы уверены, что хотите удалить этот матч?')) return;
     
@@ -190,20 +223,30 @@ const AdminMatches = () => {
                   <label className="block text-sm font-medium mb-2">Соперник</label>
                   <Input
                     value={formData.opponent}
-                    onChange={(e) => setFormData({ ...formData, opponent: e.target.value })}
+                    onChange={handleSuggestedChange('opponent')}
                     required
+                    list="opponent-suggestions"
+                    autoComplete="off"
                     data-testid="match-opponent-input"
                   />
+                  <datalist id="opponent-suggestions">
+                    {suggestions.opponent.map((value) => <option key={value} value={value} />)}
+                  </datalist>
                 </div>
                 <div>
                   <label className="block text-sm font-medium mb-2">Турнир</label>
                   <Input
                     value={formData.tournament}
-                    onChange={(e) => setFormData({ ...formData, tournament: e.target.value })}
+                    onChange={handleSuggestedChange('tournament')}
                     required
+                    list="tournament-suggestions"
+                    autoComplete="off"
                     placeholder="Первая лига, Кубок России"
                     data-testid="match-tournament-input"
                   />
+                  <datalist id="tournament-suggestions">
+                    {suggestions.tournament.map((value) => <option key={value} value={value} />)}
+                  </datalist>
                 </div>
                 <div>
                   <label className="block text-sm font-medium mb-2">Статус</label>
@@ -262,6 +305,13 @@ const AdminMatches = () => {
                       placeholder="https://..."
                       data-testid="match-home-logo-input"
                     />
+                    <Input
+                      type="file"
+                      accept="image/jpeg,image/png,image/webp,image/gif"
+                      onChange={handleImageUpload('home_team_logo')}
+                      className="mt-2"
+                      data-testid="match-home-logo-upload"
+                    />
                   </div>
                   <div>
                     <label className="block text-sm font-medium mb-2">Логотип гостевой команды (URL)</label>
@@ -271,6 +321,13 @@ const AdminMatches = () => {
                       placeholder="https://..."
                       data-testid="match-away-logo-input"
                     />
+                    <Input
+                      type="file"
+                      accept="image/jpeg,image/png,image/webp,image/gif"
+                      onChange={handleImageUpload('away_team_logo')}
+                      className="mt-2"
+                      data-testid="match-away-logo-upload"
+                    />
                   </div>
                 </div>
                 <div>
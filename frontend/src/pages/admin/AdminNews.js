@@ -11,6 +11,7 @@ import { Plus, Edit, Trash2 } from 'lucide-react';
 import { useAuth } from '../../contexts/AuthContext';
 import { format } from 'date-fns';
 import { ru } from 'date-fns/locale';
+import { imageVariant, uploadImage } from '@/lib/images';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
@@ -49,7 +50,7 @@ const AdminNews = () => {
     try {
       if (editingNews) {
         await axios.put(`${API}/news/${editingNews.id}`, formData, {
-          headers: { Authorization: `Bearer ${token}` }
+          headers: { Authorization: `Bearer ${token}`, 'If-Match': `"${editingNews.version || 1}"` }
         });
         toast.success('Новость обновлена!');
       } else {
@@ -68,6 +69,19 @@ const AdminNews = () => {
     }
   };
 
+  const handleImageUpload = async (e) => {
+    const file = e.target.files[0];
+    if (!file) return;
+    try {
+      const url = await uploadImage(file, token);
+      setFormData((current) => ({ ...current, image_url: url }));
+      toast.success('Изображение загружено');
+    } catch (error) {
+      console.error('Failed to upload image:', error);
+      toast.error('Ошибка загрузки изображения');
+    }
+  };
+
   const handleDelete = async (id) => {
     if (!window.confirm('Вы уверены, что хотите удалить эту новость?')) return;
     
@@ -176,6 +190,13 @@ const AdminNews = () => {
                     placeholder="https://example.com/image.jpg"
                     data-testid="news-image-input"
                   />
+                  <Input
+                    type="file"
+                    accept="image/jpeg,image/png,image/webp,image/gif"
+                    onChange={handleImageUpload}
+                    className="mt-2"
+                    data-testid="news-image-upload"
+                  />
                 </div>
                 <Button type="submit" data-testid="news-submit-button" className="w-full bg-[#005BBB] hover:bg-[#0066CC]">
                   {editingNews ? 'Обновить' : 'Создать'}
@@ -189,7 +210,7 @@ const AdminNews = () => {
           {news.map((item) => (
             <div key={item.id} data-testid={`news-item-${item.id}`} className="bg-white rounded-lg shadow-md overflow-hidden">
               {item.image_url && (
-                <img src={item.image_url} alt={item.title} className="w-full h-48 object-cover" />
+                <img src={imageVariant(item.image_url, 'card')} alt={item.title} className="w-full h-48 object-cover" />
               )}
               <div className="p-6">
                 <div className="flex items-start justify-between mb-2">
@@ -9,6 +9,7 @@ import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@
 import { toast } from 'sonner';
 import { Plus, Edit, Trash2 } from 'lucide-react';
 import { useAuth } from '../../contexts/AuthContext';
+import { uploadImage } from '@/lib/images';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
@@ -57,7 +58,7 @@ const AdminPlayers = () => {
 
       if (editingPlayer) {
         await axios.put(`${API}/players/${editingPlayer.id}`, data, {
-          headers: { Authorization: `Bearer ${token}` }
+          headers: { Authorization: `Bearer ${token}`, 'If-Match': `"${editingPlayer.version || 1}"` }
         });
         toast.success('Игрок обновлен!');
       } else {
@@ -76,6 +77,19 @@ const AdminPlayers = () => {
     }
   };
 
+  const handleImageUpload = async (e) => {
+    const file = e.target.files[0];
+    if (!file) return;
+    try {
+      const url = await uploadImage(file, token);
+      setFormData((current) => ({ ...current, photo_url: url }));
+      toast.success('Изображение загружено');
+    } catch (error) {
+      console.error('Failed to upload image:', error);
+      toast.error('Ошибка загрузки изображения');
+    }
+  };
+
   const handleDelete = async (id) => {
     if (!window.confirm('Вы уверены, что хотите удалить этого игрока?')) return;
     
@@ -211,6 +225,13 @@ const AdminPlayers = () => {
                     placeholder="https://example.com/photo.jpg"
                     data-testid="player-photo-input"
                   />
+                  <Input
+                    type="file"
+                    accept="image/jpeg,image/png,image/webp,image/gif"
+                    onChange={handleImageUpload}
+                    className="mt-2"
+                    data-testid="player-image-upload"
+                  />
                 </div>
                 <div>
                   <label className="block text-sm font-medium mb-2">Биография</label>
@@ -7,6 +7,8 @@ import { Textarea } from '@/components/ui/textarea';
 import { toast } from 'sonner';
 import { Save, Image as ImageIcon } from 'lucide-react';
 import { useAuth } from '../../contexts/AuthContext';
+import { useSettingsContext } from '../../contexts/SettingsContext';
+import { uploadImage } from '@/lib/images';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
@@ -15,6 +17,7 @@ const AdminSettings = () => {
   const [loading, setLoading] = useState(true);
   const [saving, setSaving] = useState(false);
   const { token } = useAuth();
+  const { provideSettings } = useSettingsContext();
   const [formData, setFormData] = useState({
     logo_url: '',
     stadium_name: '',
@@ -51,9 +54,11 @@ const AdminSettings = () => {
     e.preventDefault();
     setSaving(true);
     try {
-      await axios.put(`${API}/settings`, formData, {
+      const response = await axios.put(`${API}/settings`, formData, {
         headers: { Authorization: `Bearer ${token}` }
       });
+      // Navbar and Footer show the saved values without a reload
+      provideSettings(response.data);
       toast.success('Настройки сохранены!');
     } catch (error) {
       console.error('Failed to save settings:', error);
@@ -63,6 +68,19 @@ const AdminSettings = () => {
     }
   };
 
+  const handleImageUpload = async (e) => {
+    const file = e.target.files[0];
+    if (!file) return;
+    try {
+      const url = await uploadImage(file, token);
+      setFormData((current) => ({ ...current, logo_url: url }));
+      toast.success('Изображение загружено');
+    } catch (error) {
+      console.error('Failed to upload image:', error);
+      toast.error('Ошибка загрузки изображения');
+    }
+  };
+
   if (loading) {
     return (
       <AdminLayout>
@@ -95,8 +113,15 @@ const AdminSettings = () => {
                 placeholder="https://example.com/logo.png или /path/to/logo.png"
                 data-testid="settings-logo-input"
               />
+              <Input
+                type="file"
+                accept="image/jpeg,image/png,image/webp,image/gif"
+                onChange={handleImageUpload}
+                className="mt-2"
+                data-testid="settings-logo-upload"
+              />
               <p className="text-sm text-gray-500 mt-2">
-                Вставьте полный URL или путь к файлу логотипа. Например: https://customer-assets.emergentagent.com/...
+                Загрузите файл или вставьте полный URL или путь к файлу логотипа. Например: https://customer-assets.emergentagent.com/...
               </p>
             </div>
             {formData.logo_url && (
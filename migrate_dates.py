@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Convert ISO-string timestamps to native BSON dates.
+
+Only documents whose fields are still strings are selected, so the
+migration can be interrupted and re-run until nothing is left to convert.
+"""
+import argparse
+import asyncio
+import os
+from datetime import datetime, timezone
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+# collection -> timestamp fields written as isoformat() strings by older versions
+DATE_FIELDS = {
+    "users": ["created_at"],
+    "news": ["created_at", "updated_at"],
+    "players": ["created_at"],
+    "matches": ["created_at"],
+    "contact_messages": ["created_at"],
+    "standings": ["last_updated"],
+    "collection_versions": ["last_modified"],
+}
+
+def parse_timestamp(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+async def migrate_collection(db, name: str, fields: list, batch_size: int, dry_run: bool) -> int:
+    collection = db[name]
+    query = {"$or": [{field: {"$type": "string"}} for field in fields]}
+    projection = {field: 1 for field in fields}
+    converted = 0
+    last_id = None
+
+    while True:
+        batch_query = {"$and": [query, {"_id": {"$gt": last_id}}]} if last_id is not None else query
+        docs = await collection.find(batch_query, projection).sort("_id", 1).limit(batch_size).to_list(batch_size)
+        if not docs:
+            break
+        last_id = docs[-1]["_id"]
+
+        operations = []
+        for doc in docs:
+            update = {}
+            for field in fields:
+                value = doc.get(field)
+                if isinstance(value, str):
+                    try:
+                        update[field] = parse_timestamp(value)
+                    except ValueError:
+                        print(f"  ⚠️  {name} {doc['_id']}: cannot parse {field}={value!r}, skipped")
+            if update:
+                operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": update}))
+
+        if operations and not dry_run:
+            await collection.bulk_write(operations, ordered=False)
+        converted += len(operations)
+        print(f"  {name}: {converted} documents {'to convert' if dry_run else 'converted'}")
+
+    return converted
+
+async def migrate_dates(batch_size: int, dry_run: bool):
+    # Get MongoDB connection
+    mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+    db_name = os.environ.get('DB_NAME', 'football_club_db')
+
+    client = AsyncIOMotorClient(mongo_url)
+    db = client[db_name]
+
+    total = 0
+    for name, fields in DATE_FIELDS.items():
+        print(f"Migrating {name} ({', '.join(fields)})")
+        total += await migrate_collection(db, name, fields, batch_size, dry_run)
+
+    if dry_run:
+        print(f"\n🔎 Dry run: {total} documents would be converted")
+    else:
+        print(f"\n✅ Migration finished: {total} documents converted")
+
+    client.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true", help="report what would change without writing")
+    args = parser.parse_args()
+    asyncio.run(migrate_dates(args.batch_size, args.dry_run))
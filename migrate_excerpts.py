@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Backfill the stored excerpt of news written before excerpts existed.
+
+The excerpt comes from the same make_excerpt the API uses on write. Only
+documents without one are selected, so the migration can be interrupted
+and re-run until nothing is left to fill.
+"""
+import argparse
+import asyncio
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'football_club_db')
+sys.path.insert(0, str(Path(__file__).resolve().parent / "backend"))
+from server import make_excerpt  # noqa: E402
+
+async def backfill_excerpts(db, batch_size: int, dry_run: bool) -> int:
+    query = {"excerpt": None}
+    filled = 0
+    last_id = None
+
+    while True:
+        batch_query = {**query, "_id": {"$gt": last_id}} if last_id is not None else query
+        docs = await db.news.find(batch_query, {"content": 1}).sort("_id", 1).limit(batch_size).to_list(batch_size)
+        if not docs:
+            break
+        last_id = docs[-1]["_id"]
+
+        operations = [
+            UpdateOne({"_id": doc["_id"], "excerpt": None}, {"$set": {"excerpt": make_excerpt(doc.get("content") or "")}})
+            for doc in docs
+        ]
+        if not dry_run:
+            await db.news.bulk_write(operations, ordered=False)
+        filled += len(operations)
+        print(f"  news: {filled} excerpts {'to fill' if dry_run else 'filled'}")
+
+    return filled
+
+async def migrate_excerpts(batch_size: int, dry_run: bool):
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+    db = client[os.environ['DB_NAME']]
+
+    print("Backfilling news excerpts")
+    total = await backfill_excerpts(db, batch_size, dry_run)
+
+    if dry_run:
+        print(f"\n🔎 Dry run: {total} excerpts would be filled")
+    else:
+        if total:
+            # Cached news lists on running workers were built without these excerpts
+            await db.collection_versions.update_one(
+                {"id": "news"},
+                {"$inc": {"version": 1}, "$set": {"last_modified": datetime.now(timezone.utc)}},
+                upsert=True,
+            )
+        print(f"\n✅ Migration finished: {total} excerpts filled")
+
+    client.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true", help="report what would change without writing")
+    args = parser.parse_args()
+    asyncio.run(migrate_excerpts(args.batch_size, args.dry_run))
@@ -0,0 +1,33 @@
+import server
+
+
+def test_prefix_of_any_word():
+    trie = server.PrefixTrie()
+    for value in ["Иван Петров", "Пётр Иванов", "Сергей Сидоров"]:
+        trie.add(value)
+    assert trie.complete("ив", 10) == ["Иван Петров", "Пётр Иванов"]
+    assert trie.complete("петр", 10) == ["Иван Петров", "Пётр Иванов"]
+    assert trie.complete("сидоров", 10) == ["Сергей Сидоров"]
+    assert trie.complete("x", 10) == []
+
+
+def test_case_variants_are_one_suggestion():
+    trie = server.PrefixTrie()
+    for value in ["иван петров", "Иван Петров", "Иван Петров", "Иван  Сидоров"]:
+        trie.add(value)
+    assert trie.complete("иван", 10) == ["Иван Петров", "Иван  Сидоров"]
+    trie.remove("Иван Петров")
+    trie.remove("Иван Петров")
+    assert trie.complete("иван", 10) == ["Иван  Сидоров", "иван петров"]
+
+
+def test_index_apply_replaces_values():
+    index = server.AutocompleteIndex("matches", {"opponent": "opponent", "tournament": "tournament"})
+    index.apply("m1", {"opponent": "Ротор", "tournament": "Кубок"})
+    index.apply("m2", {"opponent": "ротор", "tournament": "Первая лига"})
+    assert index.tries["opponent"].complete("рот", 10) == ["Ротор"]
+    index.apply("m1", {"opponent": "Сокол", "tournament": " "})
+    index.apply("m2", None)
+    assert index.tries["opponent"].complete("рот", 10) == []
+    assert index.tries["opponent"].complete("с", 10) == ["Сокол"]
+    assert index.tries["tournament"].complete("к", 10) == []
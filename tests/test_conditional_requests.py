@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+import server
+
+VALIDATORS = {"ETag": 'W/"news12-matches3"', "Last-Modified": "Wed, 01 Oct 2025 12:00:00 GMT"}
+
+
+def request(**headers) -> Request:
+    return Request({
+        "type": "http", "method": "GET", "path": "/", "query_string": b"",
+        "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+    })
+
+
+@pytest.mark.parametrize("headers, expected", [
+    ({}, False),
+    ({"if_none_match": 'W/"news12-matches3"'}, True),
+    ({"if_none_match": '"news12-matches3"'}, True),
+    ({"if_none_match": 'W/"news11-matches3", W/"news12-matches3"'}, True),
+    ({"if_none_match": 'W/"news11-matches3"'}, False),
+    ({"if_none_match": "*"}, True),
+    # If-None-Match wins over If-Modified-Since
+    ({"if_none_match": 'W/"news11-matches3"', "if_modified_since": "Wed, 01 Oct 2025 12:00:00 GMT"}, False),
+    ({"if_modified_since": "Wed, 01 Oct 2025 12:00:00 GMT"}, True),
+    ({"if_modified_since": "Thu, 02 Oct 2025 08:00:00 GMT"}, True),
+    ({"if_modified_since": "Wed, 01 Oct 2025 11:59:59 GMT"}, False),
+    ({"if_modified_since": "yesterday"}, False),
+])
+def test_is_not_modified(headers, expected):
+    assert server.is_not_modified(request(**headers), VALIDATORS) is expected
+
+
+@pytest.mark.parametrize("if_match, body_version, expected", [
+    (None, None, None),
+    (None, 4, 4),
+    ('"7"', 4, 7),
+    ("*", 4, 4),
+])
+def test_expected_version(if_match, body_version, expected):
+    assert server.expected_version(if_match, body_version) == expected
+
+
+@pytest.mark.parametrize("if_match", ['W/"news12"', '"news12"', 'W/"7"'])
+def test_collection_etag_is_not_a_document_version(if_match):
+    with pytest.raises(HTTPException) as error:
+        server.expected_version(if_match, None)
+    assert error.value.status_code == 412
+
+
+def test_version_filter():
+    assert server.version_filter("n1", None) == {"id": "n1"}
+    assert server.version_filter("n1", 3) == {"id": "n1", "version": 3}
+    # Documents written before versioning have no version field and count as 1
+    assert server.version_filter("n1", 1) == {"id": "n1", "version": {"$in": [1, None]}}
+
+
+class FakeCollection:
+    def __init__(self, ids):
+        self.ids = ids
+
+    async def count_documents(self, query, limit=0):
+        return int(query["id"] in self.ids)
+
+
+@pytest.mark.parametrize("doc_id, expected, status_code", [
+    ("n1", 3, 409),     # still there, moved past the expected version
+    ("gone", 3, 404),   # deleted
+    ("n1", None, 404),  # unconditional write that matched nothing
+])
+def test_write_failure(doc_id, expected, status_code):
+    error = asyncio.run(server.write_failure(FakeCollection({"n1"}), doc_id, expected, "News not found"))
+    assert error.status_code == status_code
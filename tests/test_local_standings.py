@@ -0,0 +1,85 @@
+import pandas as pd
+import pytest
+
+import server
+
+LEAGUE = "Первая лига"
+CUP = "Кубок"
+
+
+def match(match_id: str, opponent: str, home: int, away: int, **fields) -> dict:
+    return {
+        "id": match_id, "date": f"2025-04-{int(match_id[1:]):02d}", "time": "15:00",
+        "opponent": opponent, "tournament": LEAGUE, "home_score": home, "away_score": away,
+        "is_home": True, "status": "finished", **fields,
+    }
+
+
+def rebuilt(matches: dict) -> dict:
+    results = [result for result in map(server.match_result, matches.values()) if result]
+    return server.LocalStandings.build_tables(results)
+
+
+def assert_same_tables(actual: dict, expected: dict):
+    assert sorted(actual) == sorted(expected)
+    for tournament, table in expected.items():
+        pd.testing.assert_frame_equal(
+            actual[tournament].sort_index(), table.sort_index(), check_names=False, check_dtype=False
+        )
+
+
+def test_incremental_updates_match_a_rebuild():
+    standings = server.LocalStandings()
+    matches = {}
+
+    def write(doc_id, doc):
+        if doc is None:
+            matches.pop(doc_id, None)
+        else:
+            matches[doc_id] = doc
+        standings.apply(doc_id, doc)
+        assert_same_tables(standings.tables, rebuilt(matches))
+
+    write("m1", match("m1", "Ротор", 2, 1))
+    write("m2", match("m2", "Сокол", 0, 0))
+    write("m3", match("m3", "Ротор", 1, 3, is_home=False))
+    write("m4", match("m4", "Динамо", None, None, status="scheduled"))
+    write("m4", match("m4", "Динамо", 1, 0, status="live"))         # kick-off
+    write("m4", match("m4", "Динамо", 1, 1, status="finished"))     # score changes
+    write("m2", match("m2", "Сокол", 0, 0, tournament=CUP))         # moved to another tournament
+    write("m1", match("m1", "Ротор", 2, 1, status="postponed"))     # no longer counts
+    write("m3", None)                                               # deleted
+    write("m2", None)                                               # last cup match deleted
+    assert CUP not in standings.tables
+
+    table = standings.table(LEAGUE)
+    assert [team.team for team in table.teams] == [server.CLUB_NAME, "Динамо"]
+    assert table.matches_counted == 1
+
+
+def test_table_tie_breakers():
+    standings = server.LocalStandings()
+    rows = {
+        # games, wins, draws, losses, goals_for, goals_against, points
+        "Ель": [4, 3, 1, 0, 5, 1, 10],    # fewer points than the rest
+        "Дуб": [5, 3, 2, 0, 6, 2, 11],    # ties with Бук on everything, name decides
+        "Бук": [5, 3, 2, 0, 6, 2, 11],
+        "Клён": [5, 3, 2, 0, 8, 4, 11],   # same goal difference, more goals scored
+        "Ива": [5, 3, 2, 0, 7, 1, 11],    # better goal difference
+        "Сосна": [6, 2, 5, 0, 9, 1, 11],  # best goal difference, but fewer wins
+        "Липа": [4, 4, 0, 0, 4, 0, 12],   # most points
+    }
+    standings.tables[LEAGUE] = pd.DataFrame.from_dict(rows, orient="index", columns=server.STAT_COLUMNS)
+    table = standings.table(LEAGUE)
+    assert [team.team for team in table.teams] == ["Липа", "Ива", "Клён", "Бук", "Дуб", "Сосна", "Ель"]
+    assert [team.position for team in table.teams] == list(range(1, 8))
+    assert table.teams[1].goal_difference == 6
+
+
+@pytest.mark.parametrize("fields", [
+    {"status": "scheduled"},
+    {"home_score": None},
+    {"tournament": ""},
+])
+def test_results_that_do_not_count(fields):
+    assert server.match_result(match("m1", "Ротор", 2, 1, **fields)) is None
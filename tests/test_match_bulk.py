@@ -0,0 +1,90 @@
+import asyncio
+
+import orjson
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+import server
+
+LEAGUE = "Первая лига"
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def to_list(self, length):
+        return self.docs
+
+
+class FakeMatches:
+    """Just the lookup bulk_upsert_matches issues before writing"""
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    def find(self, query, projection=None):
+        dates = query["date"]["$in"]
+        return FakeCursor([dict(doc) for doc in self.docs if doc["date"] in dates])
+
+
+class FakeDB:
+    def __init__(self, docs):
+        self.matches = FakeMatches(docs)
+
+
+def upload(body: bytes, content_type: str = "application/json") -> Request:
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+    scope = {
+        "type": "http", "method": "POST", "path": "/api/matches/bulk", "query_string": b"",
+        "headers": [(b"content-type", content_type.encode())],
+    }
+    return Request(scope, receive)
+
+
+def test_csv_empty_cells_are_not_set():
+    body = "\ufeffdate,time,opponent,tournament,home_score,away_score\n2025-05-01,15:00, Ротор ,Первая лига,,\n".encode()
+    assert server.parse_match_rows(body, csv_format=True) == [
+        {"date": "2025-05-01", "time": "15:00", "opponent": "Ротор", "tournament": LEAGUE}
+    ]
+
+
+@pytest.mark.parametrize("body", [b"{not json", b'{"date": "2025-05-01"}'])
+def test_json_upload_must_be_an_array(body):
+    with pytest.raises(HTTPException) as error:
+        server.parse_match_rows(body, csv_format=False)
+    assert error.value.status_code == 400
+
+
+def test_fixture_key_normalises_names():
+    assert server.fixture_key({"date": "2025-05-01", "opponent": " Ёлка  Юниор", "tournament": "ПЕРВАЯ лига"}) == (
+        "2025-05-01", "елка юниор", "первая лига"
+    )
+
+
+def test_dry_run_classifies_rows(monkeypatch):
+    existing = [
+        {"id": "m1", "date": "2025-05-01", "time": "15:00", "opponent": "Ротор", "tournament": LEAGUE, "version": 1},
+        {"id": "m2", "date": "2025-05-08", "time": "15:00", "opponent": "Сокол", "tournament": LEAGUE,
+         "home_score": None, "version": 3},
+    ]
+    monkeypatch.setattr(server, "db", FakeDB(existing))
+    rows = [
+        {"date": "2025-05-01", "time": "15:00", "opponent": "Ротор", "tournament": LEAGUE},
+        # Matched on the normalised key, so a respelled name updates m2 instead of creating a fixture
+        {"date": "2025-05-08", "time": "15:00", "opponent": "СОКОЛ", "tournament": LEAGUE, "home_score": 2},
+        {"date": "2025-05-15", "time": "18:00", "opponent": "Ёлка", "tournament": LEAGUE},
+        {"date": "2025-05-15", "time": "19:00", "opponent": "елка", "tournament": LEAGUE},
+        {"date": "2025-05-22", "opponent": "Динамо", "tournament": LEAGUE},
+    ]
+    body = orjson.dumps(rows)
+    report = asyncio.run(server.bulk_upsert_matches(upload(body), dry_run=True, upload_format=None, current_user="admin"))
+
+    assert [row.action for row in report.rows] == ["unchanged", "update", "create", "error", "error"]
+    assert (report.created, report.updated, report.unchanged, report.failed) == (1, 1, 1, 2)
+    assert [row.id for row in report.rows[:2]] == ["m1", "m2"]
+    assert report.rows[1].changes == {"opponent": {"old": "Сокол", "new": "СОКОЛ"}, "home_score": {"old": None, "new": 2}}
+    assert report.rows[3].error == "Duplicate of row 3"
+    assert report.rows[4].error.startswith("time:")
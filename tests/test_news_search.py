@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import server
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def article(news_id: str, title: str, content: str = "", tags=(), category: str = "club", hours: int = 0) -> dict:
+    return {
+        "id": news_id, "title": title, "content": content, "tags": list(tags),
+        "category": category, "created_at": BASE_TIME + timedelta(hours=hours),
+    }
+
+
+ARTICLES = [
+    article("n1", "Победа в домашнем матче", "Команда уверенно обыграла соперника", ["матч", "победа"], hours=1),
+    article("n2", "Тренировка перед матчем", "Игроки готовятся к матчам сезона", ["тренировка"], hours=2),
+    article("n3", "Новый партнёр клуба", "Подписан договор о партнёрстве", ["партнёры"], category="partners", hours=3),
+    article("n4", "Академия: турнир выигран", "Юноши победили в финальном матче", ["академия", "победа"],
+            category="academy", hours=4),
+    article("n5", "Расписание сезона", "Все матчи сезона и билеты", ["матч"], hours=5),
+]
+
+
+def build(docs) -> server.NewsSearchIndex:
+    index = server.NewsSearchIndex()
+    for doc in docs:
+        index.add(doc)
+    return index
+
+
+def index_state(index: server.NewsSearchIndex) -> tuple:
+    docs = {news_id: {**doc, "terms": sorted(doc["terms"])} for news_id, doc in index.docs.items()}
+    return index.postings, index.lengths, docs, index.tags, index.total_length
+
+
+@pytest.mark.parametrize("word, expected", [
+    ("матчами", "матч"),
+    ("матча", "матч"),
+    ("игроков", "игрок"),
+    ("голы", "гол"),
+    ("мяч", "мяч"),
+    ("goals", "goal"),
+    ("gas", "gas"),
+])
+def test_stem(word, expected):
+    assert server.stem(word) == expected
+
+
+def test_search_terms_drop_stopwords_and_fold_case():
+    assert server.search_terms("Победа в матче и Ёлки, goals!") == ["побед", "матч", "елк", "goal"]
+
+
+def test_title_outranks_content_and_word_forms_match():
+    index = build(ARTICLES)
+    hits = index.search("матчи")
+    ranked = [news_id for _, news_id in hits]
+    assert set(ranked) == {"n1", "n2", "n4", "n5"}
+    # Title and tag matches weigh more than a single content mention
+    assert ranked.index("n1") < ranked.index("n4")
+    assert all(a[0] >= b[0] for a, b in zip(hits, hits[1:]))
+
+
+def test_rarer_terms_score_higher():
+    index = build(ARTICLES)
+    common = dict((news_id, score) for score, news_id in index.search("матч"))
+    both = dict((news_id, score) for score, news_id in index.search("матч уверенно"))
+    assert both["n1"] > common["n1"]
+    assert index.search("уверенно")[0][0] > common["n1"]
+
+
+def test_filters_and_facets():
+    index = build(ARTICLES)
+    assert [news_id for _, news_id in index.search("победа", category="academy")] == ["n4"]
+    assert {news_id for _, news_id in index.search("матч", tag="победа")} == {"n1", "n4"}
+    assert index.search("голевой") == []
+    assert index.search("и в на") == []
+    assert index.facets(["n1", "n4", "n5"]) == {"матч": 2, "победа": 2, "академия": 1}
+
+
+def test_related_prefers_shared_tags_then_category():
+    index = build(ARTICLES)
+    assert index.related("n1", 3) == ["n5", "n4", "n2"]
+    assert index.related("missing", 3) == []
+
+
+def test_incremental_updates_match_a_rebuild():
+    index = build(ARTICLES)
+    docs = {doc["id"]: doc for doc in ARTICLES}
+    changes = [
+        ("n2", article("n2", "Тренировка отменена", "Погода", ["тренировка", "погода"], hours=2)),
+        ("n3", None),
+        ("n6", article("n6", "Кубок: жеребьёвка", "Соперник определён", ["кубок"], hours=6)),
+        ("n1", article("n1", "Победа в гостях", "", [], category="academy", hours=1)),
+    ]
+    for news_id, doc in changes:
+        index.apply(news_id, doc)
+        if doc is None:
+            docs.pop(news_id)
+        else:
+            docs[news_id] = doc
+        assert index_state(index) == index_state(build(docs.values()))
+    assert "партнер" not in index.postings
+
+
+def test_search_page_cursor_walks_ties_in_order():
+    hits = [(2.5, "a"), (1.0, "b"), (1.0, "c"), (1.0, "d"), (0.5, "e")]
+    seen, after = [], None
+    while True:
+        page, after = server.search_page(hits, 2, after)
+        seen.extend(page)
+        if after is None:
+            break
+    assert seen == hits
+
+    page, after = server.search_page(hits, 5, None)
+    assert page == hits and after is None
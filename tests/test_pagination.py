@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+import server
+
+
+def matches(doc: dict, query: dict) -> bool:
+    """The subset of MongoDB query semantics keyset_filter produces"""
+    for field, condition in query.items():
+        if field == "$or":
+            if not any(matches(doc, sub) for sub in condition):
+                return False
+        elif field == "$and":
+            if not all(matches(doc, sub) for sub in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = doc.get(field)
+            for op, operand in condition.items():
+                if op == "$ne" and value == operand:
+                    return False
+                # Comparisons never match null in MongoDB
+                if op == "$gt" and (value is None or not value > operand):
+                    return False
+                if op == "$lt" and (value is None or not value < operand):
+                    return False
+        elif doc.get(field) != condition:
+            return False
+    return True
+
+
+def mongo_order(docs: list, sort_field: str, direction: int) -> list:
+    """Sort like MongoDB: null before any value ascending, after every value descending"""
+    def key(doc):
+        value = doc.get(sort_field)
+        return (value is not None, value if value is not None else 0, doc["id"])
+    return sorted(docs, key=key, reverse=direction == -1)
+
+
+def paginate(docs: list, sort_field: str, direction: int, limit: int) -> list:
+    ordered = mongo_order(docs, sort_field, direction)
+    pages, cursor = [], None
+    while True:
+        remaining = [doc for doc in ordered if cursor is None or matches(doc, server.keyset_filter(sort_field, direction, cursor))]
+        page = remaining[:limit]
+        pages.append([doc["id"] for doc in page])
+        if len(remaining) <= limit:
+            return pages
+        cursor = server.encode_cursor(page[-1], sort_field)
+
+
+PLAYERS = [
+    {"id": f"p{i:02d}", "number": number}
+    for i, number in enumerate([7, None, 10, 7, None, 1, 7, 99, None, 10, 3])
+]
+
+
+@pytest.mark.parametrize("direction", [1, -1])
+@pytest.mark.parametrize("limit", [1, 2, 3, 4, 20])
+def test_pages_cover_ties_and_nulls(direction, limit):
+    pages = paginate(PLAYERS, "number", direction, limit)
+    flat = [doc_id for page in pages for doc_id in page]
+    assert flat == [doc["id"] for doc in mongo_order(PLAYERS, "number", direction)]
+    assert all(len(page) == limit for page in pages[:-1])
+
+
+def test_null_cursor_filters():
+    cursor = server.encode_cursor({"id": "p04", "number": None}, "number")
+    assert server.keyset_filter("number", 1, cursor) == {
+        "$or": [{"number": None, "id": {"$gt": "p04"}}, {"number": {"$ne": None}}]
+    }
+    assert server.keyset_filter("number", -1, cursor) == {"number": None, "id": {"$lt": "p04"}}
+
+
+def test_datetime_cursor_round_trip():
+    created_at = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    cursor = server.encode_cursor({"id": "n1", "created_at": created_at}, "created_at")
+    assert "=" not in cursor
+    assert server.decode_cursor(cursor) == (created_at, "n1")
+
+    news = [{"id": f"n{i}", "created_at": created_at - timedelta(hours=i // 2)} for i in range(7)]
+    flat = [doc_id for page in paginate(news, "created_at", -1, 2) for doc_id in page]
+    assert flat == [doc["id"] for doc in mongo_order(news, "created_at", -1)]
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "eyJ2IjogMX0"])
+def test_invalid_cursor(cursor):
+    with pytest.raises(HTTPException) as error:
+        server.decode_cursor(cursor)
+    assert error.value.status_code == 400
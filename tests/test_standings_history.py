@@ -0,0 +1,179 @@
+import asyncio
+import copy
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+import server
+
+LEAGUE = "first_league"
+DAY_ONE = datetime(2025, 3, 1, 12, tzinfo=timezone.utc)
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, field, direction):
+        self.docs.sort(key=lambda doc: doc[field], reverse=direction == server.DESCENDING)
+        return self
+
+    async def to_list(self, length):
+        return self.docs if length is None else self.docs[:length]
+
+
+class FakeCollection:
+    """Just the queries the standings history code issues"""
+
+    def __init__(self):
+        self.docs = []
+
+    @staticmethod
+    def _matches(doc, query):
+        for field, condition in query.items():
+            if field == "$or":
+                if not any(FakeCollection._matches(doc, sub) for sub in condition):
+                    return False
+            elif field == "teams.team":
+                if condition not in [row["team"] for row in doc.get("teams", [])]:
+                    return False
+            elif isinstance(condition, dict):
+                value = doc.get(field)
+                if "$in" in condition and value not in condition["$in"]:
+                    return False
+                if "$gte" in condition and not value >= condition["$gte"]:
+                    return False
+                if "$lte" in condition and not value <= condition["$lte"]:
+                    return False
+            elif isinstance(doc.get(field), list):
+                if condition not in doc[field]:
+                    return False
+            elif doc.get(field) != condition:
+                return False
+        return True
+
+    @staticmethod
+    def _project(doc, projection):
+        fields = {name: spec for name, spec in (projection or {}).items() if name != "_id"}
+        if not fields:
+            return copy.deepcopy(doc)
+        result = {}
+        for name, spec in fields.items():
+            if isinstance(spec, dict):
+                wanted = spec["$elemMatch"]
+                rows = [row for row in doc.get(name, []) if all(row.get(k) == v for k, v in wanted.items())]
+                if rows:
+                    result[name] = copy.deepcopy(rows[:1])
+            elif name in doc:
+                result[name] = copy.deepcopy(doc[name])
+        return result
+
+    def find(self, query, projection=None):
+        return FakeCursor([self._project(doc, projection) for doc in self.docs if self._matches(doc, query)])
+
+    async def find_one(self, query, projection=None, sort=None):
+        docs = [doc for doc in self.docs if self._matches(doc, query)]
+        for field, direction in reversed(sort or []):
+            docs.sort(key=lambda doc: doc[field], reverse=direction == server.DESCENDING)
+        return self._project(docs[0], projection) if docs else None
+
+
+class FakeDB:
+    def __init__(self):
+        self.standings = FakeCollection()
+        self.standings_history = FakeCollection()
+
+
+@pytest.fixture
+def db(monkeypatch):
+    fake = FakeDB()
+    monkeypatch.setattr(server, "db", fake)
+    monkeypatch.setattr(server, "STANDINGS_KEYFRAME_INTERVAL", 3)
+    return fake
+
+
+def row(position: int, team: str, points: int) -> server.StandingsTeam:
+    return server.StandingsTeam(
+        position=position, team=team, games=10, wins=points // 3, draws=points % 3, losses=0,
+        goals_for=20, goals_against=10, goal_difference=10, points=points,
+    )
+
+
+def record(db, teams: list, taken_at: datetime) -> list:
+    """What parse_standings does with one scraped table"""
+    standings = server.StandingsData(
+        id=server.standings_doc_id(LEAGUE), league=LEAGUE, league_name="ПЕРВАЯ лига", teams=teams
+    )
+    snapshots = asyncio.run(server.build_standings_snapshots({LEAGUE: standings}, taken_at))
+    db.standings_history.docs.extend(snapshot.model_dump() for snapshot in snapshots)
+    db.standings.docs = [standings.model_dump()]
+    return snapshots
+
+
+# One scrape per day; "Гамма" drops out of the table on day 4, which is a keyframe run
+TABLES = [
+    [row(1, "Альфа", 30), row(2, "Бета", 25), row(3, "Гамма", 20)],
+    [row(1, "Альфа", 33), row(2, "Бета", 25), row(3, "Гамма", 20)],
+    [row(1, "Альфа", 33), row(2, "Гамма", 26), row(3, "Бета", 25)],
+    [row(1, "Альфа", 36), row(2, "Бета", 28)],
+    [row(1, "Бета", 31), row(2, "Альфа", 36)],
+]
+
+
+def record_history(db) -> list:
+    return [record(db, teams, DAY_ONE + timedelta(days=i)) for i, teams in enumerate(TABLES)]
+
+
+def test_snapshots_store_deltas_between_keyframes(db):
+    runs = record_history(db)
+    assert [[snapshot.keyframe for snapshot in run] for run in runs] == [[True], [False], [False], [True], [False]]
+    assert [team.team for team in runs[1][0].teams] == ["Альфа"]
+    assert [team.team for team in runs[2][0].teams] == ["Гамма", "Бета"]
+    assert runs[3][0].removed == []
+    assert len(runs[3][0].teams) == 2
+
+    assert record(db, TABLES[-1], DAY_ONE + timedelta(days=10)) == []
+
+
+def test_standings_as_of_rebuilds_each_day(db):
+    record_history(db)
+    for i, teams in enumerate(TABLES):
+        table = asyncio.run(server.standings_as_of(LEAGUE, DAY_ONE + timedelta(days=i, hours=1)))
+        assert table.teams == teams
+    assert asyncio.run(server.standings_as_of(LEAGUE, DAY_ONE - timedelta(days=1))) is None
+
+
+def test_team_trend_agrees_with_standings_as_of(db):
+    record_history(db)
+    start, end = DAY_ONE.date(), DAY_ONE.date() + timedelta(days=6)
+    for team in ("Альфа", "Бета", "Гамма"):
+        trend = asyncio.run(server.team_trend(LEAGUE, team, start, end))
+        for point in trend.points:
+            table = asyncio.run(server.standings_as_of(LEAGUE, server.end_of_day(point.date)))
+            rows = {row.team: row for row in table.teams}
+            assert point.position == (rows[team].position if team in rows else None), (team, point.date)
+
+
+def test_team_trend_after_leaving_on_a_keyframe(db):
+    record_history(db)
+    trend = asyncio.run(server.team_trend(LEAGUE, "Гамма", DAY_ONE.date(), date(2025, 3, 7)))
+    assert [point.position for point in trend.points] == [3, 3, 2, None, None, None, None]
+    assert trend.best_position == 2
+    assert trend.worst_position == 3
+    assert trend.points_gained == 6
+
+
+def test_team_trend_unknown_league(db):
+    record_history(db)
+    assert asyncio.run(server.team_trend("no_such_league", "Альфа", DAY_ONE.date(), date(2025, 3, 7))) is None
+
+
+@pytest.mark.parametrize("start, end", [
+    (date(2025, 3, 7), date(2025, 3, 1)),
+    (date(2024, 1, 1), date(2025, 3, 1)),
+])
+def test_team_trend_rejects_bad_ranges(start, end):
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(server.get_team_trend(LEAGUE, None, None, team="Альфа", start=start, end=end))
+    assert error.value.status_code == 400
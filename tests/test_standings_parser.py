@@ -0,0 +1,73 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import server
+
+FIXTURES = sorted((Path(server.__file__).parent / "fixtures" / "standings").glob("*.html"))
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids=lambda path: path.name)
+def test_engines_agree(fixture):
+    content = fixture.read_bytes()
+    results = {name: engine(content) for name, engine in server.STANDINGS_PARSER_ENGINES.items()}
+    assert results["bs4"], "reference engine found no teams"
+    for name, teams in results.items():
+        assert teams == results["bs4"], name
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids=lambda path: path.name)
+def test_matches_expected_table(fixture):
+    expected_path = fixture.with_suffix(".expected.json")
+    if not expected_path.exists():
+        pytest.skip("no expected output recorded for this snapshot")
+    expected = json.loads(expected_path.read_text(encoding="utf-8"))
+    teams = server.parse_standings_html(fixture.read_bytes())
+    assert [team.model_dump() for team in teams] == expected
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids=lambda path: path.name)
+def test_league_tables(fixture):
+    content = fixture.read_bytes()
+    leagues = server.parse_league_tables(content)
+    assert leagues[server.FIRST_LEAGUE_SLUG].teams == server.parse_standings_html(content)
+    for slug, standings in leagues.items():
+        assert standings.league == slug
+        assert standings.id == server.standings_doc_id(slug)
+        assert standings.teams
+
+
+def test_league_slug():
+    assert server.league_slug("ПЕРВАЯ лига") == "first_league"
+    assert server.league_slug("ВЫСШАЯ лига") == "top_league"
+    assert server.league_slug("Женская лига") == "zhenskaya_liga"
+
+
+def test_league_slug_collisions():
+    taken = {"first_league"}
+    assert server.league_slug("ПЕРВАЯ лига. Группа А", taken) == "pervaya_liga_gruppa_a"
+    taken.add("pervaya_liga")
+    assert server.league_slug("ПЕРВАЯ лига", taken) == "pervaya_liga_2"
+
+
+def test_group_tables_keep_their_own_slugs():
+    rows = "<tr><th>#</th></tr><tr><td>1</td><td>{team}</td>" + "<td>1</td>" * 8 + "</tr>"
+    page = "".join(
+        f"<h3>{label}</h3><table>{rows.format(team=team)}</table>"
+        for label, team in [("ПЕРВАЯ лига. Группа А", "Альфа"), ("ПЕРВАЯ лига. Группа Б", "Бета")]
+    ).encode()
+    leagues = server.parse_league_tables(page)
+    assert list(leagues) == ["first_league", "pervaya_liga_gruppa_b"]
+    assert leagues["pervaya_liga_gruppa_b"].teams[0].team == "Бета"
+
+
+def test_fallback_does_not_reuse_a_labelled_table():
+    rows = "<tr>" + "<th>#</th>" * 9 + "</tr><tr><td>1</td><td>{team}</td>" + "<td>1</td>" * 7 + "</tr>"
+    labelled = f"<h3>ВЫСШАЯ лига</h3><table>{rows.format(team='Топ')}</table>".encode()
+    assert list(server.parse_league_tables(labelled)) == ["top_league"]
+
+    unlabelled = f"<table>{rows.format(team='Топ')}</table>".encode()
+    leagues = server.parse_league_tables(unlabelled)
+    assert list(leagues) == [server.FIRST_LEAGUE_SLUG]
+    assert leagues[server.FIRST_LEAGUE_SLUG].teams[0].team == "Топ"